@@ -0,0 +1,192 @@
+#
+# Local Account and Positions Snapshot
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Optional, Tuple
+
+from .models import AccountModel, PositionModel
+from .hermes_enums import OrderSide
+
+
+class AccountSnapshot:
+
+    """
+        Local copy of an account and its positions, kept current from fill events and reconciled with the exchange periodically.
+
+        Reads are served from memory. Fills update the positions and the cash straight away. Buying power is only ever lowered locally, by the notional of fills that grow a position, so pre-trade checks stay conservative until the next reconciliation takes the exchange's own figure. The remaining account values are refreshed at reconciliation only.
+
+        A fill received while the exchange is being requested may or may not be part of its response, so such a response is discarded and requested again, see `reconcile`. Applying it on top could count the fill twice, replacing the snapshot with it could lose the fill.
+
+        Parameters
+        ----------
+            fetch: Callable[[], Tuple[AccountModel, list[PositionModel]]]
+                Function requesting the account and its positions from the exchange.
+            reconcileInterval: Optional[float]
+                Seconds between two reconciliations. `None` to only reconcile through `reconcile`.
+            onError: Optional[Callable[[Exception], None]]
+                Called with the errors of the periodic reconciliation, which keeps running. The last one is also kept in `lastError`.
+    """
+
+    # Requests made by a reconciliation before it gives up on a response without fills in flight
+    _maxReconcileAttempts: int = 3
+
+    def __init__(
+            self,
+            fetch: Callable[[], Tuple[AccountModel, list[PositionModel]]],
+            reconcileInterval: Optional[float] = 30.0,
+            onError: Optional[Callable[[Exception], None]] = None):
+        self._fetch                 = fetch
+        self._reconcileInterval     = reconcileInterval
+        self._onError               = onError
+        self.lastError              : Optional[Exception] = None
+        self._lock                  = threading.Lock()
+        self._account               : Optional[AccountModel] = None
+        self._positions             : dict[str, PositionModel] = {}
+        # Reconciliations are serialised, the fills received during a request are counted here
+        self._reconcileLock         = threading.Lock()
+        self._fillsInFlight         : Optional[int] = None
+
+        self._stopEvent             = threading.Event()
+        self._thread                : Optional[threading.Thread] = None
+
+    def account(self) -> Optional[AccountModel]:
+        """
+            Returns the current account, `None` before the first reconciliation. The models are replaced rather than modified on updates, so the returned one is never changed afterwards.
+        """
+        return self._account
+
+    def positions(self) -> list[PositionModel]:
+        """
+            Returns all the open positions.
+        """
+        return list(self._positions.values())
+
+    def position(self, symbol: str) -> Optional[PositionModel]:
+        """
+            Returns the position in `symbol`, or `None` if there is none.
+        """
+        return self._positions.get(symbol)
+
+    def reconcile(self) -> bool:
+        """
+            Replaces the snapshot with the account and positions requested from the exchange.
+
+            A response requested while fills were received is discarded, and the request repeated up to `_maxReconcileAttempts` times in total. If every response overlapped a fill, the snapshot is kept as it is, unless it was never reconciled before.
+
+            Returns
+            -------
+                bool
+                    `True` if the snapshot was replaced.
+        """
+        with self._reconcileLock:
+            for attempt in range(self._maxReconcileAttempts):
+                with self._lock:
+                    self._fillsInFlight = 0
+                try:
+                    account, positions = self._fetch()
+                finally:
+                    with self._lock:
+                        fillsInFlight = self._fillsInFlight
+                        self._fillsInFlight = None
+                with self._lock:
+                    if (fillsInFlight == 0) or ((self._account == None) and (attempt == self._maxReconcileAttempts - 1)):
+                        self._account   = account
+                        self._positions = {position.symbol: position for position in positions}
+                        return True
+            return False
+
+    def applyFill(
+            self,
+            symbol: str,
+            side: OrderSide,
+            qty: float,
+            price: float,
+            positionQty: Optional[float] = None,
+            timestamp: Optional[datetime] = None) -> None:
+        """
+            Updates the snapshot with a fill.
+
+            Parameters
+            ----------
+                symbol: str
+                    Symbol of the filled order.
+                side: OrderSide
+                    Side of the filled order.
+                qty: float
+                    Filled quantity of this fill only.
+                price: float
+                    Price of the fill.
+                positionQty: Optional[float]
+                    Signed position after the fill as reported by the exchange. Derived from the local position if not given.
+                timestamp: Optional[datetime]
+                    Time of the fill.
+        """
+        signedQty = qty if (side == OrderSide.BUY) else -qty
+        with self._lock:
+            if self._fillsInFlight != None:
+                self._fillsInFlight += 1
+            position = self._positions.get(symbol)
+            oldQty = 0.0 if (position == None) else position.qty
+            newQty = (oldQty + signedQty) if (positionQty == None) else positionQty
+
+            if newQty == 0:
+                self._positions.pop(symbol, None)
+            else:
+                # Opening or flipping a position starts a new entry price, growing it averages in the fill, reducing it keeps the entry price
+                if (position == None) or (oldQty == 0) or ((oldQty > 0) != (newQty > 0)):
+                    avgEntryPrice = price
+                elif abs(newQty) > abs(oldQty):
+                    avgEntryPrice = ((abs(oldQty) * position.avg_entry_price) + ((abs(newQty) - abs(oldQty)) * price)) / abs(newQty)
+                else:
+                    avgEntryPrice = position.avg_entry_price
+                self._positions[symbol] = PositionModel(
+                    symbol=symbol,
+                    asset_id=(None if (position == None) else position.asset_id),
+                    qty=newQty,
+                    avg_entry_price=avgEntryPrice,
+                    cost_basis=(abs(newQty) * avgEntryPrice),
+                    current_price=price,
+                    market_value=(newQty * price),
+                    unrealized_pl=(newQty * (price - avgEntryPrice)))
+
+            if self._account != None:
+                grownQty = max(abs(newQty) - abs(oldQty), 0.0)
+                self._account = self._account.model_copy(update={
+                    "cash"          : self._account.cash - (signedQty * price),
+                    "buying_power"  : self._account.buying_power - (grownQty * price),
+                    "updated_at"    : (datetime.now(timezone.utc) if (timestamp == None) else timestamp)})
+
+    def _run(self) -> None:
+        while self._stopEvent.wait(self._reconcileInterval) != True:
+            try:
+                self.reconcile()
+            except Exception as err:
+                # A failed reconciliation keeps the current snapshot, the next one tries again
+                self.lastError = err
+                if self._onError != None:
+                    self._onError(err)
+
+    def start(self) -> "AccountSnapshot":
+        """
+            Reconciles the snapshot once, then keeps reconciling it in a background thread.
+        """
+        self.reconcile()
+        if self._reconcileInterval != None:
+            self._stopEvent.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+            Stops the periodic reconciliation.
+        """
+        self._stopEvent.set()
+        if self._thread != None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,77 @@
+#
+# Cached Exchange Clock
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import time
+import threading
+from datetime import timedelta
+from typing import Callable, Optional
+
+from .models import ClockReturnModel
+
+
+class CachedExchangeClock:
+
+    """
+        Exchange clock that is fetched once and extrapolated locally afterwards.
+
+        The current exchange time is extrapolated from the fetched timestamp with the monotonic clock, and the market status is derived from the cached `nextOpen` and `nextClose`. The clock is only fetched again once the extrapolated time crosses the next session boundary, once the TTL expired, or when explicitly requested.
+
+        Parameters
+        ----------
+            fetch: Callable[[], ClockReturnModel]
+                Function requesting the clock from the exchange.
+            ttl: Optional[float]
+                Maximum age of the fetched clock in seconds. `None` to only refresh at session boundaries.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[[], ClockReturnModel],
+            ttl: Optional[float] = 60.0):
+        self._fetch         = fetch
+        self._ttlNs         = None if (ttl == None) else int(ttl * 1e9)
+        self._lock          = threading.Lock()
+        self._snapshot      : Optional[ClockReturnModel] = None
+        self._fetchedAtNs   = 0
+
+    def _refresh(self) -> ClockReturnModel:
+        # The exchange timestamp is taken somewhere during the request, its midpoint is the best local estimate
+        startNs = time.monotonic_ns()
+        snapshot = self._fetch()
+        endNs = time.monotonic_ns()
+        self._snapshot      = snapshot
+        self._fetchedAtNs   = (startNs + endNs) // 2
+        return snapshot
+
+    def _extrapolate(self, snapshot: ClockReturnModel, nowNs: int) -> Optional[ClockReturnModel]:
+        # Returns `None` once the cached session information is no longer valid
+        if (self._ttlNs != None) and ((nowNs - self._fetchedAtNs) >= self._ttlNs):
+            return None
+        currentTimestamp = snapshot.currentTimestamp + timedelta(microseconds=((nowNs - self._fetchedAtNs) // 1000))
+        boundary = snapshot.nextClose if snapshot.isOpen else snapshot.nextOpen
+        if currentTimestamp >= boundary:
+            return None
+        # The snapshot was validated when it was fetched, only the timestamp moves
+        return snapshot.model_copy(update={"currentTimestamp": currentTimestamp})
+
+    def now(self, forceRefresh: bool = False) -> ClockReturnModel:
+        """
+            Returns the current exchange clock, fetching it only if the cached one is stale.
+        """
+        with self._lock:
+            if (self._snapshot != None) and (forceRefresh != True):
+                clock = self._extrapolate(self._snapshot, time.monotonic_ns())
+                if clock != None:
+                    return clock
+            return self._refresh()
+
+    def invalidate(self) -> None:
+        """
+            Drops the cached clock, the next call to `now` fetches it again.
+        """
+        with self._lock:
+            self._snapshot = None
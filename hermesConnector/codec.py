@@ -0,0 +1,267 @@
+#
+# Binary Model Codec
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import struct
+import typing
+import numpy as np
+from datetime import datetime, timezone
+from enum import Enum
+from operator import itemgetter
+from typing import Any, Callable, Optional, Sequence
+
+from . import models as HermesModels
+from .models import AccountModel, BaseMarketData, BaseOrderResult, ClockReturnModel, LimitOrderResult, LiveMarketData, MarketOrderResult, PositionModel
+from .models_utilities import HermesBaseModel
+from .hermes_exceptions import UnexpectedInput, UnsupportedFeature
+
+
+# Version of the encoding. Data encoded with another version is rejected rather than misread.
+# Models are encoded by field order, so any change to the fields of an encoded model has to increase it.
+SCHEMA_VERSION = 1
+
+# Header of every encoded batch: magic, schema version, model kind, number of models
+_HEADER = struct.Struct("<2sBBI")
+_MAGIC = b"HM"
+
+# Model kinds, stored in the header. Bars are stored as fixed size records, the other listed models as msgpack rows of their field values, and any other model as msgpack maps.
+_KIND_GENERIC = 0
+_KIND_CLASSES: dict[int, type] = {
+    1: BaseMarketData,
+    2: LiveMarketData,
+    3: ClockReturnModel,
+    4: BaseOrderResult,
+    5: MarketOrderResult,
+    6: LimitOrderResult,
+    7: AccountModel,
+    8: PositionModel,
+}
+_KINDS = {cls: kind for kind, cls in _KIND_CLASSES.items()}
+
+# Record layout of the bars, which numpy reads and writes in a single call
+BAR_DTYPE = np.dtype([
+    ("openTime", "<i8"),
+    ("openPrice", "<f8"),
+    ("highPrice", "<f8"),
+    ("lowPrice", "<f8"),
+    ("closePrice", "<f8"),
+    ("closeTime", "<i8"),
+    ("volume", "<f8"),
+])
+
+_LENGTH = struct.Struct("<I")
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise UnsupportedFeature
+    return msgpack
+
+
+def _packDefault(value: Any) -> Any:
+    # Naive times are taken as UTC, aware ones are packed by msgpack itself
+    if isinstance(value, datetime):
+        return _msgpack().Timestamp.from_datetime(value.replace(tzinfo=timezone.utc))
+    raise UnexpectedInput
+
+
+def _pack(value: Any) -> bytes:
+    return _msgpack().packb(value, datetime=True, default=_packDefault)
+
+
+def _unpack(data: memoryview) -> Any:
+    # Times are decoded as UTC datetimes
+    return _msgpack().unpackb(data, timestamp=3)
+
+
+def _enumOf(annotation: Any) -> Optional[type]:
+    # The enum of an `Enum` or `Optional[Enum]` annotation
+    for candidate in (annotation, *typing.get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return candidate
+    return None
+
+
+# Field names, getter of the field values, and the enum fields with their members by value, per row encoded class
+_rowSpecs: dict[type, tuple[tuple[str, ...], Callable, list[tuple[int, dict]]]] = {}
+
+
+def _rowSpec(cls: type) -> tuple[tuple[str, ...], Callable, list[tuple[int, dict]]]:
+    spec = _rowSpecs.get(cls)
+    if spec == None:
+        names = tuple(cls.model_fields) # type: ignore
+        enums = []
+        for i, field in enumerate(cls.model_fields.values()): # type: ignore
+            enum = _enumOf(field.annotation)
+            if enum != None:
+                enums.append((i, {member.value: member for member in enum}))
+        spec = (names, itemgetter(*names), enums)
+        _rowSpecs[cls] = spec
+    return spec
+
+
+def _encodeRows(models: Sequence[HermesBaseModel]) -> bytes:
+    _, getter, _ = _rowSpec(type(models[0]))
+    # String enums are packed as their values
+    return _pack([getter(model.__dict__) for model in models])
+
+
+def _decodeRows(cls: type, data: memoryview) -> list:
+    names, _, enums = _rowSpec(cls)
+    output = []
+    for row in _unpack(data):
+        for i, members in enums:
+            if row[i] != None:
+                row[i] = members[row[i]]
+        # The values were taken from valid models, so they are not validated again
+        output.append(cls.fromExchange(True, **dict(zip(names, row)))) # type: ignore
+    return output
+
+
+def _encodeBars(models: Sequence[BaseMarketData]) -> bytes:
+    return np.array(
+        [(bar.openTime, bar.openPrice, bar.highPrice, bar.lowPrice, bar.closePrice, bar.closeTime, bar.volume) for bar in models],
+        dtype=BAR_DTYPE).tobytes()
+
+
+def _decodeBars(cls: type, data: memoryview, count: int) -> list:
+    records = np.frombuffer(data, dtype=BAR_DTYPE, count=count).tolist()
+    return [
+        cls.fromExchange(True, openTime=r[0], openPrice=r[1], highPrice=r[2], lowPrice=r[3], closePrice=r[4], closeTime=r[5], volume=r[6]) # type: ignore
+        for r in records]
+
+
+def _encodeGeneric(models: Sequence[HermesBaseModel]) -> bytes:
+    # Stored as the class name, followed by the fields of every model
+    name = type(models[0]).__name__.encode("utf-8")
+    return _LENGTH.pack(len(name)) + name + _pack([model.model_dump() for model in models])
+
+
+def _decodeGeneric(data: memoryview) -> list:
+    length = _LENGTH.unpack_from(data, 0)[0]
+    cls = getattr(HermesModels, str(data[_LENGTH.size:_LENGTH.size + length], "utf-8"), None)
+    if (isinstance(cls, type) != True) or (issubclass(cls, HermesBaseModel) != True): # type: ignore
+        raise UnexpectedInput
+    # Nested models and enums are restored by the validation
+    return [cls.model_validate(fields) for fields in _unpack(data[_LENGTH.size + length:])] # type: ignore
+
+
+def encodeBatch(models: Sequence[HermesBaseModel]) -> bytes:
+    """
+        Encodes a list of models of the same class into a compact binary form.
+
+        Bars are stored as fixed size records and need no further dependency. Every other model is stored with msgpack, which requires the optional `msgpack` dependency. Times are kept to the microsecond and decoded in UTC.
+
+        Parameters
+        ----------
+            models: Sequence[HermesBaseModel]
+                The models, all of the same class.
+
+        Returns
+        -------
+            bytes
+                The encoded batch, starting with the schema version.
+    """
+    if len(models) == 0:
+        return _HEADER.pack(_MAGIC, SCHEMA_VERSION, _KIND_GENERIC, 0)
+    cls = type(models[0])
+    for model in models:
+        if type(model) != cls:
+            raise UnexpectedInput
+
+    kind = _KINDS.get(cls, _KIND_GENERIC)
+    header = _HEADER.pack(_MAGIC, SCHEMA_VERSION, kind, len(models))
+    if kind == _KIND_GENERIC:
+        return header + _encodeGeneric(models)
+    if issubclass(cls, BaseMarketData):
+        return header + _encodeBars(models) # type: ignore
+    return header + _encodeRows(models)
+
+
+def decodeBatch(data: bytes) -> list:
+    """
+        Decodes a batch encoded by `encodeBatch` back into its models.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise UnexpectedInput
+    magic, version, kind, count = _HEADER.unpack_from(view, 0)
+    if (magic != _MAGIC) or (version != SCHEMA_VERSION):
+        raise UnexpectedInput
+    if count == 0:
+        return []
+
+    payload = view[_HEADER.size:]
+    if kind == _KIND_GENERIC:
+        return _decodeGeneric(payload)
+    cls = _KIND_CLASSES.get(kind)
+    if cls == None:
+        raise UnexpectedInput
+    if issubclass(cls, BaseMarketData):
+        return _decodeBars(cls, payload, count)
+    return _decodeRows(cls, payload)
+
+
+def encode(model: HermesBaseModel) -> bytes:
+    """
+        Encodes a single model, see `encodeBatch`.
+    """
+    return encodeBatch([model])
+
+
+def decode(data: bytes) -> HermesBaseModel:
+    """
+        Decodes a single model encoded by `encode`.
+    """
+    models = decodeBatch(data)
+    if len(models) != 1:
+        raise UnexpectedInput
+    return models[0]
+
+
+def encodeBarColumns(columns: dict[str, np.ndarray]) -> bytes:
+    """
+        Encodes bars given as columns, e.g. from `SharedBarRing.read`, without creating a model per bar. The columns are named as the fields of `BaseMarketData`, or as the `BAR_COLUMNS` of the shared ring.
+    """
+    count = len(columns["openTime"])
+    records = np.empty(count, dtype=BAR_DTYPE)
+    for field in BAR_DTYPE.names: # type: ignore
+        # The shared ring names the prices without the "Price" suffix
+        records[field] = columns[field] if (field in columns) else columns[field.removesuffix("Price")]
+    return _HEADER.pack(_MAGIC, SCHEMA_VERSION, _KINDS[LiveMarketData], count) + records.tobytes()
+
+
+def decodeBarColumns(data: bytes) -> np.ndarray:
+    """
+        Decodes a batch of bars into a numpy record array with the fields of `BAR_DTYPE`, without creating a model per bar. The array is a read-only view of `data`.
+    """
+    magic, version, kind, count = _HEADER.unpack_from(data, 0)
+    if (magic != _MAGIC) or (version != SCHEMA_VERSION) or (issubclass(_KIND_CLASSES.get(kind, type), BaseMarketData) != True):
+        raise UnexpectedInput
+    return np.frombuffer(data, dtype=BAR_DTYPE, count=count, offset=_HEADER.size)
+
+
+def decodeBarBatches(batches: Sequence[bytes]) -> np.ndarray:
+    """
+        Decodes a sequence of bar batches, e.g. bars encoded one at a time, into a single record array with the fields of `BAR_DTYPE`.
+    """
+    if len(batches) == 0:
+        return np.empty(0, dtype=BAR_DTYPE)
+    recordSize = _HEADER.size + BAR_DTYPE.itemsize
+    if any(len(batch) != recordSize for batch in batches):
+        return np.concatenate([decodeBarColumns(batch) for batch in batches])
+
+    # Batches of a single bar are read in one call, as a header followed by the bar
+    rows = np.frombuffer(b"".join(batches), dtype=np.dtype([("header", np.uint8, (_HEADER.size,)), ("bar", BAR_DTYPE)]))
+    valid = np.zeros(len(rows), dtype=bool)
+    for kind in [_KINDS[BaseMarketData], _KINDS[LiveMarketData]]:
+        header = np.frombuffer(_HEADER.pack(_MAGIC, SCHEMA_VERSION, kind, 1), dtype=np.uint8)
+        valid |= (rows["header"] == header).all(axis=1)
+    if valid.all() != True:
+        raise UnexpectedInput
+    return rows["bar"].copy()
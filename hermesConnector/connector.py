@@ -31,7 +31,13 @@ class Connector:
                     limit=options["limit"],
                     credentials=credentials,
                     wshandler=options["dataHandler"],
-                    columns=options["columns"])
+                    columns=options["columns"],
+                    retryPolicy=options.get("retryPolicy"),
+                    floatPrecision=options.get("floatPrecision", "float64"),
+                    outputFormat=options.get("outputFormat", "pandas"),
+                    clockTtl=options.get("clockTtl", 60.0),
+                    trustedModels=options.get("trustedModels"),
+                    orderConstraints=options.get("orderConstraints", "off"))
             case _:
                 raise UnsupportedExchange
             
@@ -4,20 +4,27 @@
 
 # Load modules
 from datetime import datetime, timedelta
+import asyncio
+import inspect
+import time
+import threading
+import uuid
 import warnings
-import pandas as pd
-from dateutil.relativedelta import relativedelta
+import numpy as np
 from datetime import timezone
-from typing import Union, Dict, Tuple
-from pandas import DataFrame
+from typing import Callable, Iterator, Optional, Union, Dict, Tuple
 
 # Alpaca Imports
 from alpaca.trading.client import TradingClient
 from alpaca.data.models.bars import Bar
-from alpaca.trading.models import Clock as AlpacaClock, Order as AlpacaOrder, Asset as AlpacaAsset
+from alpaca.data.models.trades import Trade as AlpacaTrade
+from alpaca.data.models.quotes import Quote as AlpacaQuote
+from alpaca.trading.models import Clock as AlpacaClock, Order as AlpacaOrder, Asset as AlpacaAsset, TradeAccount as AlpacaTradeAccount, Position as AlpacaPosition, TradeUpdate as AlpacaTradeUpdate
+from alpaca.trading.stream import TradingStream
 from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest, GetOrdersRequest
 from alpaca.trading import enums as AlpacaTradingEnums
 from alpaca.common.exceptions import APIError
+from alpaca.common.enums import Sort as AlpacaSort
 # Data Clients
 from alpaca.data.historical.stock import StockHistoricalDataClient
 from alpaca.data.historical.option import OptionHistoricalDataClient
@@ -27,17 +34,32 @@ from alpaca.data.live import StockDataStream, OptionDataStream, CryptoDataStream
 # Historical data request models
 from alpaca.data import StockBarsRequest, OptionBarsRequest, CryptoBarsRequest, TimeFrame as AlpacaTimeFrame, TimeFrameUnit as AlpacaTimeFrameUnit, BarSet as AlpacaBarSet, RawData as AlpacaRawData
 
-from .models import BaseOrderResult, ClockReturnModel, LimitOrderBaseParams, LimitOrderResult, LiveMarketData, OrderBaseParams, MarketOrderNotionalParams, MarketOrderQtyParams, MarketOrderResult
+from .trading_constraints import ConstraintsCache
+from .models import AccountModel, PositionModel, BaseOrderResult, ClockReturnModel, LimitOrderBaseParams, LimitOrderResult, LiveMarketData, OrderBaseParams, MarketOrderNotionalParams, MarketOrderQtyParams, MarketOrderResult, TradingConstraintsModel
 # TODO: Tidy this up. Put all the imports inside a single reference instead of individual imports
-from .hermes_enums import OrderType, TimeInForce as HermesTIF, OrderSide as HermesOrderSide, OrderStatus as HermesOrderStatus, TimeframeUnit as HermesTimeframeUnit
+from .hermes_enums import OrderQueryStatus, OrderType, TimeInForce as HermesTIF, OrderSide as HermesOrderSide, OrderStatus as HermesOrderStatus, TimeframeUnit as HermesTimeframeUnit
 from .timeframe import TimeFrame as HermesTimeFrame
 from .hermes_exceptions import InsufficientParameters, HandlerNonExistent, NonStandardInput, TargetClientInitiationError, UnexpectedInput, UnexpectedOutputType, UnknownGenericHermesException, UnsupportedFeature, UnsupportedParameterValue
 from .connector_template import ConnectorTemplate
+from .retry import isTransientError
+from .clock import CachedExchangeClock
+from .account_snapshot import AccountSnapshot
+from .order_store import OPEN_STATUSES
+from .stream_manager import AlpacaStreamManager
+from .fast_orders import FastOrderResult
+from .tick_buffers import QuoteBuffer, TickBatchHandler, TradeBuffer
+from .data_utilities import HistoricFrame, buildHistoricFrame, buildLongHistoricFrame
+from .resample import Alignment, resampleColumns
 
 
 
 class Alpaca(ConnectorTemplate):
 
+    # Period of the bars pushed by the live data stream, in nanoseconds
+    _liveBarPeriodNs        : int = 60 * 1_000_000_000
+    # Largest number of orders the API returns in a page
+    _ordersPageLimit        : int = 500
+
     def __init__(
             self,
             tradingPair,
@@ -46,7 +68,14 @@ class Alpaca(ConnectorTemplate):
             limit=75,
             credentials=["", ""],
             columns=None,
-            wshandler=None):
+            wshandler=None,
+            retryPolicy=None,
+            floatPrecision="float64",
+            outputFormat="pandas",
+            clockTtl=60.0,
+            trustedModels=None,
+            orderConstraints="off",
+            errorHandler=None):
 
         # Initialise parent class
         super().__init__(
@@ -56,7 +85,14 @@ class Alpaca(ConnectorTemplate):
             limit,
             credentials,
             columns,
-            wshandler)
+            wshandler,
+            retryPolicy,
+            floatPrecision,
+            outputFormat,
+            clockTtl,
+            trustedModels,
+            orderConstraints,
+            errorHandler)
         
         # Initialise live or paper trading client
         client = None
@@ -82,6 +118,10 @@ class Alpaca(ConnectorTemplate):
         # Get asset info
         assetInfo = self._getAssetInfo(assetNameOrId=self.options.tradingPair)
         self._assetClass = assetInfo.asset_class
+
+        # The trading constraints are part of the asset, the ones of the trading pair are taken from the request above
+        self._constraintsCache = ConstraintsCache(loader=lambda symbol: self._assetConstraints(self._getAssetInfo(assetNameOrId=symbol)))
+        self._constraintsCache.put(self._assetConstraints(assetInfo))
         historicDataClient = None
         realTimeDataClient = None
 
@@ -120,10 +160,9 @@ class Alpaca(ConnectorTemplate):
         self.clients["historical"] = historicDataClient
         self._historicalDataClient = historicDataClient
         self.historicalDataRequestModel = historicalDataRequestModel
-        # Check if a data handler was supplied. Else, don't assign the real time client
-        if self.options.dataHandler != None:
-            self.clients["ws"] = realTimeDataClient
-            self._wsClient = realTimeDataClient
+        # The real time client only connects once live data is initiated, which requires a data handler or a bar publisher
+        self.clients["ws"] = realTimeDataClient
+        self._wsClient = realTimeDataClient
         
         # Declare a start date for historical data
         # The date is way back in the past (30 years by default) to allow for the limit parameter to take priority
@@ -132,8 +171,38 @@ class Alpaca(ConnectorTemplate):
         # Convert Hermes timeframe to Alpaca timeframe
         self._requestAlpacaTimeFrame = self._convertTimeFrame(self.options.interval)
 
+        # Shared stream the live data is received through, see `initiateLiveData`
+        self._streamManager: Optional[AlpacaStreamManager] = None
+        # Recovery of missed live bars in flight, and the live bars received meanwhile, see `wsHandlerInternal`
+        self._gapRecovery: Optional[asyncio.Task] = None
+        self._gapBars: Optional[list[Tuple[Bar, int]]] = None
+
+        # Request body templates of the fast order path, built on first use, see `prepareFastOrders`
+        self._fastOrderTemplates: Optional[dict[Tuple[OrderType, HermesOrderSide, HermesTIF], dict]] = None
+
+        # Tick buffers of the trade and quote subscriptions, see `subscribeTrades` and `subscribeQuotes`
+        self._tradeBuffers: tuple[TradeBuffer, ...] = ()
+        self._quoteBuffers: tuple[QuoteBuffer, ...] = ()
+
+        # Local account snapshot and the stream keeping it current, see `trackAccount`
+        self._accountSnapshot: Optional[AccountSnapshot] = None
+        self._tradingStream: Optional[TradingStream] = None
+        self._tradingStreamThread: Optional[threading.Thread] = None
+
+        # The exchange clock is fetched once and extrapolated locally, see `exchangeClock`
+        self._clockCache = CachedExchangeClock(fetch=self._exchangeClock_fetch, ttl=self.options.clockTtl)
+
     @staticmethod
     def generalErrorHandlerDecorator(func):
+        # Coroutine functions keep a coroutine wrapper, as the Alpaca streams only accept coroutine handlers
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper_generalErrorHandlerDecorator(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    raise e
+            return async_wrapper_generalErrorHandlerDecorator
+
         def wrapper_generalErrorHandlerDecorator(self, *args, **kwargs):
             '''
                 Decorator used for handling of general errors.
@@ -145,32 +214,170 @@ class Alpaca(ConnectorTemplate):
                 raise e
         return wrapper_generalErrorHandlerDecorator
     
+    @staticmethod
+    def idempotentRequestDecorator(func):
+        def wrapper_idempotentRequestDecorator(self, *args, **kwargs):
+            '''
+                Decorator used for retrying idempotent requests according to the retry policy of the connector, if one was given.
+            '''
+            if (self.options.retryPolicy == None):
+                return func(self, *args, **kwargs)
+            return self.options.retryPolicy.execute(func, self, *args, **kwargs)
+        return wrapper_idempotentRequestDecorator
+    
     def _exchangeClock_request(self) -> Union[AlpacaClock, AlpacaRawData]:
-        return self._tradingClient.get_clock()
+        sendTime = time.time_ns()
+        clock = self._tradingClient.get_clock()
+        receiveTime = time.time_ns()
+
+        # Every clock request doubles as a sample for the exchange clock offset estimation
+        if (isinstance(clock, AlpacaClock)):
+            exchangeTime = int(clock.timestamp.timestamp() * 1e6) * 1000
+            self._latencyTracker.addClockSample(
+                localSendNs=sendTime,
+                exchangeTimeNs=exchangeTime,
+                localReceiveNs=receiveTime)
+        return clock
     
     def _exchangeClock_internal(self, input) -> ClockReturnModel:
         # To appease the Pylance, check if the type is of Dict, the base type for Alpaca's RawData type.
         if (isinstance(input, Dict)):
             raise UnexpectedOutputType
         else:
-            return ClockReturnModel(
+            return ClockReturnModel.fromExchange(
+                self.options.trustedModels,
                 isOpen=input.is_open,
                 nextOpen=input.next_open,
                 nextClose=input.next_close,
                 currentTimestamp=input.timestamp)
     
-    @generalErrorHandlerDecorator
-    def exchangeClock(self) -> ClockReturnModel:
+    @idempotentRequestDecorator
+    def _exchangeClock_fetch(self) -> ClockReturnModel:
         input = self._exchangeClock_request()
         return self._exchangeClock_internal(input=input)
+
+    @generalErrorHandlerDecorator
+    def exchangeClock(self, forceRefresh: bool = False) -> ClockReturnModel:
+        return self._clockCache.now(forceRefresh=forceRefresh)
     
     @generalErrorHandlerDecorator
     def stop(self) -> None:
+        tickBuffers = self._tradeBuffers + self._quoteBuffers
+        if self._streamManager != None:
+            self._streamManager.unsubscribe(self.options.tradingPair, self.wsHandlerInternal)
+            self._streamManager = None
+            if len(tickBuffers) == 0:
+                return
         self._wsClient.stop()
+        # Ticks still waiting for their batch are delivered last
+        for buffer in tickBuffers:
+            buffer.flush()
+
+    def _accountResult(self, account: AlpacaTradeAccount) -> AccountModel:
+        def toFloat(value: Optional[str]) -> float:
+            return 0.0 if (value == None) else float(value)
+
+        return AccountModel.fromExchange(
+            self.options.trustedModels,
+            account_id          = str(account.id),
+            currency            = account.currency,
+            cash                = toFloat(account.cash),
+            buying_power        = toFloat(account.buying_power),
+            equity              = toFloat(account.equity),
+            portfolio_value     = toFloat(account.portfolio_value),
+            long_market_value   = toFloat(account.long_market_value),
+            short_market_value  = toFloat(account.short_market_value),
+            pattern_day_trader  = account.pattern_day_trader,
+            trading_blocked     = account.trading_blocked,
+            updated_at          = datetime.now(timezone.utc))
+
+    def _positionResult(self, position: AlpacaPosition) -> PositionModel:
+        def toOptionalFloat(value: Optional[str]) -> Optional[float]:
+            return None if (value == None) else float(value)
+
+        # Alpaca reports short positions with a negative quantity already
+        return PositionModel.fromExchange(
+            self.options.trustedModels,
+            symbol              = position.symbol,
+            asset_id            = str(position.asset_id),
+            qty                 = float(position.qty),
+            avg_entry_price     = float(position.avg_entry_price),
+            cost_basis          = float(position.cost_basis),
+            current_price       = toOptionalFloat(position.current_price),
+            market_value        = toOptionalFloat(position.market_value),
+            unrealized_pl       = toOptionalFloat(position.unrealized_pl))
+
+    @idempotentRequestDecorator
+    def _accountRequest(self) -> AccountModel:
+        account = self._tradingClient.get_account()
+        if (isinstance(account, Dict)):
+            raise UnexpectedOutputType
+        return self._accountResult(account)
+
+    @idempotentRequestDecorator
+    def _positionsRequest(self) -> list[PositionModel]:
+        positions = self._tradingClient.get_all_positions()
+        if (isinstance(positions, Dict)):
+            raise UnexpectedOutputType
+        return [self._positionResult(position) for position in positions]
+
+    def _accountSnapshotFetch(self) -> Tuple[AccountModel, list[PositionModel]]:
+        return self._accountRequest(), self._positionsRequest()
 
     @generalErrorHandlerDecorator
-    def account(self):
-        pass
+    def account(self) -> AccountModel:
+        if self._accountSnapshot != None:
+            return self._accountSnapshot.account() # type: ignore
+        return self._accountRequest()
+
+    @generalErrorHandlerDecorator
+    def positions(self) -> list[PositionModel]:
+        if self._accountSnapshot != None:
+            return self._accountSnapshot.positions()
+        return self._positionsRequest()
+
+    async def _tradeUpdateHandler(self, data: AlpacaTradeUpdate) -> None:
+        if (self._accountSnapshot == None) or (data.event not in [AlpacaTradingEnums.TradeEvent.FILL, AlpacaTradingEnums.TradeEvent.PARTIAL_FILL]):
+            return
+        if (data.qty == None) or (data.price == None) or (data.order.symbol == None):
+            return
+        self._accountSnapshot.applyFill(
+            symbol=data.order.symbol,
+            side=(HermesOrderSide.BUY if (data.order.side == AlpacaTradingEnums.OrderSide.BUY) else HermesOrderSide.SELL),
+            qty=float(data.qty),
+            price=float(data.price),
+            positionQty=(None if (data.position_qty == None) else float(data.position_qty)),
+            timestamp=data.timestamp)
+
+    @generalErrorHandlerDecorator
+    def trackAccount(self, reconcileInterval: Optional[float] = 30.0) -> AccountSnapshot:
+        if self._accountSnapshot != None:
+            return self._accountSnapshot
+        snapshot = AccountSnapshot(fetch=self._accountSnapshotFetch, reconcileInterval=reconcileInterval, onError=self._reportError)
+        self._accountSnapshot = snapshot.start()
+
+        # Fills are received through the trade updates stream, run in the background next to the market data stream
+        self._tradingStream = TradingStream(
+            api_key=self.options.credentials[0],
+            secret_key=self.options.credentials[1],
+            paper=(self.options.mode == 'test'))
+        self._tradingStream.subscribe_trade_updates(self._tradeUpdateHandler)
+        self._tradingStreamThread = threading.Thread(target=self._tradingStream.run, daemon=True)
+        self._tradingStreamThread.start()
+        return snapshot
+
+    @generalErrorHandlerDecorator
+    def stopAccountTracking(self) -> None:
+        if self._accountSnapshot == None:
+            return
+        self._accountSnapshot.stop()
+        self._accountSnapshot = None
+        if self._tradingStream != None:
+            self._tradingStream.stop()
+            self._tradingStream = None
+        if self._tradingStreamThread != None:
+            self._tradingStreamThread.join(timeout=10)
+            self._tradingStreamThread = None
 
     def _orderParamConstructor(
             self,
@@ -224,13 +431,76 @@ class Alpaca(ConnectorTemplate):
                 raise UnknownGenericHermesException
         return orderSideResult
 
+    @staticmethod
+    def _generateClientOrderId() -> str:
+        # Kept within 36 characters, the tightest client order ID limit among the supported exchanges
+        return f"hm-{uuid.uuid4().hex}"
+
+    @staticmethod
+    def _isDuplicateClientOrderIdError(err: Exception) -> bool:
+        return isinstance(err, APIError) and (err.status_code == 422) and ("client_order_id" in str(err))
+
+    def _lookupClientOrder(self, clientOrderId: str) -> Union[AlpacaOrder, None]:
+        try:
+            order = self._tradingClient.get_order_by_client_id(client_id=clientOrderId)
+        except APIError as err:
+            if (err.status_code == 404):
+                return None
+            raise err
+        if (isinstance(order, Dict)):
+            raise UnexpectedOutputType
+        return order
+
+    def _submitOrderRequest(self, reqModel: Union[MarketOrderRequest, LimitOrderRequest]) -> Union[AlpacaOrder, AlpacaRawData]:
+        """
+            Submits an order request carrying a client order ID, retrying transient failures without risking duplicate orders.
+
+            After a transient failure the order may or may not have reached the exchange, so it is looked up by its client order ID before being resubmitted. A resubmission of an order that did go through is rejected by the exchange as a duplicate client order ID, in which case the existing order is returned.
+        """
+        if (reqModel.client_order_id == None):
+            raise InsufficientParameters
+        return self._submitWithClientOrderId(
+            clientOrderId=reqModel.client_order_id,
+            submit=lambda: self._tradingClient.submit_order(order_data=reqModel))
+
+    def _submitWithClientOrderId(self, clientOrderId: str, submit: Callable[[], object]):
+        # Retry loop of `_submitOrderRequest`, also used by the fast path which submits raw request bodies
+        policy = self.options.retryPolicy
+        maxAttempts = 1 if (policy == None) else policy.maxAttempts
+
+        attempt = 0
+        while True:
+            try:
+                return submit()
+            except Exception as err:
+                if (self._isDuplicateClientOrderIdError(err)):
+                    existingOrder = self._lookupClientOrder(clientOrderId)
+                    if (existingOrder != None):
+                        return existingOrder
+                    raise err
+                if (isTransientError(err) != True):
+                    raise err
+                
+                # Find out if the order made it through before trying again
+                try:
+                    existingOrder = self._lookupClientOrder(clientOrderId)
+                except Exception:
+                    existingOrder = None
+                if (existingOrder != None):
+                    return existingOrder
+                
+                attempt += 1
+                if (attempt >= maxAttempts):
+                    raise err
+                time.sleep(policy.backoffDelay(attempt)) # type: ignore
+
     def _marketOrderSubmit(
             self,
             reqModel: MarketOrderRequest):
         
         # Submit order
         try:
-            orderResult = self._tradingClient.submit_order(order_data=reqModel)
+            orderResult = self._submitOrderRequest(reqModel=reqModel)
             if(isinstance(orderResult, Dict)):
                 raise UnexpectedOutputType
             
@@ -267,7 +537,8 @@ class Alpaca(ConnectorTemplate):
             if (orderResult.notional != None):
                 notional = float(orderResult.notional)
 
-            output = MarketOrderResult(
+            output = MarketOrderResult.fromExchange(
+                self.options.trustedModels,
                 order_id            = str(orderResult.id),
                 created_at          = orderResult.created_at,
                 updated_at          = orderResult.updated_at,
@@ -288,8 +559,10 @@ class Alpaca(ConnectorTemplate):
                 type                = OrderType(orderResult.type),
                 time_in_force       = HermesTIF(orderResult.time_in_force),
                 status              = HermesOrderStatus(orderResult.status),
+                client_order_id     = orderResult.client_order_id,
                 # Raw response as a json string
                 raw                 = jsonStr)
+            self._recordOrders([output])
             
             # Return output
             return output
@@ -302,6 +575,7 @@ class Alpaca(ConnectorTemplate):
             self,
             orderParams: MarketOrderQtyParams) -> MarketOrderResult:
         
+        orderParams = self._constrainParams(orderParams) # type: ignore
         orderSide, tifEnum = self._orderParamConstructor(orderParams=orderParams)
 
         # Consturct API request model
@@ -309,7 +583,9 @@ class Alpaca(ConnectorTemplate):
             symbol=self.options.tradingPair,
             qty=orderParams.qty,
             side=orderSide,
-            time_in_force=tifEnum)
+            time_in_force=tifEnum,
+            client_order_id=(orderParams.clientOrderId or self._generateClientOrderId()))
+        self._journalSubmission(orderParams, reqModel.client_order_id)
         
         return self._marketOrderSubmit(reqModel=reqModel)
     
@@ -318,6 +594,7 @@ class Alpaca(ConnectorTemplate):
             self,
             orderParams: MarketOrderNotionalParams) -> MarketOrderResult:
         
+        orderParams = self._constrainParams(orderParams) # type: ignore
         orderSide, tifEnum = self._orderParamConstructor(orderParams=orderParams)
 
         # Consturct API request model
@@ -325,14 +602,16 @@ class Alpaca(ConnectorTemplate):
             symbol=self.options.tradingPair,
             notional=orderParams.cost,
             side=orderSide,
-            time_in_force=tifEnum)
+            time_in_force=tifEnum,
+            client_order_id=(orderParams.clientOrderId or self._generateClientOrderId()))
+        self._journalSubmission(orderParams, reqModel.client_order_id)
         
         return self._marketOrderSubmit(reqModel=reqModel)
 
     def _limitOrderSubmit(self, reqModel: LimitOrderRequest) -> LimitOrderResult:
         # Submit order
         try:
-            orderResult = self._tradingClient.submit_order(reqModel)
+            orderResult = self._submitOrderRequest(reqModel=reqModel)
             if(isinstance(orderResult, Dict)):
                 raise UnexpectedOutputType
 
@@ -373,7 +652,8 @@ class Alpaca(ConnectorTemplate):
                 qty = float(orderResult.qty)
 
 
-            output = LimitOrderResult(
+            output = LimitOrderResult.fromExchange(
+                self.options.trustedModels,
                 order_id            = str(orderResult.id),
                 created_at          = orderResult.created_at,
                 updated_at          = orderResult.updated_at,
@@ -394,10 +674,12 @@ class Alpaca(ConnectorTemplate):
                 type                = OrderType(orderResult.type),
                 time_in_force       = HermesTIF(orderResult.time_in_force),
                 status              = HermesOrderStatus(orderResult.status),
-                # Limit order specific
-                limit_price         = float(orderResult.limit_price),
+                client_order_id     = orderResult.client_order_id,
                 # Raw response as a json string
-                raw                 = jsonStr)
+                raw                 = jsonStr,
+                # Limit order specific
+                limit_price         = float(orderResult.limit_price))
+            self._recordOrders([output])
             return output
         except APIError as err:
             raise err
@@ -407,6 +689,7 @@ class Alpaca(ConnectorTemplate):
             self,
             orderParams: LimitOrderBaseParams) -> LimitOrderResult:
         
+        orderParams = self._constrainParams(orderParams) # type: ignore
         orderSideEnum, tifEnum = self._orderParamConstructor(orderParams=orderParams)
 
         # Construct API request model
@@ -415,16 +698,136 @@ class Alpaca(ConnectorTemplate):
             qty=orderParams.qty,
             limit_price=orderParams.limitPrice,
             side=orderSideEnum,
-            time_in_force=tifEnum)
+            time_in_force=tifEnum,
+            client_order_id=(orderParams.clientOrderId or self._generateClientOrderId()))
+        self._journalSubmission(orderParams, reqModel.client_order_id)
         
         return self._limitOrderSubmit(reqModel=reqModel)
+
+    @generalErrorHandlerDecorator
+    def prepareFastOrders(self) -> None:
+        # The request bodies, as the SDK would serialise them, of every order type, side and time in force of the trading pair
+        sides = {
+            HermesOrderSide.BUY     : AlpacaTradingEnums.OrderSide.BUY.value,
+            HermesOrderSide.SELL    : AlpacaTradingEnums.OrderSide.SELL.value,
+        }
+        tifs = {
+            HermesTIF.GTC           : AlpacaTradingEnums.TimeInForce.GTC.value,
+            HermesTIF.IOC           : AlpacaTradingEnums.TimeInForce.IOC.value,
+            HermesTIF.DAY           : AlpacaTradingEnums.TimeInForce.DAY.value,
+        }
+        templates = {}
+        for orderType in [OrderType.MARKET, OrderType.LIMIT]:
+            for side, alpacaSide in sides.items():
+                for tif, alpacaTif in tifs.items():
+                    templates[(orderType, side, tif)] = {
+                        "symbol"        : self.options.tradingPair,
+                        "side"          : alpacaSide,
+                        "type"          : AlpacaTradingEnums.OrderType(orderType.value).value,
+                        "time_in_force" : alpacaTif,
+                    }
+        self._fastOrderTemplates = templates
+
+    def _fastOrderResult(self, raw: dict) -> BaseOrderResult:
+        # Full conversion of a fast path response, deferred until `FastOrderResult.result` is called
+        order = AlpacaOrder(**raw)
+        result = dict(self._orderToModel(order))
+        if order.type == AlpacaTradingEnums.OrderType.LIMIT:
+            return LimitOrderResult.fromExchange(
+                self.options.trustedModels,
+                **result,
+                limit_price=(None if (order.limit_price == None) else float(order.limit_price)))
+        return MarketOrderResult.fromExchange(self.options.trustedModels, **result)
+
+    @generalErrorHandlerDecorator
+    def fastOrder(
+            self,
+            orderType: OrderType,
+            side: HermesOrderSide,
+            tif: HermesTIF = HermesTIF.DAY,
+            qty: Optional[float] = None,
+            cost: Optional[float] = None,
+            limitPrice: Optional[float] = None,
+            clientOrderId: Optional[str] = None) -> FastOrderResult:
+        if self._fastOrderTemplates == None:
+            self.prepareFastOrders()
+        template = self._fastOrderTemplates.get((orderType, side, tif)) # type: ignore
+        if template == None:
+            raise UnsupportedParameterValue
+
+        # Only the checks the request models would have done that the exchange does not repeat
+        # The numbers are sent as floats, as the request models would send them
+        body = template.copy()
+        if orderType == OrderType.LIMIT:
+            if (qty == None) or (limitPrice == None):
+                raise InsufficientParameters
+        elif (qty == None) == (cost == None):
+            raise InsufficientParameters
+        qty, cost, limitPrice = self._constrainOrder(side, tif, qty, cost, limitPrice)
+        if limitPrice != None:
+            body["limit_price"] = float(limitPrice)
+        if qty != None:
+            body["qty"] = float(qty)
+        else:
+            body["notional"] = float(cost) # type: ignore
+        if clientOrderId == None:
+            clientOrderId = self._generateClientOrderId()
+        body["client_order_id"] = clientOrderId
+        if self._journal != None:
+            # Journaled as the parameters the regular order methods take
+            if orderType == OrderType.LIMIT:
+                params = LimitOrderBaseParams(side=side, tif=tif, clientOrderId=clientOrderId, qty=qty, limitPrice=limitPrice) # type: ignore
+            elif qty != None:
+                params = MarketOrderQtyParams(side=side, tif=tif, clientOrderId=clientOrderId, qty=qty)
+            else:
+                params = MarketOrderNotionalParams(side=side, tif=tif, clientOrderId=clientOrderId, cost=cost) # type: ignore
+            self._journal.appendSubmission(params)
+
+        response = self._submitWithClientOrderId(
+            clientOrderId=clientOrderId,
+            submit=lambda: self._tradingClient.post("/orders", body))
+        # An order recovered after a failed submission comes back as a model
+        if isinstance(response, AlpacaOrder):
+            response = response.model_dump(mode="json")
+        if isinstance(response, Dict) != True:
+            raise UnexpectedOutputType
+
+        output = FastOrderResult(
+            orderId=response["id"],
+            clientOrderId=response.get("client_order_id"),
+            status=HermesOrderStatus(response["status"]),
+            raw=response, # type: ignore
+            convert=self._fastOrderResult)
+        if (self._orderStore != None) or (self._journal != None):
+            self._recordOrders([output.result()])
+        return output
     
+    # The order requests are retried on their own, so the order store is only read and written once per call
+    @idempotentRequestDecorator
+    def _orderById(self, orderId: str) -> AlpacaOrder:
+        order = self._tradingClient.get_order_by_id(order_id=orderId)
+        if (isinstance(order, Dict)):
+            raise UnexpectedOutputType
+        return order
+
+    @idempotentRequestDecorator
+    def _orderByClientId(self, clientOrderId: str) -> AlpacaOrder:
+        order = self._tradingClient.get_order_by_client_id(client_id=clientOrderId)
+        if (isinstance(order, Dict)):
+            raise UnexpectedOutputType
+        return order
+
     @generalErrorHandlerDecorator
     def queryOrder(self, orderId: str) -> BaseOrderResult:
+        # Serve from the order store if possible
+        orderStore = self._freshOrderStore()
+        if orderStore != None:
+            storedOrder = orderStore.get(orderId)
+            if storedOrder != None:
+                return storedOrder
+
         # Query order
-        queriedOrder = self._tradingClient.get_order_by_id(order_id=orderId)
-        if(isinstance(queriedOrder, Dict)):
-                raise UnexpectedOutputType
+        queriedOrder = self._orderById(orderId)
 
         # Convert to JSON string
         jsonStr = queriedOrder.model_dump_json()
@@ -458,7 +861,8 @@ class Alpaca(ConnectorTemplate):
         if (queriedOrder.qty != None):
             qty = float(queriedOrder.qty)
 
-        outputModel = BaseOrderResult(
+        outputModel = BaseOrderResult.fromExchange(
+                self.options.trustedModels,
                 order_id            = str(queriedOrder.id),
                 created_at          = queriedOrder.created_at,
                 updated_at          = queriedOrder.updated_at,
@@ -479,16 +883,32 @@ class Alpaca(ConnectorTemplate):
                 type                = OrderType(queriedOrder.type),
                 time_in_force       = HermesTIF(queriedOrder.time_in_force),
                 status              = HermesOrderStatus(queriedOrder.status),
+                client_order_id     = queriedOrder.client_order_id,
                 # Raw response as a json string
                 raw                 = jsonStr)
         
         # Return model
+        self._recordOrders([outputModel])
         return outputModel
     
+    @generalErrorHandlerDecorator
+    def queryOrderByClientId(self, clientOrderId: str) -> BaseOrderResult:
+        orderStore = self._freshOrderStore()
+        if orderStore != None:
+            storedOrder = orderStore.getByClientId(clientOrderId)
+            if storedOrder != None:
+                return storedOrder
+
+        output = self._orderToModel(self._orderByClientId(clientOrderId))
+        self._recordOrders([output])
+        return output
+    
     @generalErrorHandlerDecorator
     def cancelOrder(self, orderId: str) -> bool:
         # Query order
-        targetOrder = self.queryOrder(orderId=orderId)
+        # The status is taken from the broker, as a stored order may not have caught up with a fill or cancellation yet
+        targetOrder = self._orderToModel(self._orderById(orderId))
+        self._recordOrders([targetOrder])
 
         # Get order status and check against dissalowed states
         disallowedStates = [
@@ -503,6 +923,7 @@ class Alpaca(ConnectorTemplate):
         
         # The loop terminated without returning, continue with cancellation
         self._tradingClient.cancel_order_by_id(order_id=orderId)
+        self._journalCancel(orderId)
         return True
     
     # TODO: Why not use this for all of the methods?
@@ -540,7 +961,8 @@ class Alpaca(ConnectorTemplate):
         if (order.qty != None):
             qty = float(order.qty)
         
-        return BaseOrderResult(
+        return BaseOrderResult.fromExchange(
+                self.options.trustedModels,
                 order_id            = str(order.id),
                 created_at          = order.created_at,
                 updated_at          = order.updated_at,
@@ -561,6 +983,7 @@ class Alpaca(ConnectorTemplate):
                 type                = OrderType(order.type),
                 time_in_force       = HermesTIF(order.time_in_force),
                 status              = HermesOrderStatus(order.status),
+                client_order_id     = order.client_order_id,
                 # Raw response as a json string
                 raw                 = jsonStr)
     
@@ -569,37 +992,97 @@ class Alpaca(ConnectorTemplate):
             raise UnexpectedOutputType
         return self._orderToModel(currentOrder)
 
+    @generalErrorHandlerDecorator
     def currentOrders(self) -> list[BaseOrderResult]:
+        orderStore = self._freshOrderStore()
+        if orderStore != None:
+            return orderStore.query(symbols=[self.options.tradingPair], statuses=OPEN_STATUSES, newestFirst=True)
+
         # Filter for open orders and orders of the current symbol only
         queryFilters = GetOrdersRequest(
             status=AlpacaTradingEnums.QueryOrderStatus.OPEN,
             symbols=[self.options.tradingPair])
 
         # Execute query
-        ordersList: Union[list[AlpacaOrder], AlpacaRawData] = self._tradingClient.get_orders(filter=queryFilters)
+        ordersList = self._ordersPage(queryFilters)
 
         # Iterate through and format them into models
         output: list[BaseOrderResult] = [self._formattedOrderListGenerator(currentOrder=currentOrder) for currentOrder in ordersList]
+        self._recordOrders(output)
 
         # Return formatted list
         return output
     
     @generalErrorHandlerDecorator
     def getAllOrders(self) -> list[BaseOrderResult]:
+        # Same as the default page of the broker, the latest 50 orders
+        orderStore = self._freshOrderStore()
+        if orderStore != None:
+            return orderStore.query(symbols=[self.options.tradingPair], limit=50, newestFirst=True)
+
         # Filter for open orders and orders of the current symbol only
         queryFilters = GetOrdersRequest(
             status=AlpacaTradingEnums.QueryOrderStatus.ALL,
             symbols=[self.options.tradingPair])
 
         # Execute query
-        ordersList: Union[list[AlpacaOrder], AlpacaRawData] = self._tradingClient.get_orders(filter=queryFilters)
+        ordersList = self._ordersPage(queryFilters)
 
         # Iterate through and format them into models
         output: list[BaseOrderResult] = [self._formattedOrderListGenerator(currentOrder=currentOrder) for currentOrder in ordersList]
+        self._recordOrders(output)
 
         # Return formatted list
         return output
     
+    @idempotentRequestDecorator
+    def _ordersPage(self, queryFilters: GetOrdersRequest) -> list[AlpacaOrder]:
+        ordersList = self._tradingClient.get_orders(filter=queryFilters)
+        if (isinstance(ordersList, Dict)):
+            raise UnexpectedOutputType
+        return ordersList # type: ignore
+
+    @generalErrorHandlerDecorator
+    def iterOrders(
+            self,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            status: OrderQueryStatus = OrderQueryStatus.ALL,
+            symbols: Optional[list[str]] = None,
+            batchSize: int = 500) -> Iterator[BaseOrderResult]:
+        # Pages are requested in ascending order of submission, each one starting after the last order of the previous one
+        # `after` is exclusive, so orders sharing the submission time of the last order could fall between two pages.
+        # The cursor is therefore moved back by a microsecond, and the orders already returned at that time are skipped.
+        # Those orders come first in the next page, which is enlarged by their number so it still holds `batchSize` new orders.
+        # The cursor only moves past a submission time once a page reaches beyond it, i.e. once all its orders were returned.
+        cursor = start
+        boundaryIds: set[str] = set()
+        while True:
+            limit = min(batchSize + len(boundaryIds), self._ordersPageLimit)
+            queryFilters = GetOrdersRequest(
+                status=AlpacaTradingEnums.QueryOrderStatus(status.value),
+                limit=limit,
+                after=cursor,
+                until=end,
+                direction=AlpacaSort.ASC,
+                symbols=symbols)
+            page = self._ordersPage(queryFilters)
+            batch = [self._orderToModel(order) for order in page if str(order.id) not in boundaryIds]
+            yield from batch
+
+            if len(page) < limit:
+                return
+            if len(batch) == 0:
+                # More orders share a single submission time than the largest page holds, the rest cannot be reached
+                raise UnexpectedOutputType
+            lastSubmitted = page[-1].submitted_at
+            pageBoundaryIds = {str(order.id) for order in page if order.submitted_at == lastSubmitted}
+            if (cursor != None) and (lastSubmitted == cursor + timedelta(microseconds=1)):
+                # Still at the same submission time as the previous page
+                pageBoundaryIds |= boundaryIds
+            cursor = lastSubmitted - timedelta(microseconds=1)
+            boundaryIds = pageBoundaryIds
+
     # TODO: Should this be a standard method for all connectors, instead of a private utility method?
     @generalErrorHandlerDecorator
     def _getAssetInfo(self, assetNameOrId) -> AlpacaAsset:
@@ -607,6 +1090,26 @@ class Alpaca(ConnectorTemplate):
         if (isinstance(output, Dict)):
             raise UnexpectedOutputType
         return output
+
+    def _assetConstraints(self, asset: AlpacaAsset) -> TradingConstraintsModel:
+        # Cryptocurrencies carry their limits and increments in the asset, stocks follow the rules of the US exchanges:
+        # prices in cents, or hundredths of a cent below a dollar, and fractional orders only as day orders
+        isEquity = (asset.asset_class == AlpacaTradingEnums.AssetClass.US_EQUITY)
+        return TradingConstraintsModel.fromExchange(
+            self.options.trustedModels,
+            symbol                  = asset.symbol,
+            tradable                = (asset.tradable and (asset.status == AlpacaTradingEnums.AssetStatus.ACTIVE)),
+            fractionable            = asset.fractionable,
+            minQty                  = asset.min_order_size,
+            maxQty                  = None,
+            qtyStep                 = asset.min_trade_increment,
+            minNotional             = None,
+            maxNotional             = None,
+            minPrice                = None,
+            maxPrice                = None,
+            priceStep               = (0.01 if isEquity else asset.price_increment),
+            subDollarPriceStep      = (0.0001 if isEquity else None),
+            fractionalTimeInForce   = ([HermesTIF.DAY] if isEquity else None))
     
     def _convertTimeFrame(
             self,
@@ -634,63 +1137,61 @@ class Alpaca(ConnectorTemplate):
         
         return tf
 
-    def _endDateConverter(self, startDate: datetime, tf: AlpacaTimeFrame):
-        endDate = None
-        offsetDelta = None
-        match tf.unit:
-            case AlpacaTimeFrameUnit.Hour:
-                offsetDelta = relativedelta(hours=tf.amount)
-            case AlpacaTimeFrameUnit.Minute:
-                offsetDelta = relativedelta(minutes=tf.amount)
-            case AlpacaTimeFrameUnit.Day:
-                offsetDelta = relativedelta(days=tf.amount)
-            case AlpacaTimeFrameUnit.Week:
-                offsetDelta = relativedelta(weeks=tf.amount)
-            case AlpacaTimeFrameUnit.Month:
-                offsetDelta = relativedelta(months=tf.amount)
-            case _:
-                raise UnsupportedParameterValue
-        
-        endDate = startDate + offsetDelta
-        if endDate != None:
-            return endDate
-        else:
-            raise UnexpectedOutputType
-    
-    def _rollingFuncCloseTimeConverter(self, startDate):
-        return self._endDateConverter(
-            startDate=startDate,
-            tf=self._requestAlpacaTimeFrame)
-    
-    @generalErrorHandlerDecorator
-    def historicData(self) -> DataFrame:
+    def _barColumns(self, bars: list[Bar], intervalMs: int) -> dict[str, np.ndarray]:
+        n = len(bars)
+        openTime = np.rint(np.fromiter((bar.timestamp.timestamp() for bar in bars), dtype=np.float64, count=n) * 1000).astype(np.int64)
+
+        # Generate closing times through the open times
+        # Problem: Alpaca doesn't return closing times. Thus, we need to take the opening times and add the offset of the candlestick
+        # The question: How should we infer the offset? We can either take the Timeframe parameter from the original request directly, or get the offset through the already existing data points (n, n-1).
+        # The n, n+1 appraoch fails in the edgecase when only a single candlestick is available
+        # Better solution: Instead of relying on other candlesticks, the Timeframe is used directly. Its length is precomputed, so the offset is a single vectorised addition.
+        # As with Binance, the close time is the last millisecond within the candlestick
+        return {
+            "openTime"      : openTime,
+            "open"          : np.fromiter((bar.open for bar in bars), dtype=np.float64, count=n),
+            "high"          : np.fromiter((bar.high for bar in bars), dtype=np.float64, count=n),
+            "low"           : np.fromiter((bar.low for bar in bars), dtype=np.float64, count=n),
+            "close"         : np.fromiter((bar.close for bar in bars), dtype=np.float64, count=n),
+            "volume"        : np.fromiter((bar.volume for bar in bars), dtype=np.float64, count=n),
+            "closeTime"     : openTime + (intervalMs - 1)
+        }
+
+    def _requestBars(
+            self,
+            symbols: Union[str, list[str]],
+            timeframe: AlpacaTimeFrame,
+            start: datetime,
+            end: Optional[datetime] = None,
+            limit: Optional[int] = None) -> AlpacaBarSet:
         rawBarsResponse: None | AlpacaBarSet | AlpacaRawData = None
-        reqStartDate = self._historicalDataStartDate
 
         # Construct and initiate data request
         # The asset classes are cheked through the match-case, so the type checker warning are suppressed.
         match self._assetClass:
             case AlpacaTradingEnums.AssetClass.US_EQUITY:
                 reqModel = StockBarsRequest(
-                    symbol_or_symbols=self.options.tradingPair,
-                    timeframe=self._requestAlpacaTimeFrame,
-                    start=reqStartDate,
-                    limit=int(self.options.limit))
+                    symbol_or_symbols=symbols,
+                    timeframe=timeframe,
+                    start=start,
+                    end=end,
+                    limit=limit)
                 rawBarsResponse = self._historicalDataClient.get_stock_bars(reqModel) # type: ignore
-                # Do something here
             case AlpacaTradingEnums.AssetClass.US_OPTION:
                 reqModel = OptionBarsRequest(
-                    symbol_or_symbols=self.options.tradingPair,
-                    timeframe=self._requestAlpacaTimeFrame,
-                    start=reqStartDate,
-                    limit=int(self.options.limit))
+                    symbol_or_symbols=symbols,
+                    timeframe=timeframe,
+                    start=start,
+                    end=end,
+                    limit=limit)
                 rawBarsResponse = self._historicalDataClient.get_option_bars(reqModel) # type: ignore
             case AlpacaTradingEnums.AssetClass.CRYPTO:
                 reqModel = CryptoBarsRequest(
-                    symbol_or_symbols=self.options.tradingPair,
-                    timeframe=self._requestAlpacaTimeFrame,
-                    start=reqStartDate,
-                    limit=int(self.options.limit))
+                    symbol_or_symbols=symbols,
+                    timeframe=timeframe,
+                    start=start,
+                    end=end,
+                    limit=limit)
                 rawBarsResponse = self._historicalDataClient.get_crypto_bars(reqModel) # type: ignore
             case _:
                 raise NonStandardInput
@@ -698,44 +1199,164 @@ class Alpaca(ConnectorTemplate):
         # Process the recieved data
         if (isinstance(rawBarsResponse, AlpacaBarSet) != True) or (isinstance(rawBarsResponse, Dict)):
             raise UnexpectedOutputType
-        
-        # Convert BarSet to a pandas DataFrame and process it
-        rawDataFrame: pd.DataFrame = rawBarsResponse.df
-        # Reset the `symbol` index
-        rawDataFrame.reset_index("symbol", inplace=True)
-        rawDataFrame.reset_index("timestamp", inplace=True)
-        # Drop the `symbol` column
-        rawDataFrame.drop("symbol", axis=1, inplace=True)
-
-        # Since we already have a DataFrame at hand, it would be pointless to create a new one.
-        # Instead, all the extra columns can be dropped, missing ones can be added, and the existing ones can be named properly.
-        # It seems like most of the columns are already there and named correctly anyways, with only the pChange column missing.
-
-        # Drop the extra columns
-        rawDataFrame.drop(["trade_count", "vwap"], axis=1, inplace=True)
-        # Rename columns
-        rawDataFrame.rename(columns={
-            "timestamp": "openTime"
-        }, inplace=True)
-        # Calculate percent change of the close prices
-        rawDataFrame["pChange"] = (rawDataFrame["close"].pct_change()) * 100
+        return rawBarsResponse # type: ignore
 
-        # Generate closing times through the open times
-        # Problem: Alpaca doesn't return closing times. Thus, we need to take the opening times and add the offset of the candlestick
-        # The question: How should we infer the offset? We can either take the Timeframe parameter from the original request directly, or get the offset through the already existing data points (n, n-1).
-        # The n, n+1 appraoch fails in the edgecase when only a single candlestick is available
-        # Better solution: Instead of relying on other candlesticks, inputting the Timeframe directly and then using that to generate a `relativedelta` seems to be the most sensible option.
-        rawDataFrame["closeTime"] = rawDataFrame["openTime"].apply(self._rollingFuncCloseTimeConverter)
-        
-        
+    @generalErrorHandlerDecorator
+    @idempotentRequestDecorator
+    def historicData(self) -> HistoricFrame:
+        rawBarsResponse = self._requestBars(
+            symbols=self.options.tradingPair,
+            timeframe=self._requestAlpacaTimeFrame,
+            start=self._historicalDataStartDate,
+            limit=int(self.options.limit))
         
-        return rawDataFrame
+        # The bars are turned into columns straight away, skipping `BarSet.df` and the copies made while reshaping it
+        bars: list[Bar] = rawBarsResponse.data.get(self.options.tradingPair, [])
+        columns = self._barColumns(bars, self.options.interval.durationMs)
+
+        return buildHistoricFrame(
+            columns=columns,
+            floatPrecision=self.options.floatPrecision,
+            outputFormat=self.options.outputFormat)
     
 
+    def _liveBarPeriodMs(self) -> int:
+        return self._liveBarPeriodNs // 1_000_000
+
+    @idempotentRequestDecorator
+    def _barsBetween(self, startTime: int, endTime: Optional[int] = None) -> dict[str, np.ndarray]:
+        # The live stream pushes minute bars, so the same ones are requested
+        rawBarsResponse = self._requestBars(
+            symbols=self.options.tradingPair,
+            timeframe=AlpacaTimeFrame(amount=1, unit=AlpacaTimeFrameUnit.Minute),
+            start=datetime.fromtimestamp(startTime / 1000, tz=timezone.utc),
+            end=(None if (endTime == None) else datetime.fromtimestamp((endTime - 1) / 1000, tz=timezone.utc)))
+        bars: list[Bar] = rawBarsResponse.data.get(self.options.tradingPair, [])
+        columns = self._barColumns(bars, self._liveBarPeriodMs())
+        keep = columns["openTime"] >= startTime
+        if endTime != None:
+            keep &= columns["openTime"] < endTime
+        return {name: column[keep] for name, column in columns.items()}
+
+    def _seedFrame(self) -> HistoricFrame:
+        # `historicData` holds bars of the interval, while the live stream pushes minute bars
+        limit = int(self.options.limit)
+        startTime = self._historicLookback(limit, self._liveBarPeriodMs())
+        columns = self._barsBetween(int(startTime.timestamp() * 1000))
+        return buildHistoricFrame(
+            columns={name: column[-limit:] for name, column in columns.items()},
+            floatPrecision=self.options.floatPrecision,
+            outputFormat=self.options.outputFormat,
+            copy=False)
+
+    def hasTradingSessions(self) -> bool:
+        # Only cryptocurrencies trade around the clock
+        return self._assetClass != AlpacaTradingEnums.AssetClass.CRYPTO
+
+    @generalErrorHandlerDecorator
+    @idempotentRequestDecorator
+    def historicDataMulti(
+            self,
+            timeframes: list[HermesTimeFrame],
+            alignment: Alignment = "utc") -> dict[HermesTimeFrame, HistoricFrame]:
+        # The finest timeframe is fetched once, every other one is aggregated from it locally
+        baseTimeFrame = min(timeframes, key=lambda tf: tf.durationMs)
+        baseMs = baseTimeFrame.durationMs
+        limit = int(self.options.limit)
+
+        # The range is sized for the coarsest timeframe, and the most recent candlesticks of each timeframe kept
+        # The lookback holds one extra coarse candlestick, as the oldest bucket is likely to be cut off
+        rawBarsResponse = self._requestBars(
+            symbols=self.options.tradingPair,
+            timeframe=self._convertTimeFrame(baseTimeFrame),
+            start=self._historicLookback(limit, max(tf.durationMs for tf in timeframes)))
+        bars: list[Bar] = rawBarsResponse.data.get(self.options.tradingPair, [])
+        baseColumns = self._barColumns(bars, baseMs)
+
+        output: dict[HermesTimeFrame, HistoricFrame] = {}
+        for timeframe in timeframes:
+            columns = baseColumns
+            if timeframe.durationMs != baseMs:
+                columns = resampleColumns(
+                    columns=baseColumns,
+                    baseTimeFrame=baseTimeFrame,
+                    targetTimeFrame=timeframe,
+                    alignment=alignment)
+            output[timeframe] = buildHistoricFrame(
+                columns={name: column[-limit:] for name, column in columns.items()},
+                floatPrecision=self.options.floatPrecision,
+                outputFormat=self.options.outputFormat)
+        return output
+
+    @idempotentRequestDecorator
+    def _requestSymbolBars(
+            self,
+            symbols: list[str],
+            start: datetime) -> dict[str, list[Bar]]:
+        # A batch of `historicDataMany`, retried on its own
+        return self._requestBars(
+            symbols=symbols,
+            timeframe=self._requestAlpacaTimeFrame,
+            start=start).data
+
+    def _historicLookback(self, limit: int, durationMs: Optional[int] = None) -> datetime:
+        # Start of a range expected to hold `limit` candlesticks of `durationMs` (the interval by default) up to now
+        # Stocks and options only have candlesticks while trading: intraday up to 6.5 regular hours a day, 5 days a week, and no holidays
+        if durationMs == None:
+            durationMs = self.options.interval.durationMs
+        span = timedelta(milliseconds=(limit + 1) * durationMs)
+        if self.hasTradingSessions():
+            if durationMs < 86_400_000:
+                span *= (24 / 6.5)
+            span = (span * (7 / 5) * 1.05) + timedelta(days=5)
+        return datetime.now(timezone.utc) - span
+
+    @generalErrorHandlerDecorator
+    def historicDataMany(
+            self,
+            symbols: list[str],
+            start: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            asDict: bool = False,
+            batchSize: int = 200) -> Union[HistoricFrame, dict[str, HistoricFrame]]:
+        symbols = list(dict.fromkeys(symbols))
+        if limit == None:
+            limit = int(self.options.limit)
+        if (batchSize < 1) or (limit < 1):
+            raise UnsupportedParameterValue
+        if start == None:
+            start = self._historicLookback(limit)
+
+        # The bars endpoint takes many symbols per request, and the limit of a request applies to all of its symbols together.
+        # The whole range is requested instead, and the most recent bars of each symbol kept.
+        durationMs = self.options.interval.durationMs
+        columnsBySymbol: dict[str, dict[str, np.ndarray]] = {}
+        for i in range(0, len(symbols), batchSize):
+            batch = symbols[i:i + batchSize]
+            barsBySymbol = self._requestSymbolBars(symbols=batch, start=start)
+            for symbol in batch:
+                columnsBySymbol[symbol] = self._barColumns(barsBySymbol.get(symbol, [])[-limit:], durationMs)
+
+        # The columns were built for these frames only, so the frames are built on them rather than on copies
+        if asDict:
+            return {
+                symbol: buildHistoricFrame(
+                    columns=columns,
+                    floatPrecision=self.options.floatPrecision,
+                    outputFormat=self.options.outputFormat,
+                    copy=False)
+                for symbol, columns in columnsBySymbol.items()}
+        return buildLongHistoricFrame(
+            columnsBySymbol=columnsBySymbol,
+            floatPrecision=self.options.floatPrecision,
+            outputFormat=self.options.outputFormat)
+
     @generalErrorHandlerDecorator
-    def initiateLiveData(self):
-        # Check if an handler was provided
-        if (self._wsClient == None):
+    def initiateLiveData(self, streamManager: Optional[AlpacaStreamManager] = None):
+        # Check if an handler, a bar publisher, or a tick subscription was provided
+        receivesBars = (self.options.dataHandler != None) or (self._barPublisher != None)
+        receivesTicks = len(self._tradeBuffers + self._quoteBuffers) > 0
+        if (receivesBars != True) and (receivesTicks != True):
             # Handler not found, raise an exception
             raise HandlerNonExistent
         
@@ -743,26 +1364,104 @@ class Alpaca(ConnectorTemplate):
         if (self._assetClass == AlpacaTradingEnums.AssetClass.US_OPTION):
             raise UnsupportedFeature
         
-        self._wsClient.subscribe_bars( # type: ignore
-            self.wsHandlerInternal, # type: ignore      # TODO: Raw data is not being recieved, the input type should be fine. However, the edge case should be handled in any case.
-            self.options.tradingPair)
+        # With a stream manager, the bars are received over its shared connection and the call does not block
+        # The ticks are only available over the connector's own stream
+        if streamManager != None:
+            self._streamManager = streamManager
+            if receivesBars:
+                streamManager.subscribe(self.options.tradingPair, self.wsHandlerInternal)
+            if receivesTicks != True:
+                return
+        elif receivesBars:
+            self._wsClient.subscribe_bars( # type: ignore
+                self.wsHandlerInternal, # type: ignore      # TODO: Raw data is not being recieved, the input type should be fine. However, the edge case should be handled in any case.
+                self.options.tradingPair)
         
         # Start WS client
         self._wsClient.run()
 
+    @generalErrorHandlerDecorator
+    def subscribeTrades(
+            self,
+            handler: TickBatchHandler,
+            batchSize: int = 256,
+            maxDelay: Optional[float] = 0.05) -> TradeBuffer:
+        buffer = TradeBuffer(handler=handler, batchSize=batchSize, maxDelay=maxDelay)
+        # The stream keeps a single handler per symbol, which feeds every buffer
+        if len(self._tradeBuffers) == 0:
+            self._wsClient.subscribe_trades(self._tradeHandlerInternal, self.options.tradingPair) # type: ignore
+        self._tradeBuffers = self._tradeBuffers + (buffer,)
+        return buffer
+
+    @generalErrorHandlerDecorator
+    def subscribeQuotes(
+            self,
+            handler: TickBatchHandler,
+            batchSize: int = 256,
+            maxDelay: Optional[float] = 0.05) -> QuoteBuffer:
+        buffer = QuoteBuffer(handler=handler, batchSize=batchSize, maxDelay=maxDelay)
+        if len(self._quoteBuffers) == 0:
+            self._wsClient.subscribe_quotes(self._quoteHandlerInternal, self.options.tradingPair) # type: ignore
+        self._quoteBuffers = self._quoteBuffers + (buffer,)
+        return buffer
+
+    @staticmethod
+    def _tickTimeNs(timestamp: datetime) -> int:
+        return int(timestamp.replace(tzinfo=timezone.utc).timestamp() * 1_000_000) * 1000
+
+    async def _tradeHandlerInternal(self, data: AlpacaTrade) -> None:
+        timeNs = self._tickTimeNs(data.timestamp)
+        for buffer in self._tradeBuffers:
+            buffer.append(timeNs, data.price, data.size)
+
+    async def _quoteHandlerInternal(self, data: AlpacaQuote) -> None:
+        timeNs = self._tickTimeNs(data.timestamp)
+        for buffer in self._quoteBuffers:
+            buffer.append(timeNs, data.bid_price, data.bid_size, data.ask_price, data.ask_size)
+
     
     @generalErrorHandlerDecorator
     async def wsHandlerInternal(self, data: Bar) -> None:
-        # Calculate epoch for the open time
-        openTimeEpoch = (data.timestamp.replace(tzinfo=timezone.utc).timestamp() * 1000)
-
-        # Calculate epoch for the close time        
-        closeTime = self._endDateConverter(
-            startDate=data.timestamp,
-            tf=self._requestAlpacaTimeFrame)
-        closeTimeEpoch = (closeTime.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        receiveTime = time.time_ns()
+
+        # While missed bars are recovered, the live bars received meanwhile wait for them, so the pipeline receives every bar in order
+        if self._gapBars != None:
+            self._gapBars.append((data, receiveTime))
+            return
+
+        # The recovery runs as a task, with the request made off the event loop, so the bars of the other symbols of a shared stream are not held up
+        openTimeEpoch = int(data.timestamp.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        if self._hasLiveGap(openTimeEpoch):
+            self._gapBars = [(data, receiveTime)]
+            self._gapRecovery = asyncio.get_running_loop().create_task(self._recoverLiveGap(openTimeEpoch))
+            return
+        self._handleLiveBar(data, receiveTime)
+
+    async def _recoverLiveGap(self, openTime: int) -> None:
+        # Replays the bars missed before `openTime`, then the live bars received meanwhile
+        # If the request fails, the gap is left as it is and the live bars are still dispatched
+        try:
+            columns = await asyncio.get_running_loop().run_in_executor(None, self._liveGapBars, openTime)
+            if columns != None:
+                self._replayBars(columns)
+        except Exception as err:
+            self._reportError(err)
+        finally:
+            bars = self._gapBars or []
+            self._gapBars = None
+            for bar, receiveTime in bars:
+                self._handleLiveBar(bar, receiveTime)
+
+    def _handleLiveBar(self, data: Bar, receiveTime: int) -> None:
+        parseStart = time.perf_counter_ns()
+
+        # Calculate epoch for the open and close times
+        openTimeEpoch = int(data.timestamp.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        # The stream pushes minute bars whatever the interval of the connector
+        closeTimeEpoch = openTimeEpoch + self._liveBarPeriodMs() - 1
         
-        formattedBar: LiveMarketData = LiveMarketData(
+        formattedBar: LiveMarketData = LiveMarketData.fromExchange(
+            self.options.trustedModels,
             openTime=openTimeEpoch,
             openPrice=data.open,
             highPrice=data.high,
@@ -770,12 +1469,18 @@ class Alpaca(ConnectorTemplate):
             closePrice=data.close,
             closeTime=closeTimeEpoch,
             volume=data.volume)
-        
+
         # Check the last recorded timestamp against the newly recieved one. If the newly recieved one is higher, a new candlestick had opened.
         candlestickOpened = False
         if (self._lastLiveTimestamp < openTimeEpoch):
             candlestickOpened = True
         self._lastLiveTimestamp = openTimeEpoch
         
-        if self.options.dataHandler != None:
-            self.options.dataHandler(data=formattedBar, closed=candlestickOpened)
\ No newline at end of file
+        # Alpaca's bar stream publishes minute bars once the minute is over, which is taken as the exchange event time
+        exchangeTime = (openTimeEpoch * 1_000_000) + self._liveBarPeriodNs
+        self._dispatchLiveData(
+            data=formattedBar,
+            closed=candlestickOpened,
+            exchangeTimeNs=exchangeTime,
+            receiveTimeNs=receiveTime,
+            parseStartNs=parseStart)
\ No newline at end of file
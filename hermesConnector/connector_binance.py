@@ -8,11 +8,22 @@
 # Import libraries
 from binance.spot import Spot
 from binance.websocket.spot.websocket_stream import SpotWebsocketStreamClient as WebSocketClient
-from binance.error import ClientError as BinanceClientError
+from binance.error import ClientError as BinanceClientError, ServerError as BinanceServerError
+from requests.exceptions import RequestException
 import pandas as pd
 from pandas import DataFrame, concat
 import numpy as np
 import json
+import time
+import threading
+from .latency import LatencyTracker
+from .data_utilities import buildHistoricFrame
+from .timeframe import TimeFrame
+from .tick_buffers import QuoteBuffer, TradeBuffer
+from .order_book import LocalOrderBook
+from .models import TradingConstraintsModel
+from .hermes_enums import OrderSide
+from .trading_constraints import ConstraintsCache, applyConstraints
 from .hermes_exceptions import  HermesBaseException, InsufficientParameters, UnknownGenericHermesException, GenericOrderError, InsufficientBalance
 
 
@@ -42,7 +53,10 @@ class Binance:
             limit=75,
             credentials=["", ""],
             columns=None,
-            wshandler=None):
+            wshandler=None,
+            floatPrecision="float64",
+            outputFormat="pandas",
+            orderConstraints="off"):
         
         if (credentials[0] == "" or credentials[1] == ""):
             raise InsufficientParameters
@@ -61,70 +75,102 @@ class Binance:
             self.clients["ws"] = WebSocketClient(on_message=self.wsHandlerInternal, stream_url=baseWsURL)
         self.options = {
             "tradingPair": tradingPair,
-            "interval": interval,
+            # Binance uses the same short notation as `str(TimeFrame)`, e.g. "1h"
+            "interval": str(interval) if isinstance(interval, TimeFrame) else interval,
             "limit": limit,
             "mode": mode,
             "handler": wshandler,
             "columns": columns,
-            "dataHandler": wshandler
+            "dataHandler": wshandler,
+            "floatPrecision": floatPrecision,
+            "outputFormat": outputFormat,
+            "orderConstraints": orderConstraints
         }
         self.orderCancellAllowStatus = ['NEW', 'PENDING_NEW', 'PARTIALLY_FILLED']
+        self._latencyTracker = LatencyTracker()
+
+        # Account state, kept per instance. The balances are indexed by asset.
+        self._baseWsURL = baseWsURL
+        self.accountData = {
+            "commissions": {
+                "maker": None,
+                "taker": None,
+                "buyer": None,
+                "seller": None,
+            },
+            "properties": {
+                "status": {
+                    "trade": None,
+                    "deposit": None,
+                    "withdraw": None,
+                },
+                "type": "SPOT",
+            },
+            "assets": {},
+        }
+        self._accountLock = threading.Lock()
+        self._balanceUpdateTimes = {}
+        self._listenKey = None
+        self._listenKeyStop = threading.Event()
+        self._listenKeyThread = None
+        self._listenKeyKeepaliveInterval = 30 * 60
+
+        # Tick buffers of the trade and quote subscriptions, fed by their own stream
+        self._tradeBuffers = ()
+        self._quoteBuffers = ()
+
+        # Local order books indexed by symbol, see `trackOrderBook`
+        self.orderBooks = {}
+        self._orderBookSnapshotLimit = 1000
+        # Time of the next snapshot request and the current backoff, by symbol, for the books whose last resync failed
+        self._orderBookRetries = {}
+
+        # Symbol filters of `exchangeInfo`, see `tradingConstraints`
+        self._constraintsCache = ConstraintsCache(loader=self._symbolConstraints)
 
     def stop(self):
-        self.clients['ws'].stop()
+        if 'ws' in self.clients:
+            self.clients['ws'].stop()
+        if 'tickWs' in self.clients:
+            self.clients['tickWs'].stop()
+        self.stopOrderBookTracking()
+        self.stopAccountTracking()
+        for buffer in self._tradeBuffers + self._quoteBuffers:
+            buffer.flush()
+
+    def latencyStats(self):
+        return self._latencyTracker.stats()
+
+    # Samples the exchange clock for the latency tracing clock offset estimation
+    def syncClock(self):
+        sendTime = time.time_ns()
+        serverTime = self.clients["spot"].time()["serverTime"]
+        receiveTime = time.time_ns()
+        self._latencyTracker.addClockSample(
+            localSendNs=sendTime,
+            exchangeTimeNs=(int(serverTime) * 1_000_000),
+            localReceiveNs=receiveTime)
     
     # Account endpoint. Used both for general account info and assests in hold
-    # TODO: Format the output
     # https://binance-connector.readthedocs.io/en/latest/binance.spot.trade.html#account-information-user-data
-    # The balance feature is only available for certain coins for development purposes
-    # TODO: This function has to be rethinked completely
-    accountData = {
-        "commissions": {
-            "maker": None,
-            "taker": None,
-            "buyer": None,
-            "seller": None,
-        },
-
-        "properties": {
-            "status": {
-                "trade": None,
-                "deposit": None,
-                "withdraw": None,
-            },
-            "type": "SPOT",
-        },
-
-        "assets": {
-            "BTC": {
-                "free": 0.00,
-                "locked": 0.00,
-            },
-            "ETH": {
-                "free": 0.00,
-                "locked": 0.00,
-            },
-            "XRP": {
-                "free": 0.00,
-                "locked": 0.00,
-            },
-            "USDT": {
-                "free": 0.00,
-                "locked": 0.00,
-            },
-        },
-    }
-    targetAssets = ["BTC", "ETH", "XRP", "USDT"]
+    # Every balance is indexed by its asset, the index is kept current by `trackAccount` afterwards
     def account(self):
         info = self.clients["spot"].account()
-
-        # Extract price info
-        # Extract balance information
-        assetsDataFrame = DataFrame(data=info["balances"])
-        for name in self.targetAssets:
-            currentAsset = assetsDataFrame.loc[assetsDataFrame['asset'] == name]
-            self.accountData['assets'][name]['free'] = float(currentAsset['free'].values[0])
-            self.accountData['assets'][name]['locked'] = float(currentAsset['locked'].values[0])
+        updateTime = int(info['updateTime'])
+
+        # Index the balances in a single pass
+        # Balances the user data stream updated after the response was taken are newer, they are kept
+        with self._accountLock:
+            assets = {
+                balance['asset']: {
+                    "free": float(balance['free']),
+                    "locked": float(balance['locked']),
+                } for balance in info["balances"]}
+            for asset, assetUpdateTime in self._balanceUpdateTimes.items():
+                if assetUpdateTime > updateTime:
+                    assets[asset] = self.accountData['assets'][asset]
+            self.accountData['assets'] = assets
+            self._balanceUpdateTimes = {asset: max(self._balanceUpdateTimes.get(asset, 0), updateTime) for asset in assets}
 
         # Extract commision rates
         self.accountData['commissions']['maker'] = float(info['commissionRates']['maker'])
@@ -138,7 +184,91 @@ class Binance:
         self.accountData['properties']['status']['withdraw'] = float(info['canWithdraw'])
 
         return self.accountData
-    
+
+    # Balance of a single asset from the index, zero for the assets that are not held
+    def balance(self, asset):
+        return self.accountData['assets'].get(asset, {"free": 0.0, "locked": 0.0})
+
+    # Value of all the held assets in `quoteAsset`, priced with a single request for all the tickers
+    # Assets without a direct market against the quote asset are left out
+    def portfolioValue(self, quoteAsset="USDT"):
+        prices = {ticker['symbol']: float(ticker['price']) for ticker in self.clients["spot"].ticker_price()}
+        value = 0.0
+        for asset, balance in list(self.accountData['assets'].items()):
+            total = balance['free'] + balance['locked']
+            if total == 0:
+                continue
+            if asset == quoteAsset:
+                value += total
+            elif (asset + quoteAsset) in prices:
+                value += total * prices[asset + quoteAsset]
+        return value
+
+    # Keeps the balance index current from the user data stream
+    # https://developers.binance.com/docs/binance-spot-api-docs/user-data-stream
+    # The stream is opened before the account is requested, so no update is missed in between, see `account`
+    def trackAccount(self):
+        if self._listenKey != None:
+            return self.accountData
+        self._listenKey = self.clients["spot"].new_listen_key()["listenKey"]
+        self.clients["userWs"] = WebSocketClient(on_message=self.userDataHandlerInternal, stream_url=self._baseWsURL)
+        self.clients["userWs"].user_data(listen_key=self._listenKey)
+
+        # The listen key expires after 60 minutes without a keepalive
+        self._listenKeyStop.clear()
+        self._listenKeyThread = threading.Thread(target=self._listenKeyKeepalive, daemon=True)
+        self._listenKeyThread.start()
+
+        try:
+            self.account()
+        except Exception:
+            self.stopAccountTracking()
+            raise
+        return self.accountData
+
+    def stopAccountTracking(self):
+        if self._listenKey == None:
+            return
+        self._listenKeyStop.set()
+        self._listenKeyThread = None
+        self.clients["userWs"].stop()
+        self.clients["spot"].close_listen_key(self._listenKey)
+        self._listenKey = None
+
+    def _listenKeyKeepalive(self):
+        while self._listenKeyStop.wait(self._listenKeyKeepaliveInterval) != True:
+            try:
+                self.clients["spot"].renew_listen_key(self._listenKey)
+            except Exception:
+                # Retried at the next interval, the key stays valid for a while longer
+                pass
+
+    # Called for every message of the user data stream, applies the balance events to the index
+    def userDataHandlerInternal(self, _, msg):
+        processed = json.loads(msg)
+        event = processed.get('e')
+        with self._accountLock:
+            assets = self.accountData['assets']
+            if event == 'outboundAccountPosition':
+                # Absolute balances of the changed assets
+                updateTime = int(processed['u'])
+                for balance in processed['B']:
+                    assets[balance['a']] = {
+                        "free": float(balance['f']),
+                        "locked": float(balance['l']),
+                    }
+                    self._balanceUpdateTimes[balance['a']] = updateTime
+            elif event == 'balanceUpdate':
+                # Deposits, withdrawals and transfers as a delta of the free balance
+                # A delta already covered by a newer absolute balance is skipped
+                asset = processed['a']
+                if int(processed['T']) <= self._balanceUpdateTimes.get(asset, 0):
+                    return
+                current = assets.get(asset, {"free": 0.0, "locked": 0.0})
+                assets[asset] = {
+                    "free": current['free'] + float(processed['d']),
+                    "locked": current['locked'],
+                }
 
     def rejectedOrderExceptionMatcher(self, errMsg: str) -> HermesBaseException:
         match errMsg:
@@ -159,8 +289,45 @@ class Binance:
             case _:
                 raise UnknownGenericHermesException
 
+    # Trading constraints, from the filters of the symbol. A filter value of 0 means the filter is disabled.
+    def _symbolConstraints(self, symbol):
+        symbolInfo = self.clients["spot"].exchange_info(symbol=symbol)["symbols"][0]
+        filters = {entry["filterType"]: entry for entry in symbolInfo["filters"]}
+
+        def filterValue(filterType, key):
+            value = float(filters.get(filterType, {}).get(key, 0))
+            return value if (value > 0) else None
+
+        # Newer symbols carry NOTIONAL, older ones MIN_NOTIONAL
+        minNotional = filterValue("NOTIONAL", "minNotional")
+        if minNotional == None:
+            minNotional = filterValue("MIN_NOTIONAL", "minNotional")
+        return TradingConstraintsModel(
+            symbol=symbolInfo["symbol"],
+            tradable=((symbolInfo["status"] == "TRADING") and symbolInfo.get("isSpotTradingAllowed", True)),
+            fractionable=True,
+            minQty=filterValue("LOT_SIZE", "minQty"),
+            maxQty=filterValue("LOT_SIZE", "maxQty"),
+            qtyStep=filterValue("LOT_SIZE", "stepSize"),
+            minNotional=minNotional,
+            maxNotional=filterValue("NOTIONAL", "maxNotional"),
+            minPrice=filterValue("PRICE_FILTER", "minPrice"),
+            maxPrice=filterValue("PRICE_FILTER", "maxPrice"),
+            priceStep=filterValue("PRICE_FILTER", "tickSize"))
+
+    def tradingConstraints(self, symbol=None, forceRefresh=False):
+        return self._constraintsCache.get(self.options["tradingPair"] if (symbol == None) else symbol, forceRefresh)
+
+    # Checks the order against the constraints of the trading pair according to the `orderConstraints` option, returns the quantity, cost and price to be sent
+    def _constrainOrder(self, side, quantity=None, cost=None, price=None):
+        if self.options["orderConstraints"] == "off":
+            return quantity, cost, price
+        # Binance has no time in force constraints
+        return applyConstraints(self.tradingConstraints(), self.options["orderConstraints"], side, None, quantity, cost, price)
+
     # Market order functions
     def buy(self, quantity):
+        quantity, _, _ = self._constrainOrder(OrderSide.BUY, quantity=quantity)
         try:
             result = self.clients["spot"].new_order(symbol=self.options["tradingPair"], side="BUY", type="MARKET", quantity=quantity)
             # Step 2: If no errors were detected, construct a generalised Hermes response
@@ -171,6 +338,7 @@ class Binance:
 
     
     def sell(self, quantity):
+        quantity, _, _ = self._constrainOrder(OrderSide.SELL, quantity=quantity)
         try:
             result = self.clients["spot"].new_order(symbol=self.options["tradingPair"], side="SELL", type="MARKET", quantity=quantity)
             return result
@@ -179,6 +347,7 @@ class Binance:
     
     # Entry cost based market orders
     def costBuy(self, cost: float):
+        _, cost, _ = self._constrainOrder(OrderSide.BUY, cost=cost)
         try:
             result = self.clients["spot"].new_order(
                 symbol=self.options["tradingPair"],
@@ -190,6 +359,7 @@ class Binance:
             self.orderRequestResultHandler(err.error_code, err.error_message)
 
     def costSell(self, cost: float):
+        _, cost, _ = self._constrainOrder(OrderSide.SELL, cost=cost)
         try:
             result = self.clients["spot"].new_order(
                 symbol=self.options["tradingPair"],
@@ -202,6 +372,7 @@ class Binance:
     
     # Limit order functions
     def buyLimit(self, quantity, price):
+        quantity, _, price = self._constrainOrder(OrderSide.BUY, quantity=quantity, price=price)
         try:
             result = self.clients["spot"].new_order(
                 symbol=self.options["tradingPair"],
@@ -218,6 +389,7 @@ class Binance:
             self.orderRequestResultHandler(err.error_code, err.error_message)
 
     def sellLimit(self, quantity, price):
+        quantity, _, price = self._constrainOrder(OrderSide.SELL, quantity=quantity, price=price)
         try:
             result = self.clients["spot"].new_order(
                 symbol=self.options["tradingPair"],
@@ -260,6 +432,50 @@ class Binance:
         result = self.clients['spot'].get_orders(symbol=self.options['tradingPair'])
         return result
 
+    # Lazily walks the whole order history, oldest first, one page at a time
+    # `status` is one of "open", "closed", or "all", the orders are returned as raw responses
+    def iterOrders(self, start=None, end=None, status="all", symbols=None, batchSize=1000):
+        startTime = None if (start == None) else int(start.timestamp() * 1000)
+        endTime = None if (end == None) else int(end.timestamp() * 1000)
+        for symbol in (symbols or [self.options['tradingPair']]):
+            for order in self._iterSymbolOrders(symbol, startTime, endTime, batchSize):
+                isOpen = order['status'] in self.orderCancellAllowStatus
+                if (status == "all") or ((status == "open") == isOpen):
+                    yield order
+
+    # allOrders only accepts a time window of 24 hours, and every request weighs 20 against the rate limit.
+    # The first page of the order ID cursor doubles as a probe: if it ends before the start time, the orders from the start time on are located with time windows.
+    # At most `_maxOrderWindows` windows are walked, past them the cursor carries on from the probe instead, skipping the orders before the start time.
+    _ordersWindowMs = 24 * 60 * 60 * 1000
+    _maxOrderWindows = 30
+
+    def _iterSymbolOrders(self, symbol, startTime, endTime, batchSize):
+        spot = self.clients['spot']
+        page = spot.get_orders(symbol=symbol, limit=batchSize, orderId=0)
+        if (startTime != None) and (len(page) == batchSize) and (page[-1]['time'] < startTime):
+            windowStart = startTime
+            lastTime = endTime if (endTime != None) else int(time.time() * 1000)
+            for _ in range(self._maxOrderWindows):
+                if windowStart > lastTime:
+                    return
+                windowEnd = min(windowStart + self._ordersWindowMs - 1, lastTime)
+                windowPage = spot.get_orders(symbol=symbol, limit=batchSize, startTime=windowStart, endTime=windowEnd)
+                if len(windowPage) > 0:
+                    # The orders of the window come first in the order ID cursor as well
+                    page = spot.get_orders(symbol=symbol, limit=batchSize, orderId=windowPage[0]['orderId'])
+                    break
+                windowStart = windowEnd + 1
+        while True:
+            for order in page:
+                if (startTime != None) and (order['time'] < startTime):
+                    continue
+                if (endTime != None) and (order['time'] > endTime):
+                    return
+                yield order
+            if len(page) < batchSize:
+                return
+            page = spot.get_orders(symbol=symbol, limit=batchSize, orderId=(page[-1]['orderId'] + 1))
+
 
     # Data functions
 
@@ -269,35 +485,25 @@ class Binance:
     def historicData(self):
         kLine = self.clients["spot"].klines(symbol=self.options["tradingPair"], interval=self.options["interval"], limit=self.options["limit"])
 
-        # Core columns
-        coreColumns = ["openTime", "open", "high", "low", "close", "closeTime", "volume", "pChange"]
-
-        # Column data made into a dictionary to be converted into a pandas DataFrame
-        columnsData = {}
-        for columnName in coreColumns:
-            columnsData[columnName] = []
-
-        # Extract the core information
+        # Extract the core information straight into columns
         # Not all the information from the API is extracted. Other available parameters are:
         # [quote asset volume, number of trades, taker buy base asset volume, taker buy quote asset volume, unused]
-        for candle in kLine:
-            columnsData["openTime"].append(int(candle[0]))
-            columnsData["open"].append(float(candle[1]))
-            columnsData["high"].append(float(candle[2]))
-            columnsData["low"].append(float(candle[3]))
-            columnsData["close"].append(float(candle[4]))
-            columnsData["volume"].append(float(candle[5]))
-            columnsData["closeTime"].append(int(candle[6]))
-            columnsData["pChange"].append(np.nan)
-
-        # Turn the data into a pandas DataFrame
-        result = DataFrame(data=columnsData)
-
-        # Calculate percentage change
-        # Due to the usage of pChange in indicator calculations, it is part of the price DataFrame even though it has to be calculated
-        result["pChange"] = (result["close"].pct_change()) * 100
+        # Due to the usage of pChange in indicator calculations, it is part of the price data even though it has to be calculated. It is computed while building the frame.
+        n = len(kLine)
+        columnsData = {
+            "openTime"      : np.fromiter((candle[0] for candle in kLine), dtype=np.int64, count=n),
+            "open"          : np.fromiter((candle[1] for candle in kLine), dtype=np.float64, count=n),
+            "high"          : np.fromiter((candle[2] for candle in kLine), dtype=np.float64, count=n),
+            "low"           : np.fromiter((candle[3] for candle in kLine), dtype=np.float64, count=n),
+            "close"         : np.fromiter((candle[4] for candle in kLine), dtype=np.float64, count=n),
+            "volume"        : np.fromiter((candle[5] for candle in kLine), dtype=np.float64, count=n),
+            "closeTime"     : np.fromiter((candle[6] for candle in kLine), dtype=np.int64, count=n),
+        }
 
-        return result
+        return buildHistoricFrame(
+            columns=columnsData,
+            floatPrecision=self.options["floatPrecision"],
+            outputFormat=self.options["outputFormat"])
     
     # Sets a websocket connection and outputs an array with the live price update.
     # ^ Test the callback idea first.
@@ -310,6 +516,9 @@ class Binance:
     # Array format: [openTime, open, high, low, close, closeTime, volume].
     # The neccesarry calculation will be done under class_data.
     def wsHandlerInternal(self, _, msg):
+        receiveTime = time.time_ns()
+        parseStart = time.perf_counter_ns()
+
         # Process the msg into JSON
         processed = json.loads(msg)
 
@@ -329,5 +538,115 @@ class Binance:
                     float(kline['v']),
                     0.0]
         
+        handlerStart = time.perf_counter_ns()
         self.options['dataHandler'](data=klineArr, closed=kline['x'])
-
+        handlerEnd = time.perf_counter_ns()
+
+        self._latencyTracker.record(
+            exchangeTimeNs=(int(processed['E']) * 1_000_000),
+            receiveTimeNs=receiveTime,
+            parseDurationNs=(handlerStart - parseStart),
+            handlerDurationNs=(handlerEnd - handlerStart))
+
+    # Tick streams, collected in columnar buffers and delivered to the handler in batches, see `TickBuffer`
+    # https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams#trade-streams
+    def subscribeTrades(self, handler, batchSize=256, maxDelay=0.05):
+        buffer = TradeBuffer(handler=handler, batchSize=batchSize, maxDelay=maxDelay)
+        if len(self._tradeBuffers) == 0:
+            self._tickStream().trade(symbol=self.options['tradingPair'])
+        self._tradeBuffers = self._tradeBuffers + (buffer,)
+        return buffer
+
+    # https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams#individual-symbol-book-ticker-streams
+    def subscribeQuotes(self, handler, batchSize=256, maxDelay=0.05):
+        buffer = QuoteBuffer(handler=handler, batchSize=batchSize, maxDelay=maxDelay)
+        if len(self._quoteBuffers) == 0:
+            self._tickStream().book_ticker(symbol=self.options['tradingPair'])
+        self._quoteBuffers = self._quoteBuffers + (buffer,)
+        return buffer
+
+    def _tickStream(self):
+        if 'tickWs' not in self.clients:
+            self.clients['tickWs'] = WebSocketClient(on_message=self.tickHandlerInternal, stream_url=self._baseWsURL)
+        return self.clients['tickWs']
+
+    # Called for every message of the tick stream
+    def tickHandlerInternal(self, _, msg):
+        processed = json.loads(msg)
+        if processed.get('e') == 'trade':
+            tradeTime = int(processed['T']) * 1_000_000
+            price = float(processed['p'])
+            size = float(processed['q'])
+            for buffer in self._tradeBuffers:
+                buffer.append(tradeTime, price, size)
+        elif 'u' in processed:
+            # Book ticker updates carry no time, the receive time is used instead
+            receiveTime = time.time_ns()
+            bidPrice = float(processed['b'])
+            bidSize = float(processed['B'])
+            askPrice = float(processed['a'])
+            askSize = float(processed['A'])
+            for buffer in self._quoteBuffers:
+                buffer.append(receiveTime, bidPrice, bidSize, askPrice, askSize)
+
+    # Keeps a local order book of the symbol from a depth snapshot and the diff depth stream
+    # https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams#how-to-manage-a-local-order-book-correctly
+    def trackOrderBook(self, symbol=None, speed=100, snapshotLimit=1000):
+        # The stream reports the symbols in upper case
+        symbol = (self.options['tradingPair'] if symbol == None else symbol).upper()
+        if symbol in self.orderBooks:
+            return self.orderBooks[symbol]
+        book = LocalOrderBook(symbol)
+        self.orderBooks[symbol] = book
+        self._orderBookSnapshotLimit = snapshotLimit
+
+        # The stream is opened before the snapshot is requested, the book buffers the updates in between
+        if 'depthWs' not in self.clients:
+            self.clients['depthWs'] = WebSocketClient(on_message=self.depthHandlerInternal, stream_url=self._baseWsURL)
+        self.clients['depthWs'].diff_book_depth(symbol=symbol, speed=speed)
+        self._syncOrderBook(book)
+        return book
+
+    def stopOrderBookTracking(self):
+        if 'depthWs' in self.clients:
+            self.clients['depthWs'].stop()
+            del self.clients['depthWs']
+        self.orderBooks = {}
+        self._orderBookRetries = {}
+
+    # Seconds before a failed resync is tried again, doubled after every failure up to the maximum
+    _orderBookRetryDelay = 1.0
+    _orderBookMaxRetryDelay = 60.0
+
+    # Requests snapshots until one is recent enough to continue the buffered updates
+    # If the requests fail or every snapshot is too old, the depth handler tries again after a backoff
+    def _syncOrderBook(self, book, attempts=5):
+        symbol = book.symbol
+        for _ in range(attempts):
+            try:
+                snapshot = self.clients["spot"].depth(symbol, limit=self._orderBookSnapshotLimit)
+            except (BinanceClientError, BinanceServerError, RequestException) as err:
+                print(f"[HermesConnector - WARNING]: The order book snapshot of {symbol} could not be requested: {err}")
+                break
+            if book.applySnapshot(int(snapshot['lastUpdateId']), snapshot['bids'], snapshot['asks']):
+                self._orderBookRetries.pop(symbol, None)
+                return True
+        previous = self._orderBookRetries.get(symbol)
+        delay = self._orderBookRetryDelay if (previous == None) else min(previous[1] * 2, self._orderBookMaxRetryDelay)
+        self._orderBookRetries[symbol] = (time.monotonic() + delay, delay)
+        return False
+
+    # Called for every message of the depth stream
+    def depthHandlerInternal(self, _, msg):
+        processed = json.loads(msg)
+        if processed.get('e') != 'depthUpdate':
+            return
+        book = self.orderBooks.get(processed['s'])
+        if book == None:
+            return
+        inSync = book.applyUpdate(int(processed['U']), int(processed['u']), processed['b'], processed['a'])
+        retry = self._orderBookRetries.get(book.symbol)
+        if (inSync != True) or ((retry != None) and (time.monotonic() >= retry[0])):
+            # An update was missed or the last resync failed, the book is rebuilt from a new snapshot
+            # The stream waits for this handler, so no update is lost in the meantime
+            self._syncOrderBook(book)
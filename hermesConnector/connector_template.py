@@ -2,14 +2,31 @@
 
 
 from abc import ABC, abstractmethod
+import time
+import numpy as np
 
 from pandas import DataFrame
-from hermesConnector.hermes_exceptions import InsufficientParameters
+from hermesConnector.hermes_exceptions import InsufficientParameters, UnsupportedFeature
+from hermesConnector.hermes_enums import OrderQueryStatus, OrderSide, OrderType, TimeInForce
 from datetime import datetime
 import typing_extensions as typing
-from typing import Optional, Any, Callable, Union
+from typing import Iterator, Optional, Any, Callable, Union
 
-from hermesConnector.models import BaseOrderResult, ClockReturnModel, LimitOrderBaseParams, LimitOrderResult, MarketOrderNotionalParams, MarketOrderQtyParams, MarketOrderResult
+from hermesConnector.models import AccountModel, PositionModel, BaseOrderResult, OrderBaseParams, ClockReturnModel, LatencyStatsModel, LimitOrderBaseParams, LiveMarketData, LimitOrderResult, MarketOrderNotionalParams, MarketOrderQtyParams, MarketOrderResult, TradingConstraintsModel
+from hermesConnector.latency import LatencyTracker
+from hermesConnector.retry import RetryPolicy
+from hermesConnector.shared_bars import SharedBarRing
+from hermesConnector.indicators import IndicatorEngine
+from hermesConnector.scheduler import LiveDataScheduler
+from hermesConnector.account_snapshot import AccountSnapshot
+from hermesConnector.order_store import OrderStore
+from hermesConnector.journal import EventJournal, JournalReader
+from hermesConnector.trading_constraints import ConstraintMode, ConstraintsCache, applyConstraints
+from hermesConnector.tick_buffers import QuoteBuffer, TickBatchHandler, TradeBuffer
+from hermesConnector.fast_orders import FastOrderResult
+from hermesConnector.data_utilities import FloatPrecision, HistoricFrame, OutputFormat
+from hermesConnector.resample import Alignment
+from pydantic import field_validator
 from hermesConnector.models_utilities import HermesBaseModel
 from hermesConnector.timeframe import TimeFrame
 
@@ -22,10 +39,31 @@ class ConnectorOptions(HermesBaseModel):
     columns             : Optional[Any]
     dataHandler         : Optional[Callable]
     credentials         : list
+    retryPolicy         : Optional[RetryPolicy] = None
+    floatPrecision      : FloatPrecision = "float64"
+    outputFormat        : OutputFormat = "pandas"
+    clockTtl            : Optional[float] = 60.0
+    # Construct the models of exchange data without validation, `None` to follow `setTrustedMode`
+    trustedModels       : Optional[bool] = None
+    # Local checks of the orders against the trading constraints of the asset, see `ConstraintMode`
+    orderConstraints    : ConstraintMode = "off"
+    # Called with the errors of background work, such as the recovery of missed live bars, see `lastError`
+    errorHandler        : Optional[Callable[[Exception], None]] = None
+
+    @field_validator("interval", mode="before")
+    @classmethod
+    def _parseInterval(cls, value):
+        # Allow the short notation, e.g. "1h", in place of a TimeFrame
+        if isinstance(value, str):
+            return TimeFrame.parse(value)
+        return value
 
 
 class ConnectorTemplate(ABC):
 
+    # Smallest number of missing live bars recovered from the historical data, see `_hasLiveGap`
+    _liveGapMinBars: int = 5
+
     def __init__(
             self,
             tradingPair,
@@ -34,7 +72,14 @@ class ConnectorTemplate(ABC):
             limit=75,
             credentials=["", ""],
             columns=None,
-            wshandler=None):
+            wshandler=None,
+            retryPolicy=None,
+            floatPrecision="float64",
+            outputFormat="pandas",
+            clockTtl=60.0,
+            trustedModels=None,
+            orderConstraints="off",
+            errorHandler=None):
         
         # Check if the credentials were provided
         if (credentials[0] == "" or credentials[1] == ""):
@@ -48,16 +93,51 @@ class ConnectorTemplate(ABC):
             mode=mode,
             columns=columns,
             dataHandler=wshandler,
-            credentials=credentials)
+            credentials=credentials,
+            retryPolicy=retryPolicy,
+            floatPrecision=floatPrecision,
+            outputFormat=outputFormat,
+            clockTtl=clockTtl,
+            trustedModels=trustedModels,
+            orderConstraints=orderConstraints,
+            errorHandler=errorHandler)
+
+        # Last error of the background work, which has no caller to raise it to
+        self.lastError: Optional[Exception] = None
+        
+        # Latency tracing of the live data
+        self._latencyTracker = LatencyTracker()
+
+        # Shared memory ring the live bars are published into, see `publishBars`
+        self._barPublisher: Optional[SharedBarRing] = None
+
+        # Incremental indicators updated by the live data, see `attachIndicators`
+        self._indicatorEngine: Optional[IndicatorEngine] = None
+
+        # Local order history, see `attachOrderStore`
+        self._orderStore: Optional[OrderStore] = None
+        self._orderStoreMaxStaleness = 0.0
+
+        # Event journal of the live bars and orders, see `attachJournal`
+        self._journal: Optional[EventJournal] = None
+
+        # Trading constraints of the assets, set up by the connectors that support them
+        self._constraintsCache: Optional[ConstraintsCache] = None
+
+        # Open time of the last live bar in epoch milliseconds, 0 before any live data was received
+        self._lastLiveTimestamp = 0
 
     @abstractmethod
-    def exchangeClock(self) -> ClockReturnModel:
+    def exchangeClock(self, forceRefresh: bool = False) -> ClockReturnModel:
         """
             Returns the current clock and exchagne clock.
+
+            The clock is cached and extrapolated locally, it is only requested from the exchange at session boundaries, once the `clockTtl` connector option expired, or if `forceRefresh` is set.
             
             Parameters
             ----------
-                None
+                forceRefresh: bool
+                    Request the clock from the exchange regardless of the cached one.
             
             Returns
             -------
@@ -66,10 +146,423 @@ class ConnectorTemplate(ABC):
         """
         pass
 
+    def latencyStats(self) -> LatencyStatsModel:
+        """
+            Returns rolling percentile statistics of the live data latency, split into the feed (exchange to local receive), parsing, and `dataHandler` segments.
+
+            Returns
+            -------
+                LatencyStatsModel
+                    Latency statistics in milliseconds as a HermesBaseModel.
+        """
+        return self._latencyTracker.stats()
+
+    def publishBars(
+            self,
+            name: str,
+            capacity: int = 4096) -> SharedBarRing:
+        """
+            Switches the connector into publisher mode: every live bar is written into a shared memory ring which other processes can read through `SharedBarRing.attach(name)`.
+
+            Parameters
+            ----------
+                name: str
+                    Name of the shared memory block.
+                capacity: int
+                    Number of bars kept in the ring.
+
+            Returns
+            -------
+                SharedBarRing
+                    Publisher handle of the ring. Call `unlink` on it once the readers are done.
+        """
+        self._barPublisher = SharedBarRing.create(name=name, capacity=capacity)
+        return self._barPublisher
+
+    def attachIndicators(
+            self,
+            engine: IndicatorEngine,
+            seed: bool = True) -> IndicatorEngine:
+        """
+            Attaches an incremental indicator engine to the live data. The engine is updated with every live bar before the `dataHandler` is called, so the handler can read the current values from it.
+
+            Parameters
+            ----------
+                engine: IndicatorEngine
+                    The indicator engine to be attached.
+                seed: bool
+                    If `True`, the indicators are seeded first from the most recent bars in the period of the live bars.
+
+            Returns
+            -------
+                IndicatorEngine
+                    The attached engine.
+        """
+        if seed:
+            engine.seed(self._seedFrame())
+        self._indicatorEngine = engine
+        return engine
+
+    def attachOrderStore(
+            self,
+            store: OrderStore,
+            maxStaleness: float = 5.0,
+            sync: bool = True) -> OrderStore:
+        """
+            Attaches a local order store. Every order returned by the connector is recorded in it, and `queryOrder`, `queryOrderByClientId`, `getAllOrders` and `currentOrders` are served from it as long as it was synced within `maxStaleness` seconds.
+
+            Parameters
+            ----------
+                store: OrderStore
+                    The order store to be attached.
+                maxStaleness: float
+                    Seconds after the last sync the store is still served from.
+                sync: bool
+                    If `True`, the store is synced right away.
+
+            Returns
+            -------
+                OrderStore
+                    The attached store.
+        """
+        self._orderStore = store
+        self._orderStoreMaxStaleness = maxStaleness
+        if sync:
+            store.sync(self)
+        return store
+
+    def syncOrders(self) -> int:
+        """
+            Incrementally syncs the attached order store, see `OrderStore.sync`. Returns the number of orders received.
+        """
+        if self._orderStore == None:
+            return 0
+        return self._orderStore.sync(self)
+
+    def _freshOrderStore(self) -> Optional[OrderStore]:
+        # The attached order store, if it is fresh enough to be served from
+        if (self._orderStore != None) and self._orderStore.isFresh(self._orderStoreMaxStaleness):
+            return self._orderStore
+        return None
+
+    def _recordOrders(self, orders: list[BaseOrderResult]) -> None:
+        if self._orderStore != None:
+            self._orderStore.upsert(orders)
+        if self._journal != None:
+            self._journal.appendOrders(orders)
+
+    def attachJournal(self, journal: EventJournal) -> EventJournal:
+        """
+            Attaches an event journal. Every live bar, order submission, order result and cancellation of the connector is appended to it.
+
+            Parameters
+            ----------
+                journal: EventJournal
+                    The journal to be attached.
+
+            Returns
+            -------
+                EventJournal
+                    The attached journal.
+        """
+        self._journal = journal
+        return journal
+
+    def _journalSubmission(self, params: OrderBaseParams, clientOrderId: Optional[str]) -> None:
+        # Called right before an order is submitted, with the client order ID it is submitted under
+        if self._journal != None:
+            self._journal.appendSubmission(params.model_copy(update={"clientOrderId": clientOrderId}))
+
+    def _journalCancel(self, orderId: str) -> None:
+        if self._journal != None:
+            self._journal.appendCancel(orderId)
+
+    def replayJournal(
+            self,
+            reader: JournalReader,
+            bars: bool = True,
+            orders: bool = True) -> int:
+        """
+            Restores the state of the connector from a journal, e.g. after a crash, instead of requesting it from the exchange. Call it before `initiateLiveData`.
+
+            The latest version of every journaled order is recorded in the attached order store, if there is one, and the journaled bars are replayed through the live data pipeline in order, each with the values of its last update. The replayed events are not journaled again. Afterwards, `backfillLiveData` only requests the bars published since the journal ended.
+
+            Parameters
+            ----------
+                reader: JournalReader
+                    Reader of the journal.
+                bars: bool
+                    Replay the bars.
+                orders: bool
+                    Restore the orders into the order store.
+
+            Returns
+            -------
+                int
+                    Number of replayed bars.
+        """
+        journal = self._journal
+        self._journal = None
+        try:
+            if orders and (self._orderStore != None):
+                self._orderStore.upsert(list(reader.latestOrders().values()))
+            if bars != True:
+                return 0
+            return self._replayBars(reader.barColumns())
+        finally:
+            self._journal = journal
+
+    def tradingConstraints(self, symbol: Optional[str] = None, forceRefresh: bool = False) -> TradingConstraintsModel:
+        """
+            Returns the trading constraints of an asset: fractionability, quantity, price and order value limits, lot and tick sizes. The constraints are cached, and only requested from the exchange once they expired or if `forceRefresh` is set.
+
+            Parameters
+            ----------
+                symbol: Optional[str]
+                    Symbol of the asset, the trading pair of the connector if `None`.
+                forceRefresh: bool
+                    Request the constraints from the exchange regardless of the cached ones.
+
+            Returns
+            -------
+                TradingConstraintsModel
+                    Trading constraints of the asset as a HermesBaseModel.
+        """
+        if self._constraintsCache == None:
+            raise UnsupportedFeature
+        return self._constraintsCache.get((self.options.tradingPair if (symbol == None) else symbol), forceRefresh)
+
+    def _constrainOrder(
+            self,
+            side: OrderSide,
+            tif: TimeInForce,
+            qty: Optional[float] = None,
+            cost: Optional[float] = None,
+            limitPrice: Optional[float] = None) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        # Checks an order of the trading pair against its constraints according to the `orderConstraints` option, see `applyConstraints`
+        if (self.options.orderConstraints == "off") or (self._constraintsCache == None):
+            return qty, cost, limitPrice
+        return applyConstraints(
+            self._constraintsCache.get(self.options.tradingPair),
+            self.options.orderConstraints,
+            side, tif, qty, cost, limitPrice)
+
+    def _constrainParams(self, params: OrderBaseParams) -> OrderBaseParams:
+        # `_constrainOrder` for the order parameter models, returns the parameters with the rounded values
+        original = (getattr(params, "qty", None), getattr(params, "cost", None), getattr(params, "limitPrice", None))
+        constrained = self._constrainOrder(params.side, params.tif, *original)
+        if constrained == original:
+            return params
+        return params.model_copy(update={name: value for name, value in zip(["qty", "cost", "limitPrice"], constrained) if value != None})
+
+    def hasTradingSessions(self) -> bool:
+        """
+            Returns `True` if the asset only trades during the sessions of the exchange clock, `False` if it trades around the clock.
+        """
+        return True
+
+    def scheduleLiveData(
+            self,
+            preOpen: float = 300.0,
+            postClose: float = 60.0,
+            extendedHours: bool = False,
+            backfill: bool = True) -> LiveDataScheduler:
+        """
+            Runs the live data only while the market is trading, instead of keeping it connected around the clock as `initiateLiveData` does. See `LiveDataScheduler`.
+
+            Parameters
+            ----------
+                preOpen: float
+                    Seconds before the open to connect at.
+                postClose: float
+                    Seconds after the close to disconnect at.
+                extendedHours: bool
+                    Also cover the pre-market and after hours sessions.
+                backfill: bool
+                    Replay the bars missed while disconnected on reconnect.
+
+            Returns
+            -------
+                LiveDataScheduler
+                    The started scheduler. Call `stop` on it to disconnect.
+        """
+        scheduler = LiveDataScheduler(
+            connector=self,
+            preOpen=preOpen,
+            postClose=postClose,
+            extendedHours=extendedHours,
+            backfill=backfill,
+            onError=self._reportError)
+        return scheduler.start()
+
+    def _liveBarPeriodMs(self) -> int:
+        # Expected spacing of the live bars in milliseconds, the connector's interval unless the live data uses a fixed period
+        return self.options.interval.durationMs
+
+    def _seedFrame(self) -> HistoricFrame:
+        # The most recent bars in the period of the live bars, the indicators are seeded from
+        # Connectors whose live bars differ from `historicData` in period or range should override this
+        return self.historicData()
+
+    def _barsBetween(self, startTime: int, endTime: Optional[int] = None) -> dict[str, np.ndarray]:
+        # Bars opened within [startTime, endTime) (epoch milliseconds) as columns, in the same period as the live bars
+        # Connectors with a ranged request should override this
+        frame = self.historicData()
+        columns = {name: np.asarray(frame[name]) for name in ["openTime", "open", "high", "low", "close", "volume", "closeTime"]}
+        keep = columns["openTime"] >= startTime
+        if endTime != None:
+            keep &= columns["openTime"] < endTime
+        return {name: column[keep] for name, column in columns.items()}
+
+    def _replayBars(self, columns: dict[str, np.ndarray]) -> int:
+        # Dispatches historical bars through the live data pipeline in order
+        nowMs = time.time_ns() // 1_000_000
+        for i in range(len(columns["openTime"])):
+            parseStart = time.perf_counter_ns()
+            bar = LiveMarketData.fromExchange(
+                self.options.trustedModels,
+                openTime=int(columns["openTime"][i]),
+                openPrice=float(columns["open"][i]),
+                highPrice=float(columns["high"][i]),
+                lowPrice=float(columns["low"][i]),
+                closePrice=float(columns["close"][i]),
+                closeTime=int(columns["closeTime"][i]),
+                volume=float(columns["volume"][i]))
+            self._lastLiveTimestamp = bar.openTime
+            # Replayed bars are left out of the latency statistics
+            self._dispatchLiveData(
+                data=bar,
+                closed=(bar.closeTime < nowMs),
+                exchangeTimeNs=None,
+                receiveTimeNs=time.time_ns(),
+                parseStartNs=parseStart)
+        return len(columns["openTime"])
+
+    def backfillLiveData(self) -> int:
+        """
+            Replays the bars published since the last live bar through the live data pipeline, e.g. after the live data was disconnected. The last live bar itself is replayed as well, with its final values.
+
+            Returns
+            -------
+                int
+                    Number of replayed bars.
+        """
+        if self._lastLiveTimestamp == 0:
+            return 0
+        return self._replayBars(self._barsBetween(self._lastLiveTimestamp))
+
+    def _hasLiveGap(self, openTime: int) -> bool:
+        # Quiet markets have no bars for the minutes without trades, so only longer gaps, e.g. after the stream reconnected, are recovered
+        period = self._liveBarPeriodMs()
+        return (self._lastLiveTimestamp != 0) and ((openTime - self._lastLiveTimestamp) > (self._liveGapMinBars * period))
+
+    def _liveGapBars(self, openTime: int) -> Optional[dict[str, np.ndarray]]:
+        """
+            Requests the bars missing between the last live bar and one opened at `openTime`, for the live data handlers to replay before it, so the pipeline receives every bar in order. Only called for gaps found by `_hasLiveGap`.
+
+            Assets with trading sessions, see `hasTradingSessions`, are not recovered across the closed market, e.g. overnight or over a weekend, where no bars are missing. `backfillLiveData` covers reconnects at the open instead.
+
+            Returns
+            -------
+                Optional[dict[str, np.ndarray]]
+                    The missing bars as columns, `None` if the gap spans the closed market.
+        """
+        if self.hasTradingSessions() and self._spansSessions(self._lastLiveTimestamp, openTime):
+            return None
+        return self._barsBetween(self._lastLiveTimestamp + self._liveBarPeriodMs(), openTime)
+
+    def _reportError(self, err: Exception) -> None:
+        # Records an error of the background work and hands it to the `errorHandler`
+        self.lastError = err
+        if self.options.errorHandler != None:
+            self.options.errorHandler(err)
+
+    def _spansSessions(self, startTime: int, endTime: int) -> bool:
+        # The sessions never span midnight in the time zone of the exchange, so times on different exchange dates belong to different sessions
+        zone = self.exchangeClock().currentTimestamp.tzinfo
+        start = datetime.fromtimestamp(startTime / 1000, tz=zone)
+        end = datetime.fromtimestamp(endTime / 1000, tz=zone)
+        return start.date() != end.date()
+
+    def _dispatchLiveData(
+            self,
+            data: LiveMarketData,
+            closed: bool,
+            exchangeTimeNs: Optional[int],
+            receiveTimeNs: int,
+            parseStartNs: int) -> None:
+        """
+            Hands a parsed live bar over to the bar publisher, the journal, the indicator engine and the `dataHandler`, and records its latency. The latency is not recorded if `exchangeTimeNs` is `None`.
+        """
+        if self._barPublisher != None:
+            self._barPublisher.publish(data)
+        if self._journal != None:
+            self._journal.appendBar(data, closed, receiveTimeNs)
+        if self._indicatorEngine != None:
+            self._indicatorEngine.update(data)
+
+        handlerStart = time.perf_counter_ns()
+        if self.options.dataHandler != None:
+            self.options.dataHandler(data=data, closed=closed)
+        handlerEnd = time.perf_counter_ns()
+
+        if exchangeTimeNs == None:
+            return
+        self._latencyTracker.record(
+            exchangeTimeNs=exchangeTimeNs,
+            receiveTimeNs=receiveTimeNs,
+            parseDurationNs=(handlerStart - parseStartNs),
+            handlerDurationNs=(handlerEnd - handlerStart))
+
     @abstractmethod
     def stop(self) -> None:
         pass
 
+    @abstractmethod
+    def account(self) -> AccountModel:
+        """
+            Returns the trading account, served from the local snapshot while `trackAccount` is active.
+
+            Returns
+            -------
+                AccountModel
+                    Account balances as a HermesBaseModel.
+        """
+        pass
+
+    @abstractmethod
+    def positions(self) -> list[PositionModel]:
+        """
+            Returns the open positions of the account, served from the local snapshot while `trackAccount` is active.
+
+            Returns
+            -------
+                list[PositionModel]
+                    Open positions as HermesBaseModels.
+        """
+        pass
+
+    @abstractmethod
+    def trackAccount(self, reconcileInterval: Optional[float] = 30.0) -> AccountSnapshot:
+        """
+            Keeps a local snapshot of the account and its positions, updated from the fill events of the exchange and reconciled over REST every `reconcileInterval` seconds. `account` and `positions` are served from it afterwards.
+
+            Parameters
+            ----------
+                reconcileInterval: Optional[float]
+                    Seconds between two reconciliations. `None` to disable the periodic reconciliation.
+
+            Returns
+            -------
+                AccountSnapshot
+                    The running snapshot.
+        """
+        pass
+
+    @abstractmethod
+    def stopAccountTracking(self) -> None:
+        pass
+
     @abstractmethod
     def marketOrderQty(
         self,
@@ -127,6 +620,50 @@ class ConnectorTemplate(ABC):
         """
         pass
 
+    @abstractmethod
+    def prepareFastOrders(self) -> None:
+        """
+            Builds the request templates of `fastOrder` ahead of the first order. Optional, as `fastOrder` prepares them on first use otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def fastOrder(
+        self,
+        orderType: OrderType,
+        side: OrderSide,
+        tif: TimeInForce = TimeInForce.DAY,
+        qty: Optional[float] = None,
+        cost: Optional[float] = None,
+        limitPrice: Optional[float] = None,
+        clientOrderId: Optional[str] = None) -> FastOrderResult:
+        """
+            Submits a market or limit order through the low latency path. The request is filled into a pre-built template of the trading pair instead of going through the parameter and request models, and the response is only converted when the full result is requested.
+
+            Parameters
+            ----------
+            orderType: OrderType
+                `OrderType.MARKET` or `OrderType.LIMIT`.
+            side: OrderSide
+                Side of the order.
+            tif: TimeInForce
+                Time in force of the order.
+            qty: Optional[float]
+                Quantity of the base asset. Required for limit orders.
+            cost: Optional[float]
+                Cost in the quote asset, for market orders in place of `qty`.
+            limitPrice: Optional[float]
+                Limit price, required for limit orders.
+            clientOrderId: Optional[str]
+                Client order ID of the submission. Generated if not given.
+
+            Returns
+            -------
+            FastOrderResult
+                Identifiers and status of the order, the full result through `FastOrderResult.result`.
+        """
+        pass
+
     @abstractmethod
     def queryOrder(
         self,
@@ -145,6 +682,25 @@ class ConnectorTemplate(ABC):
         
         pass
     
+    @abstractmethod
+    def queryOrderByClientId(
+        self,
+        clientOrderId: str) -> BaseOrderResult:
+        """
+            Queries a submitted order by the client order ID it was submitted with.
+
+            Parameters
+            ----------
+            clientOrderId: str
+                Client order ID of the order, as given in the order parameters or generated by the connector.
+            
+            Returns
+            -------
+            BaseOrderResult
+                The queried order, standardised as a HermesBaseModel.
+        """
+        pass
+    
     @abstractmethod
     def cancelOrder(
         self,
@@ -189,24 +745,146 @@ class ConnectorTemplate(ABC):
         pass
     
     @abstractmethod
-    def historicData(self) -> DataFrame:
+    def iterOrders(
+            self,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            status: OrderQueryStatus = OrderQueryStatus.ALL,
+            symbols: Optional[list[str]] = None,
+            batchSize: int = 500) -> Iterator[BaseOrderResult]:
+        """
+            Lazily iterates over the order history, oldest first, walking the pagination of the exchange one page at a time. Only a single page is held in memory, regardless of the length of the history.
+
+            Parameters
+            ----------
+                start: Optional[datetime]
+                    Only orders submitted after this time. From the first order if `None`.
+                end: Optional[datetime]
+                    Only orders submitted until this time. Up to the latest order if `None`.
+                status: OrderQueryStatus
+                    Open, closed, or all orders.
+                symbols: Optional[list[str]]
+                    Only the orders of these symbols. All symbols if `None`.
+                batchSize: int
+                    Number of orders requested and converted at once.
+
+            Returns
+            -------
+                Iterator[BaseOrderResult]
+                    The orders as HermesBaseModels.
+        """
+        pass
+
+    @abstractmethod
+    def historicData(self) -> HistoricFrame:
         """
-            Requests, formats, and returns a Pandas Dataframe of the price data of the selected asset.
+            Requests, formats, and returns a Pandas Dataframe of the price data of the selected asset. A pyarrow Table or a polars DataFrame is returned instead if the `outputFormat` connector option is "arrow" or "polars".
 
             The DataFrame contains the following columns:
                 `['openTime', 'open', 'high', 'low', 'close', 'volume', 'pChange', 'closeTime']`
             
+            The times are int64 epoch milliseconds, the prices and volumes are of the `floatPrecision` given in the connector options.
+            
             Returns
             -------
-            DataFrame
-                A Pandas DataFrame of the price data of the asset.
+            HistoricFrame
+                A Pandas DataFrame (or pyarrow Table, or polars DataFrame) of the price data of the asset.
         """
         pass
     
+    @abstractmethod
+    def historicDataMulti(
+        self,
+        timeframes: list[TimeFrame],
+        alignment: Alignment = "utc") -> dict[TimeFrame, HistoricFrame]:
+        """
+            Returns the price data of the selected asset in several timeframes at once. Only the finest timeframe is requested from the exchange, the coarser ones are aggregated from it locally.
+
+            Parameters
+            ----------
+            timeframes: list[TimeFrame]
+                The timeframes to be returned. Their lengths have to be multiples of the finest one.
+            alignment: Alignment
+                "utc" to align the aggregated candlesticks to UTC boundaries, "session" to align them to the start of each trading session.
+
+            Returns
+            -------
+            dict[TimeFrame, HistoricFrame]
+                A frame per timeframe, each in the same format as `historicData` and with up to `limit` rows.
+        """
+        pass
+
+    @abstractmethod
+    def historicDataMany(
+            self,
+            symbols: list[str],
+            start: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            asDict: bool = False,
+            batchSize: int = 200) -> Union[HistoricFrame, dict[str, HistoricFrame]]:
+        """
+            Returns the price data of many assets of the same asset class as the trading pair, in the interval of the connector. The symbols are requested in batches of `batchSize` per request, instead of one request each.
+
+            Parameters
+            ----------
+            symbols: list[str]
+                Symbols of the assets.
+            start: Optional[datetime]
+                Start of the requested range. If `None`, a range expected to hold `limit` candlesticks is requested, widened for the trading sessions of the asset class.
+            limit: Optional[int]
+                Maximum number of candlesticks per symbol, the most recent ones are kept. The `limit` connector option if `None`.
+            asDict: bool
+                Return a frame per symbol instead of a single frame.
+            batchSize: int
+                Number of symbols per request.
+
+            Returns
+            -------
+            Union[HistoricFrame, dict[str, HistoricFrame]]
+                A single frame with a categorical `symbol` column in front of the columns of `historicData`, the rows of each symbol contiguous and in the order of `symbols`. If `asDict` is set, a frame per symbol in the same format as `historicData` instead, empty for the symbols without data.
+        """
+        pass
+
     @abstractmethod
     def initiateLiveData(self) -> None:
         pass
 
+    @abstractmethod
+    def subscribeTrades(
+            self,
+            handler: TickBatchHandler,
+            batchSize: int = 256,
+            maxDelay: Optional[float] = 0.05) -> TradeBuffer:
+        """
+            Subscribes to the trades of the trading pair. The trades are collected in a preallocated columnar buffer and passed to `handler` in batches, see `TradeBuffer`.
+
+            Parameters
+            ----------
+                handler: TickBatchHandler
+                    Called with each batch as a dictionary of the `TRADE_COLUMNS` columns. The arrays are reused after the call returns.
+                batchSize: int
+                    Number of trades delivered at once at most.
+                maxDelay: Optional[float]
+                    Maximum time in seconds a trade waits for its batch to fill, `None` to only deliver full batches.
+
+            Returns
+            -------
+                TradeBuffer
+                    The buffer of the subscription, use `flush` to deliver a partial batch.
+        """
+        pass
+
+    @abstractmethod
+    def subscribeQuotes(
+            self,
+            handler: TickBatchHandler,
+            batchSize: int = 256,
+            maxDelay: Optional[float] = 0.05) -> QuoteBuffer:
+        """
+            Subscribes to the top of book quotes of the trading pair. Same as `subscribeTrades`, with the `QUOTE_COLUMNS` columns.
+        """
+        pass
+
     @abstractmethod
     def wsHandlerInternal(self):
         """
@@ -0,0 +1,156 @@
+#
+# Market Data Utilities and Common Definitions
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import numpy as np
+from pandas import Categorical, DataFrame
+from typing import Any, Union
+from typing_extensions import Literal
+
+from .hermes_exceptions import UnsupportedFeature, UnsupportedParameterValue
+
+
+# Column layout of the frames returned by `historicData`, shared by all connectors
+HISTORIC_COLUMNS    = ["openTime", "open", "high", "low", "close", "volume", "pChange", "closeTime"]
+PRICE_COLUMNS       = ["open", "high", "low", "close", "volume", "pChange"]
+TIME_COLUMNS        = ["openTime", "closeTime"]
+
+# Key column of the long frames of `historicDataMany`, in front of the `HISTORIC_COLUMNS`
+SYMBOL_COLUMN       = "symbol"
+
+# Precision of the price and volume columns
+FloatPrecision      = Literal["float64", "float32"]
+
+# Type of the frame returned by `historicData`
+OutputFormat        = Literal["pandas", "arrow", "polars"]
+# A pandas DataFrame, pyarrow Table, or polars DataFrame, depending on the output format
+HistoricFrame       = Union[DataFrame, Any]
+
+
+def percentChange(close: np.ndarray) -> np.ndarray:
+    """
+        Returns the percentage change of each close price from the previous one, `nan` for the first.
+    """
+    result = np.empty_like(close)
+    if len(close) > 0:
+        result[0] = np.nan
+        np.multiply(np.divide(close[1:], close[:-1]) - 1, 100, out=result[1:])
+    return result
+
+
+def _historicColumns(
+        columns: dict[str, np.ndarray],
+        floatPrecision: FloatPrecision) -> dict[str, np.ndarray]:
+    # The `HISTORIC_COLUMNS` in their types, arrays that already are are not copied
+    data: dict[str, np.ndarray] = {}
+    for name in HISTORIC_COLUMNS:
+        if (name == "pChange") and ("pChange" not in columns):
+            data[name] = percentChange(data["close"])
+        elif name in TIME_COLUMNS:
+            data[name] = np.asarray(columns[name], dtype=np.int64)
+        else:
+            data[name] = np.asarray(columns[name], dtype=floatPrecision)
+    return data
+
+
+def buildHistoricFrame(
+        columns: dict[str, np.ndarray],
+        floatPrecision: FloatPrecision = "float64",
+        outputFormat: OutputFormat = "pandas",
+        copy: bool = True) -> HistoricFrame:
+    """
+        Builds the frame returned by `historicData` directly from the parsed columns, without going through any intermediate DataFrame.
+
+        Parameters
+        ----------
+            columns: dict[str, np.ndarray]
+                Arrays of the `HISTORIC_COLUMNS`, times in epoch milliseconds. `pChange` is computed if missing.
+            floatPrecision: FloatPrecision
+                Either "float64" or "float32".
+            outputFormat: OutputFormat
+                "pandas" for a pandas DataFrame, "arrow" for a pyarrow Table, or "polars" for a polars DataFrame. The latter two require the respective optional dependency.
+            copy: bool
+                `False` to build the pandas frame on the given arrays instead of copies of them. Only for distinct arrays that are not used elsewhere, as the frame writes through to them.
+
+        Returns
+        -------
+            HistoricFrame
+                The price data with times as int64 epoch milliseconds, and prices and volumes in the given float precision.
+    """
+    data = _historicColumns(columns, floatPrecision)
+
+    match outputFormat:
+        case "pandas":
+            return DataFrame(data=data, copy=copy)
+        case "arrow":
+            try:
+                import pyarrow
+            except ImportError:
+                raise UnsupportedFeature
+            return pyarrow.table(data)
+        case "polars":
+            try:
+                import polars
+            except ImportError:
+                raise UnsupportedFeature
+            return polars.DataFrame(data)
+        case _:
+            raise UnsupportedParameterValue
+
+
+def buildLongHistoricFrame(
+        columnsBySymbol: dict[str, dict[str, np.ndarray]],
+        floatPrecision: FloatPrecision = "float64",
+        outputFormat: OutputFormat = "pandas") -> HistoricFrame:
+    """
+        Builds a single frame of the price data of several symbols, keyed by a categorical `SYMBOL_COLUMN` in front of the `HISTORIC_COLUMNS`. The rows of each symbol are contiguous and in the order of `columnsBySymbol`.
+
+        Every column is concatenated once, and the frame is built on the concatenated arrays. `pChange` is computed per symbol.
+
+        Parameters
+        ----------
+            columnsBySymbol: dict[str, dict[str, np.ndarray]]
+                Arrays of the `HISTORIC_COLUMNS` per symbol, see `buildHistoricFrame`.
+            floatPrecision: FloatPrecision
+                Either "float64" or "float32".
+            outputFormat: OutputFormat
+                "pandas", "arrow" or "polars", see `buildHistoricFrame`.
+
+        Returns
+        -------
+            HistoricFrame
+                The price data of all the symbols.
+    """
+    symbols = list(columnsBySymbol)
+    parts = [_historicColumns(columns, floatPrecision) for columns in columnsBySymbol.values()]
+    lengths = np.array([len(part["openTime"]) for part in parts], dtype=np.int64)
+    codes = np.repeat(np.arange(len(symbols), dtype=np.int32), lengths)
+
+    data: dict[str, np.ndarray] = {}
+    for name in HISTORIC_COLUMNS:
+        dtype = np.int64 if (name in TIME_COLUMNS) else floatPrecision
+        data[name] = np.concatenate([part[name] for part in parts]) if (len(parts) > 0) else np.empty(0, dtype=dtype)
+
+    match outputFormat:
+        case "pandas":
+            symbolColumn = Categorical.from_codes(codes, categories=symbols)
+            return DataFrame(data={SYMBOL_COLUMN: symbolColumn, **data}, copy=False)
+        case "arrow":
+            try:
+                import pyarrow
+            except ImportError:
+                raise UnsupportedFeature
+            symbolColumn = pyarrow.DictionaryArray.from_arrays(codes, pyarrow.array(symbols, type=pyarrow.string()))
+            return pyarrow.table({SYMBOL_COLUMN: symbolColumn, **data})
+        case "polars":
+            try:
+                import polars
+            except ImportError:
+                raise UnsupportedFeature
+            symbolColumn = polars.Series(SYMBOL_COLUMN, np.asarray(symbols, dtype=object)[codes], dtype=polars.Enum(symbols))
+            return polars.DataFrame({SYMBOL_COLUMN: symbolColumn, **data})
+        case _:
+            raise UnsupportedParameterValue
@@ -0,0 +1,60 @@
+#
+# Fast Order Path Results
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+from typing import Callable, Optional
+
+from .models import BaseOrderResult
+from .hermes_enums import OrderStatus
+
+
+class FastOrderResult:
+
+    """
+        Minimal result of an order submitted through `fastOrder`.
+
+        Only the identifiers and the status are read from the exchange response, which is kept as is in `raw`. The full result model is built on the first call to `result`.
+
+        Parameters
+        ----------
+            orderId: str
+                Exchange order ID.
+            clientOrderId: Optional[str]
+                Client order ID the order was submitted with.
+            status: OrderStatus
+                Status of the order when it was accepted.
+            raw: dict
+                Exchange response.
+            convert: Callable[[dict], BaseOrderResult]
+                Builds the full result model from the exchange response.
+    """
+
+    __slots__ = ("orderId", "clientOrderId", "status", "raw", "_convert", "_result")
+
+    def __init__(
+            self,
+            orderId: str,
+            clientOrderId: Optional[str],
+            status: OrderStatus,
+            raw: dict,
+            convert: Callable[[dict], BaseOrderResult]):
+        self.orderId        = orderId
+        self.clientOrderId  = clientOrderId
+        self.status         = status
+        self.raw            = raw
+        self._convert       = convert
+        self._result        : Optional[BaseOrderResult] = None
+
+    def result(self) -> BaseOrderResult:
+        """
+            Returns the full result model of the order, the same one the regular order methods return.
+        """
+        if self._result == None:
+            self._result = self._convert(self.raw)
+        return self._result
+
+    def __repr__(self) -> str:
+        return f"FastOrderResult(orderId={self.orderId!r}, clientOrderId={self.clientOrderId!r}, status={self.status.value!r})"
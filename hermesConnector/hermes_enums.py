@@ -39,8 +39,19 @@ class OrderStatus(str, Enum):
     CALCULATED              = "calculated"
     HELD                    = "held"
 
+class OrderQueryStatus(str, Enum):
+    OPEN                    = "open"
+    CLOSED                  = "closed"
+    ALL                     = "all"
+
 class TimeframeUnit(str, Enum):
     WEEK                    = "week"
     DAY                     = "day"
     HOUR                    = "hour"
-    MINUTE                  = "minute"
\ No newline at end of file
+    MINUTE                  = "minute"
+
+class JournalEventKind(int, Enum):
+    BAR                     = 1
+    ORDER_SUBMITTED         = 2
+    ORDER_RESULT            = 3
+    ORDER_CANCELED          = 4
@@ -23,6 +23,7 @@ orderErrStr = Literal[
     "UNKNOWN_ORDER_ERR",
     "ORDER_FAILED_TO_SEND",
     "ORDER_REJECTED_GENERAL",
+    "ORDER_VIOLATES_CONSTRAINTS",
 ]
 accountErrStr = Literal[
     "INSUFFICIENT_BALANCE",
@@ -129,6 +130,11 @@ class OrderRejected(HermesBaseException):
     errCode     = 2005
     errStr      = "ORDER_REJECTED_GENERAL"
 
+# Order rejected locally, as it violates the trading constraints of the asset
+class OrderViolatesConstraints(HermesBaseException):
+    errCode     = 2006
+    errStr      = "ORDER_VIOLATES_CONSTRAINTS"
+
 
 #
 # Account errors
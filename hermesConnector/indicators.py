@@ -0,0 +1,308 @@
+#
+# Incremental Indicator Engine
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import math
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
+from .models import BaseMarketData
+from .data_utilities import HistoricFrame
+from .hermes_exceptions import UnsupportedParameterValue
+
+
+class IndicatorBar(NamedTuple):
+    openTime        : float
+    high            : float
+    low             : float
+    close           : float
+
+
+class IncrementalIndicator(ABC):
+
+    """
+        Base class of the incremental indicators.
+
+        An indicator keeps the state of all the finished bars, folded in through `commit`, and computes its value for the bar that is still forming through `preview` without touching that state. Revising the forming bar is therefore a matter of calling `preview` again, and both operations are O(1) regardless of the window length.
+    """
+
+    @abstractmethod
+    def commit(self, bar: IndicatorBar) -> None:
+        """
+            Folds a finished bar into the state of the indicator.
+        """
+        pass
+
+    @abstractmethod
+    def preview(self, bar: IndicatorBar) -> float:
+        """
+            Returns the value of the indicator with `bar` as the latest bar, without changing the state. `nan` while the indicator is warming up.
+        """
+        pass
+
+
+class _RollingWindow:
+    # Fixed size ring of the last `size` values with a running sum and sum of squares
+
+    def __init__(self, size: int):
+        self.size       = size
+        self.values     = np.zeros(size, dtype=np.float64)
+        self.count      = 0
+        self.total      = 0.0
+        self.totalSq    = 0.0
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.size
+
+    @property
+    def oldest(self) -> float:
+        return float(self.values[self.count % self.size]) if self.full else 0.0
+
+    def push(self, value: float) -> None:
+        dropped = self.oldest
+        self.values[self.count % self.size] = value
+        self.count      += 1
+        self.total      += value - dropped
+        self.totalSq    += (value * value) - (dropped * dropped)
+
+
+class SMA(IncrementalIndicator):
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise UnsupportedParameterValue
+        self._window = _RollingWindow(window)
+
+    def commit(self, bar: IndicatorBar) -> None:
+        self._window.push(bar.close)
+
+    def preview(self, bar: IndicatorBar) -> float:
+        window = self._window
+        if (window.count + 1) < window.size:
+            return math.nan
+        return (window.total - window.oldest + bar.close) / window.size
+
+
+class EMA(IncrementalIndicator):
+
+    """
+        Exponential moving average with a smoothing factor of `2 / (window + 1)`. Seeded with the simple average of the first `window` closes.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise UnsupportedParameterValue
+        self._alpha     = 2 / (window + 1)
+        self._seed      = _RollingWindow(window)
+        self._ema       = math.nan
+
+    def _next(self, close: float) -> float:
+        if math.isnan(self._ema):
+            seed = self._seed
+            if (seed.count + 1) < seed.size:
+                return math.nan
+            return (seed.total + close) / seed.size
+        return (self._alpha * close) + ((1 - self._alpha) * self._ema)
+
+    def commit(self, bar: IndicatorBar) -> None:
+        value = self._next(bar.close)
+        if math.isnan(value):
+            self._seed.push(bar.close)
+        self._ema = value
+
+    def preview(self, bar: IndicatorBar) -> float:
+        return self._next(bar.close)
+
+
+class _WilderAverage:
+    # Wilder smoothing, seeded with the simple average of the first `window` values
+
+    def __init__(self, window: int):
+        self.window     = window
+        self.count      = 0
+        self.average    = 0.0
+
+    def next(self, value: float) -> float:
+        if self.count < self.window:
+            return ((self.average * self.count) + value) / (self.count + 1)
+        return ((self.average * (self.window - 1)) + value) / self.window
+
+    def push(self, value: float) -> None:
+        self.average = self.next(value)
+        self.count += 1
+
+    def ready(self, pending: int) -> bool:
+        return (self.count + pending) >= self.window
+
+
+class RSI(IncrementalIndicator):
+
+    def __init__(self, window: int = 14):
+        if window < 1:
+            raise UnsupportedParameterValue
+        self._gain      = _WilderAverage(window)
+        self._loss      = _WilderAverage(window)
+        self._prevClose : Optional[float] = None
+
+    def commit(self, bar: IndicatorBar) -> None:
+        if self._prevClose != None:
+            change = bar.close - self._prevClose
+            self._gain.push(max(change, 0.0))
+            self._loss.push(max(-change, 0.0))
+        self._prevClose = bar.close
+
+    def preview(self, bar: IndicatorBar) -> float:
+        if (self._prevClose == None) or (self._gain.ready(1) != True):
+            return math.nan
+        change  = bar.close - self._prevClose
+        gain    = self._gain.next(max(change, 0.0))
+        loss    = self._loss.next(max(-change, 0.0))
+        if loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + (gain / loss)))
+
+
+class ATR(IncrementalIndicator):
+
+    def __init__(self, window: int = 14):
+        if window < 1:
+            raise UnsupportedParameterValue
+        self._range     = _WilderAverage(window)
+        self._prevClose : Optional[float] = None
+
+    def _trueRange(self, bar: IndicatorBar) -> float:
+        if self._prevClose == None:
+            return bar.high - bar.low
+        return max(
+            bar.high - bar.low,
+            abs(bar.high - self._prevClose),
+            abs(bar.low - self._prevClose))
+
+    def commit(self, bar: IndicatorBar) -> None:
+        self._range.push(self._trueRange(bar))
+        self._prevClose = bar.close
+
+    def preview(self, bar: IndicatorBar) -> float:
+        if self._range.ready(1) != True:
+            return math.nan
+        return self._range.next(self._trueRange(bar))
+
+
+class RollingVolatility(IncrementalIndicator):
+
+    """
+        Sample standard deviation of the percentage close-to-close returns over the last `window` bars.
+    """
+
+    def __init__(self, window: int = 20):
+        if window < 2:
+            raise UnsupportedParameterValue
+        self._returns   = _RollingWindow(window)
+        self._prevClose : Optional[float] = None
+
+    def commit(self, bar: IndicatorBar) -> None:
+        if self._prevClose != None:
+            self._returns.push(((bar.close / self._prevClose) - 1) * 100)
+        self._prevClose = bar.close
+
+    def preview(self, bar: IndicatorBar) -> float:
+        returns = self._returns
+        if (self._prevClose == None) or ((returns.count + 1) < returns.size):
+            return math.nan
+        value   = ((bar.close / self._prevClose) - 1) * 100
+        dropped = returns.oldest
+        n       = returns.size
+        total   = returns.total - dropped + value
+        totalSq = returns.totalSq - (dropped * dropped) + (value * value)
+        variance = (totalSq - ((total * total) / n)) / (n - 1)
+        # The running sums can leave a tiny negative residue for flat prices
+        return math.sqrt(max(variance, 0.0))
+
+
+class PChange(IncrementalIndicator):
+
+    """
+        Percentage change of the close price from the previous bar, as found in the `pChange` column of `historicData`.
+    """
+
+    def __init__(self):
+        self._prevClose : Optional[float] = None
+
+    def commit(self, bar: IndicatorBar) -> None:
+        self._prevClose = bar.close
+
+    def preview(self, bar: IndicatorBar) -> float:
+        if self._prevClose == None:
+            return math.nan
+        return ((bar.close / self._prevClose) - 1) * 100
+
+
+class IndicatorEngine:
+
+    """
+        Keeps a set of named incremental indicators up to date with the bars of a connector.
+
+        The engine tracks the open time of the forming bar. A live bar with the same open time revises the current values, a bar with a later open time finishes the forming bar first. Attach it to a connector through `attachIndicators`.
+
+        Example
+        -------
+            engine = IndicatorEngine({"ema20": EMA(20), "rsi": RSI(14)})
+    """
+
+    def __init__(self, indicators: dict[str, IncrementalIndicator]):
+        self._indicators    = indicators
+        self._pending       : Optional[IndicatorBar] = None
+        self._values        : dict[str, float] = {name: math.nan for name in indicators}
+
+    def _commitPending(self) -> None:
+        if self._pending != None:
+            for indicator in self._indicators.values():
+                indicator.commit(self._pending)
+
+    def _push(self, bar: IndicatorBar) -> dict[str, float]:
+        if (self._pending != None) and (bar.openTime != self._pending.openTime):
+            self._commitPending()
+        self._pending = bar
+        for name, indicator in self._indicators.items():
+            self._values[name] = indicator.preview(bar)
+        return self._values
+
+    def seed(self, frame: HistoricFrame) -> dict[str, float]:
+        """
+            Seeds the indicators from a `historicData` frame, of any of the output formats. The last row is kept as the forming bar, so a live bar with the same open time revises it.
+        """
+        for bar in zip(
+                np.asarray(frame["openTime"], dtype=np.float64),
+                np.asarray(frame["high"], dtype=np.float64),
+                np.asarray(frame["low"], dtype=np.float64),
+                np.asarray(frame["close"], dtype=np.float64)):
+            if self._pending != None:
+                self._commitPending()
+            self._pending = IndicatorBar(*bar)
+        if self._pending != None:
+            return self._push(self._pending)
+        return self._values
+
+    def update(self, data: BaseMarketData) -> dict[str, float]:
+        """
+            Updates the indicators with a live bar and returns the current values.
+        """
+        return self._push(IndicatorBar(
+            openTime=data.openTime,
+            high=data.highPrice,
+            low=data.lowPrice,
+            close=data.closePrice))
+
+    def values(self) -> dict[str, float]:
+        """
+            Returns the current value of every indicator.
+        """
+        return dict(self._values)
+
+    def __getitem__(self, name: str) -> float:
+        return self._values[name]
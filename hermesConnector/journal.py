@@ -0,0 +1,280 @@
+#
+# Append-Only Event Journal
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import mmap
+import os
+import struct
+import threading
+import time
+import numpy as np
+from itertools import groupby
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from . import codec
+from .models import BaseOrderResult, LiveMarketData, OrderBaseParams
+from .hermes_enums import JournalEventKind
+from .hermes_exceptions import UnexpectedInput, UnsupportedFeature
+
+
+# File header: magic, schema version, end of the last complete record. The records start after the header.
+_FILE_HEADER        = struct.Struct("<8sI4xQ")
+_FILE_HEADER_SIZE   = 64
+_END_OFFSET         = 16
+_END                = struct.Struct("<Q")
+_MAGIC              = b"HMJOURNL"
+_SCHEMA_VERSION     = 1
+
+# Record header: payload length, event kind, flags, event time in epoch nanoseconds
+_RECORD             = struct.Struct("<IBBq")
+
+# Record flags
+FLAG_CLOSED         = 1
+
+
+class JournalEvent(NamedTuple):
+    kind            : JournalEventKind
+    timeNs          : int
+    # Bars only, `True` if the bar was closed
+    closed          : bool
+    # The bar, the order parameters, the list of order results, or the ID of the canceled order
+    data            : Any
+
+
+def _readHeader(buffer: mmap.mmap) -> int:
+    # End of the records, after checking the header
+    if len(buffer) < _FILE_HEADER_SIZE:
+        raise UnexpectedInput
+    magic, version, end = _FILE_HEADER.unpack_from(buffer, 0)
+    if (magic != _MAGIC) or (version != _SCHEMA_VERSION) or (end > len(buffer)):
+        raise UnexpectedInput
+    return end
+
+
+class EventJournal:
+
+    """
+        Append-only journal of the live bars and order events of a connector, kept in a memory-mapped file.
+
+        Every record is length-prefixed and holds the event kind, the event time and the event encoded by `codec`. The records are written straight into the mapped file, so they survive a crash of the process as soon as the append returns. The appends write the file to disk every `flushInterval` seconds, after which the records also survive a crash of the machine. The file doubles in size whenever it is full.
+
+        Opening an existing journal continues it after its last complete record. Attach the journal to a connector through `attachJournal`, and read it back with `JournalReader`.
+
+        Parameters
+        ----------
+            path: str
+                Path of the journal file.
+            initialSize: int
+                Size in bytes a new file is created with.
+            flushInterval: Optional[float]
+                Seconds between writes to disk, `None` to write only on `flush` and `close`.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            initialSize: int = 1 << 24,
+            flushInterval: Optional[float] = 1.0):
+        # Orders are encoded with msgpack, which is checked here rather than after the first order was submitted
+        try:
+            import msgpack
+        except ImportError:
+            raise UnsupportedFeature
+
+        self._path          = path
+        self._flushInterval = flushInterval
+        self._lock          = threading.Lock()
+        self._fd            = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(self._fd).st_size
+            if size == 0:
+                size = max(initialSize, _FILE_HEADER_SIZE)
+                os.ftruncate(self._fd, size)
+                self._map = mmap.mmap(self._fd, size)
+                _FILE_HEADER.pack_into(self._map, 0, _MAGIC, _SCHEMA_VERSION, _FILE_HEADER_SIZE)
+            else:
+                self._map = mmap.mmap(self._fd, size)
+            self._end = _readHeader(self._map)
+        except Exception:
+            os.close(self._fd)
+            raise
+        self._lastFlush = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """
+            Number of bytes written, including the file header.
+        """
+        return self._end
+
+    def append(
+            self,
+            kind: JournalEventKind,
+            payload: bytes,
+            timeNs: Optional[int] = None,
+            flags: int = 0) -> None:
+        """
+            Appends a record. `timeNs` is the event time in epoch nanoseconds, the current time if `None`.
+        """
+        if timeNs == None:
+            timeNs = time.time_ns()
+        length = _RECORD.size + len(payload)
+        with self._lock:
+            if self._map.closed:
+                raise UnexpectedInput
+            start = self._end
+            end = start + length
+            if end > len(self._map):
+                self._grow(end)
+            _RECORD.pack_into(self._map, start, len(payload), kind, flags, timeNs)
+            self._map[start + _RECORD.size:end] = payload
+            # The end is moved past the record once it is complete, so a record cut short by a crash is left out
+            _END.pack_into(self._map, _END_OFFSET, end)
+            self._end = end
+            if (self._flushInterval != None) and ((time.monotonic() - self._lastFlush) >= self._flushInterval):
+                self._flush()
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._map)
+        while size < needed:
+            size *= 2
+        self._map.resize(size)
+
+    def appendBar(self, bar: LiveMarketData, closed: bool, timeNs: Optional[int] = None) -> None:
+        self.append(JournalEventKind.BAR, codec.encode(bar), timeNs, (FLAG_CLOSED if closed else 0))
+
+    def appendSubmission(self, params: OrderBaseParams, timeNs: Optional[int] = None) -> None:
+        """
+            Records an order about to be submitted. The parameters should carry the client order ID, through which the order can be looked up if its result never made it into the journal.
+        """
+        self.append(JournalEventKind.ORDER_SUBMITTED, codec.encode(params), timeNs)
+
+    def appendOrders(self, orders: Iterable[BaseOrderResult], timeNs: Optional[int] = None) -> None:
+        # A record holds orders of a single class
+        for _, group in groupby(orders, key=type):
+            self.append(JournalEventKind.ORDER_RESULT, codec.encodeBatch(list(group)), timeNs)
+
+    def appendCancel(self, orderId: str, timeNs: Optional[int] = None) -> None:
+        self.append(JournalEventKind.ORDER_CANCELED, orderId.encode("utf-8"), timeNs)
+
+    def _flush(self) -> None:
+        self._map.flush()
+        self._lastFlush = time.monotonic()
+
+    def flush(self) -> None:
+        """
+            Writes the journal to disk.
+        """
+        with self._lock:
+            if self._map.closed != True:
+                self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map.closed:
+                return
+            self._flush()
+            self._map.close()
+            os.close(self._fd)
+
+
+class JournalReader:
+
+    """
+        Sequential reader of an `EventJournal` file. The file is mapped read-only and the records are read in place, up to the end of the journal at the time the reader was opened.
+
+        Iterating the reader yields every event as a `JournalEvent`. `barColumns`, `latestOrders` and `pendingSubmissions` restore the state of a connector from the journal, see `ConnectorTemplate.replayJournal`.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._end = _readHeader(self._map)
+        except Exception:
+            self._map.close()
+            raise
+
+    def records(self, kinds: Optional[list[JournalEventKind]] = None) -> Iterator[tuple[int, int, int, bytes]]:
+        """
+            Yields the raw records, as their kind, flags, event time and encoded payload, optionally only those of the given kinds.
+        """
+        buffer = self._map
+        unpack = _RECORD.unpack_from
+        headerSize = _RECORD.size
+        offset = _FILE_HEADER_SIZE
+        while offset < self._end:
+            length, kind, flags, timeNs = unpack(buffer, offset)
+            start = offset + headerSize
+            offset = start + length
+            if (kinds == None) or (kind in kinds):
+                yield kind, flags, timeNs, buffer[start:offset]
+
+    def events(self, kinds: Optional[list[JournalEventKind]] = None) -> Iterator[JournalEvent]:
+        """
+            Yields the decoded events, optionally only those of the given kinds.
+        """
+        for kind, flags, timeNs, payload in self.records(kinds):
+            match kind:
+                case JournalEventKind.BAR:
+                    data = codec.decode(payload)
+                case JournalEventKind.ORDER_SUBMITTED:
+                    data = codec.decode(payload)
+                case JournalEventKind.ORDER_RESULT:
+                    data = codec.decodeBatch(payload)
+                case JournalEventKind.ORDER_CANCELED:
+                    data = payload.decode("utf-8")
+                case _:
+                    raise UnexpectedInput
+            yield JournalEvent(JournalEventKind(kind), timeNs, ((flags & FLAG_CLOSED) != 0), data)
+
+    def __iter__(self) -> Iterator[JournalEvent]:
+        return self.events()
+
+    def barColumns(self) -> dict[str, np.ndarray]:
+        """
+            Returns the journaled bars in open time order, each with the values of its last update, as columns named as in `historicData`: openTime, open, high, low, close, volume and closeTime.
+        """
+        records = codec.decodeBarBatches([payload for _, _, _, payload in self.records([JournalEventKind.BAR])])
+        # Index of the last update of every bar, `np.unique` sorts by open time
+        _, reverseIndex = np.unique(records["openTime"][::-1], return_index=True)
+        records = records[(len(records) - 1) - reverseIndex]
+        return {
+            "openTime"  : records["openTime"],
+            "open"      : records["openPrice"],
+            "high"      : records["highPrice"],
+            "low"       : records["lowPrice"],
+            "close"     : records["closePrice"],
+            "volume"    : records["volume"],
+            "closeTime" : records["closeTime"],
+        }
+
+    def latestOrders(self) -> dict[str, BaseOrderResult]:
+        """
+            Returns the most recent journaled version of every order, by order ID.
+        """
+        orders: dict[str, BaseOrderResult] = {}
+        for event in self.events([JournalEventKind.ORDER_RESULT]):
+            for order in event.data:
+                previous = orders.get(order.order_id)
+                if (previous == None) or (order.updated_at >= previous.updated_at):
+                    orders[order.order_id] = order
+        return orders
+
+    def pendingSubmissions(self) -> list[OrderBaseParams]:
+        """
+            Returns the submitted orders no result was journaled for, e.g. because the process crashed while they were in flight. They may or may not have reached the exchange, look them up by their client order ID.
+        """
+        submissions = [event.data for event in self.events([JournalEventKind.ORDER_SUBMITTED])]
+        known = {order.client_order_id for order in self.latestOrders().values()}
+        return [params for params in submissions if params.clientOrderId not in known]
+
+    def close(self) -> None:
+        self._map.close()
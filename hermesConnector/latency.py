@@ -0,0 +1,145 @@
+#
+# Live Data Latency Tracing
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import threading
+import numpy as np
+from typing import Optional
+
+from .models import LatencyPercentiles, LatencyStatsModel
+
+
+class LatencyTracker:
+
+    """
+        Rolling record of the timestamps of the live bars handled by a connector.
+
+        For every bar, four points in time are kept:
+            - the exchange event time,
+            - the local receive time in `wsHandlerInternal`,
+            - the time the bar was parsed and handed to the `dataHandler`,
+            - the time the `dataHandler` returned.
+
+        The samples are stored in preallocated ring buffers of size `window`, so recording a bar never allocates. The local-to-exchange clock offset is estimated from exchange clock requests (see `addClockSample`) and is used to correct the feed latency.
+    """
+
+    # Number of clock samples kept for the offset estimation
+    _clockSampleWindow      : int = 8
+
+    def __init__(self, window: int = 1024):
+        self._window            = window
+        self._lock              = threading.Lock()
+
+        # Ring buffers, all in nanoseconds
+        self._exchangeTime      = np.zeros(window, dtype=np.int64)
+        self._receiveTime       = np.zeros(window, dtype=np.int64)
+        self._parseDuration     = np.zeros(window, dtype=np.int64)
+        self._handlerDuration   = np.zeros(window, dtype=np.int64)
+        self._count             = 0
+
+        # Clock samples as (round trip, offset) pairs
+        self._clockSamples      : list[tuple[int, int]] = []
+
+    def record(
+            self,
+            exchangeTimeNs: int,
+            receiveTimeNs: int,
+            parseDurationNs: int,
+            handlerDurationNs: int) -> None:
+        """
+            Records the timestamps of a single live bar.
+
+            Parameters
+            ----------
+                exchangeTimeNs: int
+                    Exchange event time of the bar in epoch nanoseconds.
+                receiveTimeNs: int
+                    Local wall clock time the message was received at, in epoch nanoseconds.
+                parseDurationNs: int
+                    Time spent between receiving the message and calling the `dataHandler`.
+                handlerDurationNs: int
+                    Time spent inside the `dataHandler`.
+        """
+        with self._lock:
+            index = self._count % self._window
+            self._exchangeTime[index]       = exchangeTimeNs
+            self._receiveTime[index]        = receiveTimeNs
+            self._parseDuration[index]      = parseDurationNs
+            self._handlerDuration[index]    = handlerDurationNs
+            self._count += 1
+
+    def addClockSample(
+            self,
+            localSendNs: int,
+            exchangeTimeNs: int,
+            localReceiveNs: int) -> None:
+        """
+            Adds a clock sample obtained from an exchange clock request.
+
+            The offset is estimated NTP style, assuming the exchange timestamp was taken half way through the round trip. The sample with the shortest round trip among the most recent ones is used, as it has the smallest error bound.
+        """
+        roundTrip   = localReceiveNs - localSendNs
+        offset      = exchangeTimeNs - ((localSendNs + localReceiveNs) // 2)
+        with self._lock:
+            self._clockSamples.append((roundTrip, offset))
+            if len(self._clockSamples) > self._clockSampleWindow:
+                self._clockSamples.pop(0)
+
+    @property
+    def clockOffsetNs(self) -> Optional[int]:
+        """
+            Estimated offset of the exchange clock relative to the local clock (exchange - local), in nanoseconds. `None` if no clock samples were taken yet.
+        """
+        if len(self._clockSamples) == 0:
+            return None
+        return min(self._clockSamples)[1]
+
+    @staticmethod
+    def _percentiles(values: np.ndarray) -> LatencyPercentiles:
+        # Values are in nanoseconds, the output is in milliseconds
+        if len(values) == 0:
+            return LatencyPercentiles(p50=0.0, p90=0.0, p99=0.0, max=0.0, mean=0.0)
+        p50, p90, p99 = np.percentile(values, [50, 90, 99]) / 1e6
+        return LatencyPercentiles(
+            p50=float(p50),
+            p90=float(p90),
+            p99=float(p99),
+            max=float(values.max()) / 1e6,
+            mean=float(values.mean()) / 1e6)
+
+    def stats(self) -> LatencyStatsModel:
+        """
+            Returns the rolling percentile statistics of the recorded live bars.
+
+            Returns
+            -------
+                LatencyStatsModel
+                    Feed, parse, handler and total latencies in milliseconds.
+        """
+        with self._lock:
+            n               = min(self._count, self._window)
+            exchangeTime    = self._exchangeTime[:n].copy()
+            receiveTime     = self._receiveTime[:n].copy()
+            parseDuration   = self._parseDuration[:n].copy()
+            handlerDuration = self._handlerDuration[:n].copy()
+            offset          = self.clockOffsetNs
+
+        # Bring the receive times onto the exchange clock before comparing them with the event times
+        feed = (receiveTime + (offset or 0)) - exchangeTime
+        total = feed + parseDuration + handlerDuration
+
+        return LatencyStatsModel(
+            samples=n,
+            clockOffsetMs=(None if offset == None else offset / 1e6),
+            feed=self._percentiles(feed),
+            parse=self._percentiles(parseDuration),
+            handler=self._percentiles(handlerDuration),
+            total=self._percentiles(total))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._count = 0
+
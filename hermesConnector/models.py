@@ -19,20 +19,22 @@ class ClockReturnModel(HermesBaseModel):
 #
 
 class OrderBaseParams(HermesBaseModel):
-    side        : OrderSide
-    tif         : TimeInForce
+    side            : OrderSide
+    tif             : TimeInForce
+    # Client order ID of the submission. Generated by the connector if not given.
+    clientOrderId   : Optional[str] = None
 
 
 class MarketOrderQtyParams(OrderBaseParams):
-    qty         : float
+    qty             : float
 
 class MarketOrderNotionalParams(OrderBaseParams):
-    cost        : float
+    cost            : float
 
 
 class LimitOrderBaseParams(OrderBaseParams):
-    qty         : int
-    limitPrice  : float
+    qty             : int
+    limitPrice      : float
 
 #
 # Order return models
@@ -58,6 +60,7 @@ class BaseOrderResult(HermesBaseModel):
     side                        : Optional[OrderSide]
     time_in_force               : Optional[TimeInForce]
     status                      : Optional[OrderStatus]
+    client_order_id             : Optional[str] = None
 
     # Raw exchange response as a JSON string. Used for archival and redundancy reasons.
     raw                         : str
@@ -70,6 +73,63 @@ class LimitOrderResult(BaseOrderResult):
     limit_price                 : Optional[float] = None
 
 
+#
+# Account models
+#
+
+class PositionModel(HermesBaseModel):
+    symbol                      : str
+    asset_id                    : Optional[str]
+    # Signed quantity, negative for short positions
+    qty                         : float
+    avg_entry_price             : float
+    cost_basis                  : float
+    current_price               : Optional[float]
+    market_value                : Optional[float]
+    unrealized_pl               : Optional[float]
+
+
+class AccountModel(HermesBaseModel):
+    account_id                  : str
+    currency                    : Optional[str]
+    cash                        : float
+    buying_power                : float
+    equity                      : float
+    portfolio_value             : float
+    long_market_value           : float
+    short_market_value          : float
+    pattern_day_trader          : Optional[bool]
+    trading_blocked             : Optional[bool]
+    # Time of the last change of the values, either a fill or a request to the exchange
+    updated_at                  : datetime
+
+
+#
+# Trading constraint models
+#
+
+class TradingConstraintsModel(HermesBaseModel):
+    symbol                      : str
+    tradable                    : bool
+    # Quantities must be whole numbers, and orders by cost are not accepted, if `False`
+    fractionable                : bool
+    minQty                      : Optional[float] = None
+    maxQty                      : Optional[float] = None
+    # Lot size, quantities must be a multiple of it
+    qtyStep                     : Optional[float] = None
+    # Limits of the order value, quantity times price
+    minNotional                 : Optional[float] = None
+    maxNotional                 : Optional[float] = None
+    minPrice                    : Optional[float] = None
+    maxPrice                    : Optional[float] = None
+    # Tick size, limit prices must be a multiple of it
+    priceStep                   : Optional[float] = None
+    # Tick size of the prices below 1, if it differs from `priceStep`
+    subDollarPriceStep          : Optional[float] = None
+    # Times in force fractional orders are accepted with, `None` for any
+    fractionalTimeInForce       : Optional[list[TimeInForce]] = None
+
+
 #
 # Market Data Models
 #
@@ -82,22 +142,56 @@ class BaseMarketData(HermesBaseModel):
 
             Attributes:
             ----------
-                openTime        (float)   : Open time for the candlestick in epoch milliseconds.
+                openTime        (int)   : Open time for the candlestick in epoch milliseconds.
                 openPrice       (float) : Open price for the candlestick.
                 highPrice       (float) : High price for the candlestick.
                 lowPrice        (float) : Low price for the candlestick.
                 closePrice      (float) : Close price for the candlestick.
-                closeTime       (float)   : Close time for the candlestick in epoch milliseconds.
+                closeTime       (int)   : Close time for the candlestick in epoch milliseconds, the last millisecond within it.
                 volume          (float) : Trade volume for the candlestick.
     """
 
-    openTime        : float
+    openTime        : int
     openPrice       : float
     highPrice       : float
     lowPrice        : float
     closePrice      : float
-    closeTime       : float
+    closeTime       : int
     volume          : float
 
 class LiveMarketData(BaseMarketData):
-    pass
\ No newline at end of file
+    pass
+
+#
+# Diagnostics Models
+#
+
+class LatencyPercentiles(HermesBaseModel):
+    p50             : float
+    p90             : float
+    p99             : float
+    max             : float
+    mean            : float
+
+class LatencyStatsModel(HermesBaseModel):
+
+    """
+
+        Rolling latency statistics of the live bars handled by a connector. All values are in milliseconds.
+
+            Attributes:
+            ----------
+                samples         (int)                   : Number of live bars the statistics were computed over.
+                clockOffsetMs   (Optional[float])       : Estimated exchange clock offset relative to the local clock. `None` if the clock was never sampled.
+                feed            (LatencyPercentiles)    : Exchange event time to local receive time, corrected by the clock offset.
+                parse           (LatencyPercentiles)    : Local receive time to the `dataHandler` call.
+                handler         (LatencyPercentiles)    : Time spent inside the `dataHandler`.
+                total           (LatencyPercentiles)    : Exchange event time to the `dataHandler` return.
+    """
+
+    samples         : int
+    clockOffsetMs   : Optional[float]
+    feed            : LatencyPercentiles
+    parse           : LatencyPercentiles
+    handler         : LatencyPercentiles
+    total           : LatencyPercentiles
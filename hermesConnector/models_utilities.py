@@ -5,8 +5,43 @@
 
 
 # Module imports
-from pydantic import BaseModel, ConfigDict
+from functools import lru_cache
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from pprint import pprint
+import typing_extensions as typing
+
+
+# Process wide default of the trusted mode, see `setTrustedMode`
+_trustedMode = False
+
+# Field names in declaration order and defaults of the optional fields per model class, used by the trusted construction. `None` for the models it does not apply to.
+_fieldSpecs: dict[type, Optional[tuple[tuple[str, ...], dict[str, Any]]]] = {}
+_UNKNOWN = object()
+
+_setattr = object.__setattr__
+
+
+def setTrustedMode(enabled: bool) -> None:
+    """
+        Sets the process wide default of the trusted mode. In trusted mode, models built from exchange data are constructed without validation.
+
+        Validation costs a few microseconds per model, which adds up on order lists and live data. Skipping it is only safe for data the connectors already converted to the field types, which is the case for every model built through `HermesBaseModel.fromExchange`. A malformed exchange response then surfaces later, as a field of the wrong type, instead of as a validation error. Connectors override the default with their `trustedModels` option.
+    """
+    global _trustedMode
+    _trustedMode = enabled
+
+
+def trustedMode() -> bool:
+    return _trustedMode
+
+
+@lru_cache(maxsize=None)
+def typeAdapter(tp: Any) -> TypeAdapter:
+    """
+        Returns a type adapter of `tp`, built once and cached. Building an adapter compiles its validator, so it should not be done per call, e.g. `typeAdapter(list[BaseOrderResult])`.
+    """
+    return TypeAdapter(tp)
 
 
 # Base model definition
@@ -15,5 +50,47 @@ class HermesBaseModel(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @classmethod
+    def fromExchange(cls, trusted: Optional[bool] = None, /, **fields) -> typing.Self:
+        """
+            Builds the model from exchange data, without validation in trusted mode. `trusted` is the setting of the connector, `None` to use the process wide default of `setTrustedMode`.
+        """
+        if (_trustedMode if (trusted == None) else trusted):
+            return cls._trustedConstruct(fields)
+        return cls(**fields)
+
+    @classmethod
+    def _trustedConstruct(cls, fields: dict) -> typing.Self:
+        # `model_construct` is implemented in Python and ends up slower than the compiled validation, so the instance state is set directly instead.
+        # Models that need more than their fields set fall back to it.
+        spec = _fieldSpecs.get(cls, _UNKNOWN)
+        if spec is _UNKNOWN:
+            spec = None
+            if (len(cls.__private_attributes__) == 0) and (cls.__pydantic_post_init__ == None):
+                spec = (
+                    tuple(cls.model_fields),
+                    {name: field.default for name, field in cls.model_fields.items() if field.is_required() != True})
+            _fieldSpecs[cls] = spec
+        if spec == None:
+            return cls.model_construct(**fields)
+
+        # The values have to be in the order of the fields, which is also the order they are serialised in.
+        # The connectors pass every field in that order, anything else is put in order first.
+        names, defaults = spec
+        values = fields
+        if tuple(fields) != names:
+            try:
+                values = {name: (fields[name] if (name in fields) else defaults[name]) for name in names}
+            except KeyError:
+                # A required field is missing
+                return cls.model_construct(**fields)
+
+        instance = cls.__new__(cls)
+        _setattr(instance, "__dict__", values)
+        _setattr(instance, "__pydantic_fields_set__", set(fields))
+        _setattr(instance, "__pydantic_extra__", None)
+        _setattr(instance, "__pydantic_private__", None)
+        return instance
+
     # def __repr__(self):
-    #     pass
\ No newline at end of file
+    #     pass
@@ -0,0 +1,216 @@
+#
+# Local L2 Order Book
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import threading
+import numpy as np
+from bisect import bisect_left
+from collections import deque
+from typing import Iterable, Optional, Tuple
+
+
+# A price level as sent by the exchange, price and quantity as strings or numbers
+Level = Tuple[object, object]
+
+
+class _BookSide:
+
+    # Levels kept in two parallel lists sorted by ascending key, with the best level at the end.
+    # The key is the price for the bids and the negated price for the asks, so most updates, which are close to the top of the book, only move the few levels behind them.
+
+    __slots__ = ("_sign", "keys", "quantities")
+
+    def __init__(self, sign: float):
+        self._sign      = sign
+        self.keys       : list[float] = []
+        self.quantities : list[float] = []
+
+    def clear(self) -> None:
+        self.keys.clear()
+        self.quantities.clear()
+
+    def load(self, levels: Iterable[Level]) -> None:
+        sign = self._sign
+        pairs = sorted((sign * float(price), float(quantity)) for price, quantity in levels if float(quantity) != 0.0)
+        self.keys       = [key for key, _ in pairs]
+        self.quantities = [quantity for _, quantity in pairs]
+
+    def update(self, levels: Iterable[Level]) -> None:
+        sign        = self._sign
+        keys        = self.keys
+        quantities  = self.quantities
+        for price, quantity in levels:
+            key = sign * float(price)
+            quantity = float(quantity)
+            i = bisect_left(keys, key)
+            exists = (i < len(keys)) and (keys[i] == key)
+            if quantity == 0.0:
+                # A zero quantity removes the level, it may also refer to a level the book never had
+                if exists:
+                    del keys[i]
+                    del quantities[i]
+            elif exists:
+                quantities[i] = quantity
+            else:
+                keys.insert(i, key)
+                quantities.insert(i, quantity)
+
+    def level(self, n: int) -> Optional[Tuple[float, float]]:
+        if n >= len(self.keys):
+            return None
+        return (self._sign * self.keys[-1 - n], self.quantities[-1 - n])
+
+    def top(self, depth: int) -> Tuple[np.ndarray, np.ndarray]:
+        depth = min(depth, len(self.keys))
+        if depth == 0:
+            return (np.empty(0), np.empty(0))
+        start = len(self.keys) - depth
+        prices = np.array(self.keys[start:][::-1])
+        if self._sign < 0:
+            prices = -prices
+        return (prices, np.array(self.quantities[start:][::-1]))
+
+
+class LocalOrderBook:
+
+    """
+        In-memory L2 order book of a symbol, built from a depth snapshot and kept current by incremental depth updates.
+
+        Every update carries the range of update IDs it covers. Updates that arrive before the snapshot are buffered and replayed once it is applied, updates already covered by the snapshot are dropped. An update that leaves a gap after the last applied ID means an update was missed; the book then marks itself out of sync and has to be rebuilt from a new snapshot. This follows the Binance rules for managing a local order book.
+
+        The levels of each side are kept in price-sorted arrays, so the best levels and the level at depth `n` are read without searching.
+
+        Parameters
+        ----------
+            symbol: str
+                Symbol of the book.
+            maxPending: int
+                Maximum number of updates buffered while waiting for a snapshot. Older updates are discarded, which only matters if they are newer than the snapshot.
+    """
+
+    def __init__(self, symbol: str, maxPending: int = 10_000):
+        self.symbol         = symbol
+        self._bids          = _BookSide(1.0)
+        self._asks          = _BookSide(-1.0)
+        self._lock          = threading.Lock()
+        self._pending       : deque[Tuple[int, int, Iterable[Level], Iterable[Level]]] = deque(maxlen=maxPending)
+        self._synced        = False
+        self.lastUpdateId   = 0
+        # Number of times the book went out of sync
+        self.resyncs        = 0
+
+    @property
+    def isSynced(self) -> bool:
+        return self._synced
+
+    def reset(self) -> None:
+        """
+            Clears the book and marks it out of sync, updates are buffered until the next snapshot.
+        """
+        with self._lock:
+            self._bids.clear()
+            self._asks.clear()
+            self._synced = False
+            self.lastUpdateId = 0
+
+    def applySnapshot(self, lastUpdateId: int, bids: Iterable[Level], asks: Iterable[Level]) -> bool:
+        """
+            Replaces the book with a depth snapshot and replays the buffered updates on top of it.
+
+            Returns
+            -------
+                bool
+                    `True` if the book is in sync. `False` if the snapshot is older than the buffered updates, in which case a newer snapshot is needed.
+        """
+        with self._lock:
+            self._bids.load(bids)
+            self._asks.load(asks)
+            self.lastUpdateId = lastUpdateId
+            self._synced = True
+            pending = list(self._pending)
+            self._pending.clear()
+            for firstUpdateId, finalUpdateId, bidUpdates, askUpdates in pending:
+                if self._apply(firstUpdateId, finalUpdateId, bidUpdates, askUpdates) != True:
+                    # The updates that were not applied are needed again with the next snapshot
+                    self._pending.extend(pending)
+                    return False
+            return True
+
+    def applyUpdate(self, firstUpdateId: int, finalUpdateId: int, bids: Iterable[Level], asks: Iterable[Level]) -> bool:
+        """
+            Applies an incremental depth update covering the update IDs `firstUpdateId` to `finalUpdateId`. A zero quantity removes the level.
+
+            Returns
+            -------
+                bool
+                    `False` if the update revealed a gap and the book went out of sync, `True` otherwise.
+        """
+        with self._lock:
+            if self._synced != True:
+                self._pending.append((firstUpdateId, finalUpdateId, bids, asks))
+                return True
+            if self._apply(firstUpdateId, finalUpdateId, bids, asks):
+                return True
+            self._pending.append((firstUpdateId, finalUpdateId, bids, asks))
+            return False
+
+    def _apply(self, firstUpdateId: int, finalUpdateId: int, bids: Iterable[Level], asks: Iterable[Level]) -> bool:
+        # Already part of the book
+        if finalUpdateId <= self.lastUpdateId:
+            return True
+        # The update has to continue right after the last applied one, overlaps are fine as the levels are absolute
+        if firstUpdateId > (self.lastUpdateId + 1):
+            self._bids.clear()
+            self._asks.clear()
+            self._synced = False
+            self.resyncs += 1
+            return False
+        self._bids.update(bids)
+        self._asks.update(asks)
+        self.lastUpdateId = finalUpdateId
+        return True
+
+    def bid(self, n: int = 0) -> Optional[Tuple[float, float]]:
+        """
+            Returns the price and quantity of the `n`th best bid, `None` if the book is not that deep.
+        """
+        with self._lock:
+            return self._bids.level(n)
+
+    def ask(self, n: int = 0) -> Optional[Tuple[float, float]]:
+        """
+            Returns the price and quantity of the `n`th best ask, `None` if the book is not that deep.
+        """
+        with self._lock:
+            return self._asks.level(n)
+
+    def spread(self) -> Optional[float]:
+        with self._lock:
+            bid = self._bids.level(0)
+            ask = self._asks.level(0)
+        if (bid == None) or (ask == None):
+            return None
+        return ask[0] - bid[0]
+
+    def depth(self) -> Tuple[int, int]:
+        """
+            Returns the number of bid and ask levels in the book.
+        """
+        return (len(self._bids.keys), len(self._asks.keys))
+
+    def snapshot(self, depth: int = 10) -> dict[str, np.ndarray]:
+        """
+            Returns a copy of the best `depth` levels of each side, best level first, as the columns "bidPrice", "bidSize", "askPrice" and "askSize". A side with fewer levels gives shorter columns.
+        """
+        with self._lock:
+            bidPrice, bidSize = self._bids.top(depth)
+            askPrice, askSize = self._asks.top(depth)
+        return {
+            "bidPrice"  : bidPrice,
+            "bidSize"   : bidSize,
+            "askPrice"  : askPrice,
+            "askSize"   : askSize,
+        }
@@ -0,0 +1,225 @@
+#
+# Local Order History Store
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .models import BaseOrderResult
+from .models_utilities import typeAdapter
+from .hermes_enums import OrderStatus
+
+if TYPE_CHECKING:
+    from .connector_template import ConnectorTemplate
+
+
+# Statuses of the orders that can still change
+OPEN_STATUSES = [
+    OrderStatus.NEW,
+    OrderStatus.PARTIALLY_FILLED,
+    OrderStatus.ACCEPTED,
+    OrderStatus.PENDING_NEW,
+    OrderStatus.PENDING_CANCEL,
+    OrderStatus.PENDING_REPLACE,
+    OrderStatus.PENDING_REVIEW,
+    OrderStatus.ACCEPTED_FOR_BIDDING,
+    OrderStatus.STOPPED,
+    OrderStatus.SUSPENDED,
+    OrderStatus.CALCULATED,
+    OrderStatus.HELD,
+    OrderStatus.DONE_FOR_DAY,
+]
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS orders (
+        order_id            TEXT PRIMARY KEY,
+        client_order_id     TEXT,
+        symbol              TEXT,
+        status              TEXT,
+        submitted_at        INTEGER NOT NULL,
+        updated_at          INTEGER NOT NULL,
+        data                TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS orders_client_order_id ON orders (client_order_id);
+    CREATE INDEX IF NOT EXISTS orders_symbol_submitted_at ON orders (symbol, submitted_at);
+    CREATE INDEX IF NOT EXISTS orders_status ON orders (status);
+    CREATE INDEX IF NOT EXISTS orders_submitted_at ON orders (submitted_at);
+"""
+
+# An order is only replaced by a version that is at least as recent
+_UPSERT = """
+    INSERT INTO orders (order_id, client_order_id, symbol, status, submitted_at, updated_at, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (order_id) DO UPDATE SET
+        client_order_id = excluded.client_order_id,
+        symbol          = excluded.symbol,
+        status          = excluded.status,
+        submitted_at    = excluded.submitted_at,
+        updated_at      = excluded.updated_at,
+        data            = excluded.data
+    WHERE excluded.updated_at >= orders.updated_at
+"""
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _toMicros(value: datetime) -> int:
+    # Exact integer arithmetic, as the float timestamp can be off by a microsecond
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+class OrderStore:
+
+    """
+        Embedded SQLite store of every order a connector has seen, indexed by order ID, client order ID, symbol, status and submission time.
+
+        Attach it to a connector through `attachOrderStore`, after which the orders returned by the connector are recorded and `queryOrder` and `getAllOrders` are served from the store while it is fresh. `sync` brings the store up to date incrementally.
+
+        Parameters
+        ----------
+            path: str
+                Path of the database file, ":memory:" for a store that is not persisted.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Monotonic time of the last completed sync, `None` before the first one
+        self._lastSyncTime: Optional[float] = None
+
+    def upsert(self, orders: Iterable[BaseOrderResult]) -> None:
+        """
+            Inserts the orders, or updates the stored ones with newer versions.
+        """
+        rows = [(
+            order.order_id,
+            order.client_order_id,
+            order.symbol,
+            (None if (order.status == None) else order.status.value),
+            _toMicros(order.submitted_at),
+            _toMicros(order.updated_at),
+            order.model_dump_json()) for order in orders]
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+
+    def _select(self, query: str, parameters: tuple) -> list[BaseOrderResult]:
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        # The rows are parsed as a single JSON array, in one call to the validator
+        return typeAdapter(list[BaseOrderResult]).validate_json("[" + ",".join(row[0] for row in rows) + "]")
+
+    def get(self, orderId: str) -> Optional[BaseOrderResult]:
+        orders = self._select("SELECT data FROM orders WHERE order_id = ?", (orderId,))
+        return orders[0] if (len(orders) > 0) else None
+
+    def getByClientId(self, clientOrderId: str) -> Optional[BaseOrderResult]:
+        orders = self._select("SELECT data FROM orders WHERE client_order_id = ?", (clientOrderId,))
+        return orders[0] if (len(orders) > 0) else None
+
+    def query(
+            self,
+            symbols: Optional[list[str]] = None,
+            statuses: Optional[list[OrderStatus]] = None,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            newestFirst: bool = False) -> list[BaseOrderResult]:
+        """
+            Returns the stored orders matching all the given filters, ordered by submission time.
+
+            Parameters
+            ----------
+                symbols: Optional[list[str]]
+                    Only the orders of these symbols.
+                statuses: Optional[list[OrderStatus]]
+                    Only the orders in these statuses.
+                start: Optional[datetime]
+                    Only orders submitted after this time.
+                end: Optional[datetime]
+                    Only orders submitted until this time.
+                limit: Optional[int]
+                    Maximum number of orders returned.
+                newestFirst: bool
+                    Order by descending submission time.
+
+            Returns
+            -------
+                list[BaseOrderResult]
+                    The matching orders.
+        """
+        conditions: list[str] = []
+        parameters: list = []
+        if symbols != None:
+            conditions.append(f"symbol IN ({', '.join('?' * len(symbols))})")
+            parameters += symbols
+        if statuses != None:
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            parameters += [status.value for status in statuses]
+        if start != None:
+            conditions.append("submitted_at > ?")
+            parameters.append(_toMicros(start))
+        if end != None:
+            conditions.append("submitted_at <= ?")
+            parameters.append(_toMicros(end))
+
+        query = "SELECT data FROM orders"
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY submitted_at " + ("DESC" if newestFirst else "ASC")
+        if limit != None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        return self._select(query, tuple(parameters))
+
+    def _syncCursor(self) -> Optional[datetime]:
+        # Orders submitted after the newest stored one are new. Orders that were still open can have changed since, so the sync has to reach back to the oldest of those.
+        openStatuses = [status.value for status in OPEN_STATUSES]
+        with self._lock:
+            newest = self._connection.execute("SELECT MAX(submitted_at) FROM orders").fetchone()[0]
+            oldestOpen = self._connection.execute(
+                f"SELECT MIN(submitted_at) FROM orders WHERE status IN ({', '.join('?' * len(openStatuses))})",
+                openStatuses).fetchone()[0]
+        if newest == None:
+            return None
+        cursor = newest if (oldestOpen == None) else min(newest, oldestOpen)
+        # Orders submitted in the same microsecond as the cursor are requested again, the upsert drops the duplicates
+        return _EPOCH + timedelta(microseconds=(cursor - 1))
+
+    def sync(self, connector: "ConnectorTemplate", symbols: Optional[list[str]] = None, batchSize: int = 500) -> int:
+        """
+            Brings the store up to date through `iterOrders` of the connector, requesting only the orders submitted since the newest stored order, or since the oldest stored order that was still open.
+
+            Returns
+            -------
+                int
+                    Number of orders received.
+        """
+        count = 0
+        batch: list[BaseOrderResult] = []
+        for order in connector.iterOrders(start=self._syncCursor(), symbols=symbols, batchSize=batchSize):
+            batch.append(order)
+            if len(batch) >= batchSize:
+                self.upsert(batch)
+                count += len(batch)
+                batch = []
+        self.upsert(batch)
+        count += len(batch)
+        self._lastSyncTime = time.monotonic()
+        return count
+
+    def isFresh(self, maxStaleness: float) -> bool:
+        """
+            Returns `True` if the store was synced within the last `maxStaleness` seconds.
+        """
+        return (self._lastSyncTime != None) and ((time.monotonic() - self._lastSyncTime) <= maxStaleness)
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,102 @@
+#
+# Local OHLCV Resampling
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import numpy as np
+from typing_extensions import Literal
+
+from .hermes_enums import TimeframeUnit
+from .hermes_exceptions import UnsupportedParameterValue
+from .timeframe import TimeFrame
+
+
+# Alignment of the resampled candlesticks
+#   "utc"       : Aligned to UTC boundaries (the hour, midnight, Monday midnight for weeks).
+#   "session"   : Intraday candlesticks aligned to the first candlestick of each trading session, e.g. 9:30, 10:30 for US equities.
+Alignment = Literal["utc", "session"]
+
+_DAY_MS = 86_400_000
+
+# The epoch fell on a Thursday, weeks are aligned to the following Monday
+_WEEK_ANCHOR_MS = 4 * _DAY_MS
+
+
+def _sessionAnchors(openTime: np.ndarray, sessionGapMs: int) -> np.ndarray:
+    # A session starts at the first bar and after every gap longer than `sessionGapMs`
+    sessionStart = np.empty(len(openTime), dtype=bool)
+    sessionStart[:1] = True
+    np.greater(np.diff(openTime), sessionGapMs, out=sessionStart[1:])
+    startIndices = np.flatnonzero(sessionStart)
+    # Spread the open time of each session's first bar over the whole session
+    sessionIds = np.cumsum(sessionStart) - 1
+    return openTime[startIndices][sessionIds]
+
+
+def resampleColumns(
+        columns: dict[str, np.ndarray],
+        baseTimeFrame: TimeFrame,
+        targetTimeFrame: TimeFrame,
+        alignment: Alignment = "utc",
+        sessionGapMs: int = 3_600_000) -> dict[str, np.ndarray]:
+    """
+        Aggregates OHLCV columns of a finer timeframe into a coarser one, vectorised over the whole input.
+
+        Parameters
+        ----------
+            columns: dict[str, np.ndarray]
+                `openTime`, `open`, `high`, `low`, `close` and `volume` columns, sorted by `openTime` in epoch milliseconds.
+            baseTimeFrame: TimeFrame
+                Timeframe of the input columns.
+            targetTimeFrame: TimeFrame
+                Timeframe to aggregate into. Its length has to be a multiple of the base timeframe's.
+            alignment: Alignment
+                "utc" to align the candlesticks to UTC boundaries, "session" to align them to the start of each trading session.
+            sessionGapMs: int
+                With "session" alignment, a gap between two bars longer than this starts a new session.
+
+        Returns
+        -------
+            dict[str, np.ndarray]
+                The aggregated columns, including `closeTime`.
+    """
+    baseMs      = baseTimeFrame.durationMs
+    targetMs    = targetTimeFrame.durationMs
+    if (targetMs % baseMs) != 0:
+        raise UnsupportedParameterValue
+
+    openTime = np.asarray(columns["openTime"], dtype=np.int64)
+    if len(openTime) == 0:
+        empty = {name: np.zeros(0, dtype=np.float64) for name in ["open", "high", "low", "close", "volume"]}
+        return empty | {"openTime": openTime, "closeTime": openTime}
+
+    # Daily and weekly candlesticks span whole sessions, so only the intraday ones are aligned to the session start
+    anchor = _WEEK_ANCHOR_MS if (targetTimeFrame.unit == TimeframeUnit.WEEK) else 0
+    match alignment:
+        case "utc":
+            pass
+        case "session":
+            if targetMs < _DAY_MS:
+                anchor = _sessionAnchors(openTime, sessionGapMs)
+        case _:
+            raise UnsupportedParameterValue
+
+    # Bucket of every bar, and the index range of every bucket
+    bucket      = (openTime - anchor) // targetMs
+    bucketStart = (bucket * targetMs) + anchor
+    boundaries  = np.flatnonzero(np.diff(bucketStart)) + 1
+    starts      = np.concatenate(([0], boundaries))
+    ends        = np.concatenate((boundaries, [len(openTime)]))
+
+    resampledOpenTime = bucketStart[starts]
+    return {
+        "openTime"      : resampledOpenTime,
+        "open"          : np.asarray(columns["open"])[starts],
+        "high"          : np.maximum.reduceat(np.asarray(columns["high"]), starts),
+        "low"           : np.minimum.reduceat(np.asarray(columns["low"]), starts),
+        "close"         : np.asarray(columns["close"])[ends - 1],
+        "volume"        : np.add.reduceat(np.asarray(columns["volume"]), starts),
+        "closeTime"     : resampledOpenTime + (targetMs - 1),
+    }
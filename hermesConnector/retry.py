@@ -0,0 +1,106 @@
+#
+# Retry Policy for Idempotent Requests
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import time
+import random
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait, FIRST_COMPLETED
+from typing import Any, Callable, Optional
+from pydantic import PrivateAttr
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+
+from .models_utilities import HermesBaseModel
+from .hermes_exceptions import InternalConnectionError, RequestTimeout, TooManyRequests
+
+
+# HTTP status codes worth retrying
+TRANSIENT_STATUS_CODES = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+
+def isTransientError(err: BaseException) -> bool:
+    """
+        Returns `True` if the error is likely to go away when the request is repeated (network failures, timeouts, rate limits and server side errors).
+    """
+    if isinstance(err, (RequestsConnectionError, RequestsTimeout, InternalConnectionError, RequestTimeout, TooManyRequests)):
+        return True
+    # Both the Alpaca and Binance SDK exceptions carry the HTTP status code
+    statusCode = getattr(err, "status_code", None)
+    return statusCode in TRANSIENT_STATUS_CODES
+
+
+class RetryPolicy(HermesBaseModel):
+
+    """
+
+        Retry policy for idempotent requests, such as order queries and historical data.
+
+            Attributes:
+            ----------
+                maxAttempts     (int)               : Maximum number of attempts, including the first one.
+                baseDelay       (float)             : Backoff delay before the first retry in seconds. Doubled on every consecutive retry.
+                maxDelay        (float)             : Upper bound of the backoff delay in seconds.
+                hedgeAfter      (Optional[float])   : If set, a duplicate request is sent when the first one has not returned after this many seconds. The first response to arrive is kept.
+                hedgeWorkers    (int)               : Size of the thread pool used for hedged requests.
+    """
+
+    maxAttempts         : int = 3
+    baseDelay           : float = 0.1
+    maxDelay            : float = 2.0
+    hedgeAfter          : Optional[float] = None
+    hedgeWorkers        : int = 4
+
+    _executor           : Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+
+    def backoffDelay(self, attempt: int) -> float:
+        """
+            Returns the delay before retry number `attempt` (starting at 1), with full jitter applied to the exponential backoff.
+        """
+        ceiling = min(self.maxDelay, self.baseDelay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _hedgedCall(self, call: Callable[[], Any]) -> Any:
+        if self._executor == None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.hedgeWorkers,
+                thread_name_prefix="hermes-hedge")
+
+        # Give the primary request until the hedging threshold before duplicating it
+        primary = self._executor.submit(call)
+        try:
+            return primary.result(timeout=self.hedgeAfter)
+        except FuturesTimeoutError:
+            pass
+        hedge = self._executor.submit(call)
+
+        # Keep the first successful response, only fail if both requests failed
+        pending = {primary, hedge}
+        lastErr: Optional[BaseException] = None
+        while len(pending) > 0:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                err = future.exception()
+                if err == None:
+                    return future.result()
+                lastErr = err
+        raise lastErr # type: ignore
+
+    def execute(self, func: Callable, *args, **kwargs) -> Any:
+        """
+            Calls `func` with the given arguments, retrying on transient errors according to the policy. Non-transient errors, and the last transient one, are raised as is.
+        """
+        call = partial(func, *args, **kwargs)
+        attempt = 0
+        while True:
+            try:
+                if self.hedgeAfter == None:
+                    return call()
+                return self._hedgedCall(call)
+            except Exception as err:
+                attempt += 1
+                if (attempt >= self.maxAttempts) or (not isTransientError(err)):
+                    raise err
+                time.sleep(self.backoffDelay(attempt))
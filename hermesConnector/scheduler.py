@@ -0,0 +1,192 @@
+#
+# Market Hours Aware Live Data Scheduler
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .connector_template import ConnectorTemplate
+
+
+# Extended hours of the US equity markets, relative to the regular session (4:00 to 9:30 and 16:00 to 20:00 ET)
+PRE_MARKET      = timedelta(hours=5, minutes=30)
+AFTER_HOURS     = timedelta(hours=4)
+
+
+class LiveDataScheduler:
+
+    """
+        Keeps the live data of a connector connected only while its market trades.
+
+        The scheduler connects the live data shortly before the open and disconnects it after the close, as told by the exchange clock of the connector. Whenever it reconnects, the bars missed while disconnected are replayed through `backfillLiveData` first. Assets trading around the clock, as reported by `hasTradingSessions`, are kept connected.
+
+        If started while the market is closed, the scheduler waits for the next session; the after hours of a session that already closed are not covered.
+
+        Live data that stops on its own, e.g. on an authentication or connection limit error, is reconnected with an exponential backoff, starting at `reconnectDelay` and capped by `recheckInterval`.
+
+        Parameters
+        ----------
+            connector: ConnectorTemplate
+                Connector whose live data is scheduled.
+            preOpen: float
+                Seconds before the open to connect at.
+            postClose: float
+                Seconds after the close to disconnect at.
+            extendedHours: bool
+                Also cover the pre-market and after hours sessions.
+            backfill: bool
+                Replay the missed bars on reconnect.
+            recheckInterval: float
+                Maximum time in seconds to wait before the clock is checked again, so that schedule changes are picked up.
+            reconnectDelay: float
+                Seconds to wait before the first reconnect of live data that stopped on its own.
+            onError: Optional[Callable[[Exception], None]]
+                Called with the errors of the clock requests and of the live data, which the scheduler keeps running through. The last one is also kept in `lastError`.
+    """
+
+    # Connections lasting this many seconds reset the reconnect backoff
+    _stableConnection = 60.0
+
+    def __init__(
+            self,
+            connector: "ConnectorTemplate",
+            preOpen: float = 300.0,
+            postClose: float = 60.0,
+            extendedHours: bool = False,
+            backfill: bool = True,
+            recheckInterval: float = 3600.0,
+            reconnectDelay: float = 1.0,
+            onError: Optional[Callable[[Exception], None]] = None):
+        self._connector         = connector
+        self._preOpen           = timedelta(seconds=preOpen)
+        self._postClose         = timedelta(seconds=postClose)
+        self._extendedHours     = extendedHours
+        self._backfill          = backfill
+        self._recheckInterval   = recheckInterval
+        self._reconnectDelay    = reconnectDelay
+        self._onError           = onError
+        self.lastError          : Optional[Exception] = None
+
+        self._stopEvent         = threading.Event()
+        # Set on stop and whenever the live data ends, to check the schedule straight away
+        self._wakeEvent         = threading.Event()
+        self._thread            : Optional[threading.Thread] = None
+        self._liveThread        : Optional[threading.Thread] = None
+        # End of the window the live data was connected for
+        self._end               : Optional[datetime] = None
+        # Consecutive reconnects of live data that stopped on its own, and the start of the current connection
+        self._failures          = 0
+        self._connectedAt       = 0.0
+
+    @property
+    def isConnected(self) -> bool:
+        return (self._liveThread != None) and self._liveThread.is_alive()
+
+    def _window(self) -> Tuple[datetime, datetime, Optional[datetime]]:
+        # Returns the current time and the start and end of the next connection window, `None` as the end for continuous trading
+        clock = self._connector.exchangeClock()
+        now = clock.currentTimestamp
+        if self._connector.hasTradingSessions() != True:
+            return now, now, None
+        start   = clock.nextOpen - self._preOpen
+        end     = clock.nextClose + self._postClose
+        if self._extendedHours:
+            start   -= PRE_MARKET
+            end     += AFTER_HOURS
+        # While the market is open, the next open belongs to the following session
+        if clock.isOpen:
+            start = now
+        return now, start, end
+
+    def _reportError(self, err: Exception) -> None:
+        self.lastError = err
+        if self._onError != None:
+            self._onError(err)
+
+    def _runLiveData(self) -> None:
+        try:
+            self._connector.initiateLiveData()
+        except Exception as err:
+            self._reportError(err)
+        finally:
+            self._wakeEvent.set()
+
+    def _connect(self) -> None:
+        if self._backfill:
+            self._connector.backfillLiveData()
+        self._connectedAt = time.monotonic()
+        self._liveThread = threading.Thread(target=self._runLiveData, daemon=True)
+        self._liveThread.start()
+
+    def _disconnect(self) -> None:
+        if self._liveThread == None:
+            return
+        self._connector.stop()
+        self._liveThread.join(timeout=10)
+        self._liveThread = None
+
+    def _step(self) -> Optional[float]:
+        # Connects or disconnects as the schedule requires, returns the seconds until the next check, `None` to wait until stopped
+        if (self._liveThread != None) and (self._liveThread.is_alive() != True):
+            # The live data stopped on its own, it is reconnected once the backoff has passed
+            self._liveThread = None
+            if (time.monotonic() - self._connectedAt) >= self._stableConnection:
+                self._failures = 0
+            self._failures += 1
+            return min(self._reconnectDelay * (2 ** (self._failures - 1)), self._recheckInterval)
+
+        now, start, end = self._window()
+        if self._liveThread != None:
+            # The end of the window is kept from the connection, as the clock moves on to the next session at the close
+            if self._end == None:
+                return None
+            if now < self._end:
+                return min((self._end - now).total_seconds(), self._recheckInterval)
+            self._disconnect()
+        if now < start:
+            return min((start - now).total_seconds(), self._recheckInterval)
+
+        self._connect()
+        self._end = end
+        if end == None:
+            return None
+        # Waits are capped by the recheck interval, the current time is taken from the clock again after each one
+        return min((end - now).total_seconds(), self._recheckInterval)
+
+    def _run(self) -> None:
+        while self._stopEvent.is_set() != True:
+            try:
+                wait = self._step()
+            except Exception as err:
+                # A failed clock request or reconnect leaves the live data as it is, the schedule is checked again after the recheck interval
+                self._reportError(err)
+                wait = self._recheckInterval
+            self._wakeEvent.wait(wait)
+            self._wakeEvent.clear()
+        self._disconnect()
+
+    def start(self) -> "LiveDataScheduler":
+        """
+            Starts the scheduler in a background thread.
+        """
+        self._stopEvent.clear()
+        self._wakeEvent.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+            Stops the scheduler and disconnects the live data.
+        """
+        self._stopEvent.set()
+        self._wakeEvent.set()
+        if self._thread != None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,216 @@
+#
+# Cross-Process Shared Memory Bar Store
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import sys
+import time
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+from typing import Optional
+
+from .models import LiveMarketData
+from .hermes_exceptions import UnexpectedInput
+
+
+# Column layout of the ring, one float64 row per column
+BAR_COLUMNS = ["openTime", "open", "high", "low", "close", "closeTime", "volume"]
+
+# Header fields, stored as int64 in front of the columns
+_HEADER_MAGIC           = 0
+_HEADER_SCHEMA          = 1
+_HEADER_CAPACITY        = 2
+_HEADER_COUNT           = 3
+_HEADER_SEQUENCE        = 4
+_HEADER_SIZE            = 8
+
+_MAGIC                  = 0x4845524D4553     # "HERMES"
+_SCHEMA_VERSION         = 1
+
+# Blocks created by this process, their resource tracker registration belongs to the publisher
+_createdNames: set[str] = set()
+
+
+class SharedBarRing:
+
+    """
+        Columnar ring buffer of live bars in a `multiprocessing.shared_memory` block.
+
+        A single publisher process writes bars into the ring, any number of reader processes attach to it by name. Writes are guarded by a sequence lock: the sequence counter is odd while a write is in progress, so readers never block the publisher and retry the rare reads that overlap a write. The sequence counter doubles as a change notification, as it grows by two on every published bar.
+
+        Use `SharedBarRing.create` in the publishing process and `SharedBarRing.attach` in the readers.
+    """
+
+    def __init__(
+            self,
+            shm: shared_memory.SharedMemory,
+            owner: bool):
+        self._shm       = shm
+        self._owner     = owner
+        self._header    = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+
+        if (self._header[_HEADER_MAGIC] != _MAGIC) or (self._header[_HEADER_SCHEMA] != _SCHEMA_VERSION):
+            raise UnexpectedInput
+
+        self._capacity  = int(self._header[_HEADER_CAPACITY])
+        self._columns   = np.ndarray(
+            (len(BAR_COLUMNS), self._capacity),
+            dtype=np.float64,
+            buffer=shm.buf,
+            offset=(_HEADER_SIZE * 8))
+
+    @classmethod
+    def create(cls, name: str, capacity: int = 4096) -> "SharedBarRing":
+        """
+            Creates a new ring and returns its publisher handle.
+        """
+        size = (_HEADER_SIZE * 8) + (len(BAR_COLUMNS) * capacity * 8)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_HEADER_MAGIC]       = _MAGIC
+        header[_HEADER_SCHEMA]      = _SCHEMA_VERSION
+        header[_HEADER_CAPACITY]    = capacity
+        _createdNames.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedBarRing":
+        """
+            Attaches to an existing ring and returns a read-only handle.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False) # type: ignore
+        else:
+            # Before 3.13, attaching registers the block with the resource tracker, which would unlink it when the reader exits.
+            # The registration is undone straight away, so the publisher keeps sole ownership of the block.
+            # A reader in the publishing process shares its registration, which is left to the publisher.
+            shm = shared_memory.SharedMemory(name=name)
+            if (sys.platform != "win32") and (shm.name not in _createdNames):
+                resource_tracker.unregister(shm._name, "shared_memory") # type: ignore
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        """
+            Total number of bars published since the ring was created, including the ones that were overwritten.
+        """
+        return int(self._header[_HEADER_COUNT])
+
+    @property
+    def version(self) -> int:
+        """
+            Change counter of the ring. Compare against a previously read value to check for new data.
+        """
+        return int(self._header[_HEADER_SEQUENCE])
+
+    def publish(self, bar: LiveMarketData) -> None:
+        """
+            Writes a bar into the ring. A bar with the same open time as the latest one revises it in place, otherwise a new slot is used.
+        """
+        if (self._owner != True):
+            raise UnexpectedInput
+        header  = self._header
+        columns = self._columns
+        count   = int(header[_HEADER_COUNT])
+
+        # Open the write, readers retry until the sequence is even again
+        header[_HEADER_SEQUENCE] += 1
+
+        lastIndex = (count - 1) % self._capacity
+        if (count > 0) and (columns[0, lastIndex] == bar.openTime):
+            index = lastIndex
+        else:
+            index = count % self._capacity
+            count += 1
+        columns[0, index] = bar.openTime
+        columns[1, index] = bar.openPrice
+        columns[2, index] = bar.highPrice
+        columns[3, index] = bar.lowPrice
+        columns[4, index] = bar.closePrice
+        columns[5, index] = bar.closeTime
+        columns[6, index] = bar.volume
+        header[_HEADER_COUNT] = count
+
+        header[_HEADER_SEQUENCE] += 1
+
+    def view(self) -> dict[str, np.ndarray]:
+        """
+            Returns zero-copy views of the raw ring columns, in slot order rather than chronological order. The views are not guarded against concurrent writes; use `read` for a consistent copy.
+        """
+        return {column: self._columns[i] for i, column in enumerate(BAR_COLUMNS)}
+
+    def read(self, n: Optional[int] = None) -> dict[str, np.ndarray]:
+        """
+            Returns a consistent copy of the latest `n` bars (all available bars by default) in chronological order.
+        """
+        while True:
+            startSequence = int(self._header[_HEADER_SEQUENCE])
+            if (startSequence % 2) == 1:
+                continue
+
+            count       = int(self._header[_HEADER_COUNT])
+            available   = min(count, self._capacity)
+            size        = available if (n == None) else min(n, available)
+            # Chronological indices of the last `size` slots
+            indices     = np.arange(count - size, count) % self._capacity
+            data        = self._columns[:, indices]
+
+            if int(self._header[_HEADER_SEQUENCE]) == startSequence:
+                return {column: data[i] for i, column in enumerate(BAR_COLUMNS)}
+
+    def latest(self) -> Optional[LiveMarketData]:
+        """
+            Returns the most recent bar, or `None` if nothing was published yet.
+        """
+        data = self.read(1)
+        if len(data["openTime"]) == 0:
+            return None
+        return LiveMarketData(
+            openTime=float(data["openTime"][0]),
+            openPrice=float(data["open"][0]),
+            highPrice=float(data["high"][0]),
+            lowPrice=float(data["low"][0]),
+            closePrice=float(data["close"][0]),
+            closeTime=float(data["closeTime"][0]),
+            volume=float(data["volume"][0]))
+
+    def waitForUpdate(self, lastVersion: int, timeout: Optional[float] = None) -> int:
+        """
+            Blocks until the ring changes from `lastVersion` and returns the new version. Spins briefly before backing off to short sleeps. Returns `lastVersion` if the timeout expired.
+        """
+        deadline = None if (timeout == None) else (time.monotonic() + timeout)
+        spins = 0
+        while True:
+            currentVersion = self.version
+            if (currentVersion != lastVersion) and ((currentVersion % 2) == 0):
+                return currentVersion
+            if (deadline != None) and (time.monotonic() >= deadline):
+                return lastVersion
+            spins += 1
+            if spins > 1000:
+                time.sleep(0.0005)
+
+    def close(self) -> None:
+        # The numpy views have to be released before the block can be closed
+        del self._header
+        del self._columns
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+            Removes the shared memory block. Only meaningful for the publisher handle.
+        """
+        if self._owner:
+            self._shm.unlink()
+            _createdNames.discard(self._shm.name)
@@ -0,0 +1,127 @@
+#
+# Alpaca Multi-Symbol Stream Manager
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import asyncio
+import threading
+from typing import Callable, Optional, Union
+
+from alpaca.data.live import StockDataStream, CryptoDataStream
+from alpaca.data.models.bars import Bar
+from alpaca.trading import enums as AlpacaTradingEnums
+
+from .hermes_exceptions import UnsupportedFeature
+
+
+# A bar handler, either a plain function or a coroutine function
+BarHandler = Callable[[Bar], object]
+
+
+class AlpacaStreamManager:
+
+    """
+        Multiplexes the bars of many symbols over a single Alpaca data stream connection.
+
+        The stream runs in a background thread, so starting it does not block. Symbols can be subscribed and unsubscribed at any time, also while the stream is running, and every bar is routed to the handlers of its symbol. Coroutine handlers are awaited on the stream's event loop, plain functions are called directly; either way, a slow handler delays the bars of every symbol.
+
+        Connectors use a manager through `Alpaca.initiateLiveData(streamManager=...)`, so that any number of them share one connection.
+
+        Parameters
+        ----------
+            stream: Union[StockDataStream, CryptoDataStream]
+                The data stream to multiplex. Use `AlpacaStreamManager.create` to create one from credentials.
+    """
+
+    def __init__(self, stream: Union[StockDataStream, CryptoDataStream]):
+        self._stream    = stream
+        self._lock      = threading.Lock()
+        # Handlers are kept in tuples, replaced on every change, so routing never sees a half-updated list
+        self._handlers  : dict[str, tuple[tuple[BarHandler, bool], ...]] = {}
+        self._thread    : Optional[threading.Thread] = None
+
+    @classmethod
+    def create(
+            cls,
+            credentials: list,
+            assetClass: AlpacaTradingEnums.AssetClass = AlpacaTradingEnums.AssetClass.US_EQUITY) -> "AlpacaStreamManager":
+        """
+            Creates a manager with a new stock or crypto data stream.
+        """
+        match assetClass:
+            case AlpacaTradingEnums.AssetClass.US_EQUITY:
+                stream = StockDataStream(api_key=credentials[0], secret_key=credentials[1])
+            case AlpacaTradingEnums.AssetClass.CRYPTO:
+                stream = CryptoDataStream(api_key=credentials[0], secret_key=credentials[1])
+            case _:
+                raise UnsupportedFeature
+        return cls(stream)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._handlers.keys())
+
+    @property
+    def isRunning(self) -> bool:
+        return (self._thread != None) and self._thread.is_alive()
+
+    async def _route(self, bar: Bar) -> None:
+        for handler, isCoroutine in self._handlers.get(bar.symbol, ()):
+            if isCoroutine:
+                await handler(bar) # type: ignore
+            else:
+                handler(bar)
+
+    def subscribe(self, symbols: Union[str, list[str]], handler: BarHandler) -> None:
+        """
+            Routes the bars of `symbols` to `handler`. Symbols new to the stream are subscribed with a single request. Must not be called from within a handler.
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        entry = (handler, asyncio.iscoroutinefunction(handler))
+        with self._lock:
+            newSymbols = [symbol for symbol in symbols if symbol not in self._handlers]
+            for symbol in symbols:
+                self._handlers[symbol] = self._handlers.get(symbol, ()) + (entry,)
+            if len(newSymbols) > 0:
+                self._stream.subscribe_bars(self._route, *newSymbols)
+
+    def unsubscribe(self, symbols: Union[str, list[str]], handler: Optional[BarHandler] = None) -> None:
+        """
+            Stops routing the bars of `symbols` to `handler`, or to any handler if `None`. Symbols left without handlers are unsubscribed from the stream. Must not be called from within a handler.
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        with self._lock:
+            removedSymbols = []
+            for symbol in symbols:
+                if symbol not in self._handlers:
+                    continue
+                remaining = tuple(entry for entry in self._handlers[symbol] if (handler != None) and (entry[0] != handler))
+                if len(remaining) > 0:
+                    self._handlers[symbol] = remaining
+                else:
+                    del self._handlers[symbol]
+                    removedSymbols.append(symbol)
+            if len(removedSymbols) > 0:
+                self._stream.unsubscribe_bars(*removedSymbols)
+
+    def start(self) -> "AlpacaStreamManager":
+        """
+            Runs the stream in a background thread. The connection is only opened once a symbol is subscribed.
+        """
+        if self.isRunning != True:
+            self._thread = threading.Thread(target=self._stream.run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+            Closes the connection and stops the background thread.
+        """
+        if self.isRunning:
+            self._stream.stop()
+            self._thread.join(timeout=10) # type: ignore
+        self._thread = None
@@ -0,0 +1,138 @@
+#
+# Columnar Tick Buffers
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import time
+import numpy as np
+from typing import Callable, Optional
+
+
+# Column layouts of the buffers. Times are epoch nanoseconds, everything else is float64.
+TRADE_COLUMNS = ["time", "price", "size"]
+QUOTE_COLUMNS = ["time", "bidPrice", "bidSize", "askPrice", "askSize"]
+
+# A batch handler, receives the buffered ticks as a dictionary of column views
+TickBatchHandler = Callable[[dict[str, np.ndarray]], object]
+
+
+class TickBuffer:
+
+    """
+        Preallocated columnar buffer that collects ticks and hands them to a handler in batches.
+
+        Ticks are written into fixed columns as they arrive, no object is kept per tick. Once `batchSize` ticks are buffered, or `maxDelay` seconds passed since the first tick of the batch, the handler is called with views of the filled part of the columns. The views are only valid for the duration of the call, as the columns are reused for the next batch; copy them to keep the data.
+
+        The delay is checked when a tick arrives, a quiet market can leave a partial batch in the buffer until the next tick. Call `flush` to deliver it earlier.
+
+        Use `TradeBuffer` and `QuoteBuffer`, which are returned by `subscribeTrades` and `subscribeQuotes` of the connectors.
+
+        Parameters
+        ----------
+            columns: list[str]
+                Names of the columns, the first one holds the tick time in epoch nanoseconds.
+            handler: TickBatchHandler
+                Called with every batch, in the thread the ticks are received in.
+            batchSize: int
+                Capacity of the buffer, a full buffer is always delivered.
+            maxDelay: Optional[float]
+                Maximum age of a batch in seconds, `None` to only deliver full batches.
+    """
+
+    def __init__(
+            self,
+            columns: list[str],
+            handler: TickBatchHandler,
+            batchSize: int = 256,
+            maxDelay: Optional[float] = 0.05):
+        self._handler   = handler
+        self._batchSize = batchSize
+        self._maxDelay  = maxDelay
+        self._columns   = [np.empty(batchSize, dtype=(np.int64 if (i == 0) else np.float64)) for i in range(len(columns))]
+        self._names     = columns
+        self._count     = 0
+        # Monotonic time the first tick of the current batch was received at
+        self._batchStart = 0.0
+        # Number of ticks and batches delivered so far
+        self.ticks      = 0
+        self.batches    = 0
+
+    @property
+    def pending(self) -> int:
+        """
+            Number of ticks buffered but not yet delivered.
+        """
+        return self._count
+
+    def _batchDue(self, count: int) -> bool:
+        # Called after a tick was written, with the new number of buffered ticks
+        if count >= self._batchSize:
+            return True
+        if self._maxDelay == None:
+            return False
+        now = time.monotonic()
+        if count == 1:
+            self._batchStart = now
+        return (now - self._batchStart) >= self._maxDelay
+
+    def _deliver(self) -> None:
+        count = self._count
+        if count == 0:
+            return
+        batch = {name: column[:count] for name, column in zip(self._names, self._columns)}
+        self.ticks += count
+        self.batches += 1
+        try:
+            self._handler(batch)
+        finally:
+            self._count = 0
+
+    def flush(self) -> None:
+        """
+            Delivers the buffered ticks, if any. The buffer is not locked, so this must be called from the thread the ticks are received in, or once the stream is stopped.
+        """
+        self._deliver()
+
+
+class TradeBuffer(TickBuffer):
+
+    """
+        Tick buffer of trades, with the columns of `TRADE_COLUMNS`.
+    """
+
+    def __init__(self, handler: TickBatchHandler, batchSize: int = 256, maxDelay: Optional[float] = 0.05):
+        super().__init__(TRADE_COLUMNS, handler, batchSize, maxDelay)
+        self._time, self._price, self._size = self._columns
+
+    def append(self, timeNs: int, price: float, size: float) -> None:
+        i = self._count
+        self._time[i]   = timeNs
+        self._price[i]  = price
+        self._size[i]   = size
+        self._count = i + 1
+        if self._batchDue(i + 1):
+            self._deliver()
+
+
+class QuoteBuffer(TickBuffer):
+
+    """
+        Tick buffer of top of book quotes, with the columns of `QUOTE_COLUMNS`.
+    """
+
+    def __init__(self, handler: TickBatchHandler, batchSize: int = 256, maxDelay: Optional[float] = 0.05):
+        super().__init__(QUOTE_COLUMNS, handler, batchSize, maxDelay)
+        self._time, self._bidPrice, self._bidSize, self._askPrice, self._askSize = self._columns
+
+    def append(self, timeNs: int, bidPrice: float, bidSize: float, askPrice: float, askSize: float) -> None:
+        i = self._count
+        self._time[i]       = timeNs
+        self._bidPrice[i]   = bidPrice
+        self._bidSize[i]    = bidSize
+        self._askPrice[i]   = askPrice
+        self._askSize[i]    = askSize
+        self._count = i + 1
+        if self._batchDue(i + 1):
+            self._deliver()
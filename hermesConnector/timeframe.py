@@ -1,27 +1,139 @@
 
 
-
+import re
 from hermesConnector.hermes_enums import TimeframeUnit
+from hermesConnector.hermes_exceptions import UnsupportedParameterValue
+
+
+# Length of one unit in milliseconds. All the supported units have a fixed length.
+_UNIT_MS = {
+    TimeframeUnit.MINUTE    : 60_000,
+    TimeframeUnit.HOUR      : 3_600_000,
+    TimeframeUnit.DAY       : 86_400_000,
+    TimeframeUnit.WEEK      : 604_800_000,
+}
+
+# Short notation of the units, as used by `str` and `TimeFrame.parse` (e.g. "15m", "1h")
+_UNIT_SHORT = {
+    TimeframeUnit.MINUTE    : "m",
+    TimeframeUnit.HOUR      : "h",
+    TimeframeUnit.DAY       : "d",
+    TimeframeUnit.WEEK      : "w",
+}
+
+# Accepted spellings of the units when parsing. "M" is left out, as it usually denotes months.
+_UNIT_ALIASES = {
+    "m"         : TimeframeUnit.MINUTE,
+    "min"       : TimeframeUnit.MINUTE,
+    "minute"    : TimeframeUnit.MINUTE,
+    "minutes"   : TimeframeUnit.MINUTE,
+    "h"         : TimeframeUnit.HOUR,
+    "H"         : TimeframeUnit.HOUR,
+    "hour"      : TimeframeUnit.HOUR,
+    "hours"     : TimeframeUnit.HOUR,
+    "d"         : TimeframeUnit.DAY,
+    "D"         : TimeframeUnit.DAY,
+    "day"       : TimeframeUnit.DAY,
+    "days"      : TimeframeUnit.DAY,
+    "w"         : TimeframeUnit.WEEK,
+    "W"         : TimeframeUnit.WEEK,
+    "week"      : TimeframeUnit.WEEK,
+    "weeks"     : TimeframeUnit.WEEK,
+}
+
+_PATTERN = re.compile(r"^\s*(\d+)\s*([A-Za-z]+)\s*$")
 
 
 class TimeFrame:
 
-    _amount      : int
-    _unit        : TimeframeUnit
+    """
+        Immutable, hashable length of a candlestick.
+
+        The length is precomputed in milliseconds and nanoseconds on creation, so the close time of a candlestick is a single integer addition (see `closeTime`). Close times are the last millisecond within the candlestick, as reported by Binance, so that the next candlestick opens one millisecond later.
+
+        Example
+        -------
+            TimeFrame(15, TimeframeUnit.MINUTE) == TimeFrame.parse("15m")
+    """
+
+    __slots__ = ("_amount", "_unit", "_durationMs", "_durationNs")
+
+    _amount         : int
+    _unit           : TimeframeUnit
+    _durationMs     : int
+    _durationNs     : int
 
     def __init__(
             self,
             amount: int,
             unit: TimeframeUnit):
-        
-        self._amount      = amount
-        self._unit        = unit
-    
+
+        if (isinstance(amount, int) != True) or (amount < 1):
+            raise UnsupportedParameterValue
+        unit = TimeframeUnit(unit)
+
+        # The instance is immutable, so the slots are populated around `__setattr__`
+        object.__setattr__(self, "_amount", amount)
+        object.__setattr__(self, "_unit", unit)
+        object.__setattr__(self, "_durationMs", amount * _UNIT_MS[unit])
+        object.__setattr__(self, "_durationNs", amount * _UNIT_MS[unit] * 1_000_000)
+
+    @classmethod
+    def parse(cls, value: str) -> "TimeFrame":
+        """
+            Parses a timeframe string such as "1h", "15m", "1d", or "1 week".
+        """
+        match = _PATTERN.match(value)
+        if match == None:
+            raise UnsupportedParameterValue
+        # Single letter units are case sensitive, the longer spellings are not
+        unitStr = match.group(2)
+        unit = _UNIT_ALIASES.get(unitStr if len(unitStr) == 1 else unitStr.lower())
+        if unit == None:
+            raise UnsupportedParameterValue
+        return cls(int(match.group(1)), unit)
 
     @property
     def amount(self) -> int:
         return self._amount
-    
+
+    @property
+    def unit(self) -> TimeframeUnit:
+        return self._unit
+
     @property
-    def unit(self):
-        return self._unit
\ No newline at end of file
+    def durationMs(self) -> int:
+        return self._durationMs
+
+    @property
+    def durationNs(self) -> int:
+        return self._durationNs
+
+    def closeTime(self, openTime: int) -> int:
+        """
+            Returns the close time of a candlestick from its open time, both in epoch milliseconds.
+        """
+        return openTime + self._durationMs - 1
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TimeFrame is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("TimeFrame is immutable")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeFrame):
+            return (self._amount == other._amount) and (self._unit == other._unit)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._amount, self._unit))
+
+    def __reduce__(self):
+        return (TimeFrame, (self._amount, self._unit))
+
+    def __str__(self) -> str:
+        return f"{self._amount}{_UNIT_SHORT[self._unit]}"
+
+    def __repr__(self) -> str:
+        return f"TimeFrame({self._amount}, {self._unit})"
@@ -0,0 +1,202 @@
+#
+# Pre-Trade Constraint Checks
+# By Anas Arkawi, 2025.
+#
+
+
+# Module imports
+import math
+import threading
+import time
+from decimal import Decimal
+from typing import Callable, Literal, Optional
+
+from .models import TradingConstraintsModel
+from .hermes_enums import OrderSide, TimeInForce
+from .hermes_exceptions import OrderViolatesConstraints, UnsupportedParameterValue
+
+
+# Handling of the orders that violate the trading constraints of their asset:
+#   "off"       the orders are sent as they are, and rejected by the exchange
+#   "reject"    the orders are rejected locally with `OrderViolatesConstraints`
+#   "round"     quantities and limit prices are rounded to valid values, what rounding cannot fix is rejected locally
+ConstraintMode = Literal["off", "reject", "round"]
+
+# Relative tolerance of the comparisons, for the representation error of the floats, e.g. 0.3 / 0.1 = 2.9999999999999996
+_TOLERANCE = 1e-9
+
+
+def _decimals(step: float) -> int:
+    # Number of decimals of a step, e.g. 3 for 0.001
+    return max(-int(Decimal(repr(step)).normalize().as_tuple().exponent), 0)
+
+
+def _isMultiple(value: float, step: float) -> bool:
+    ratio = value / step
+    return abs(ratio - round(ratio)) <= (_TOLERANCE * max(1.0, abs(ratio)))
+
+
+def _roundToStep(value: float, step: float, up: bool) -> float:
+    ratio = value / step
+    if abs(ratio - round(ratio)) <= (_TOLERANCE * max(1.0, abs(ratio))):
+        steps = round(ratio)
+    else:
+        steps = math.ceil(ratio) if up else math.floor(ratio)
+    # Rounded to the decimals of the step, so the value is sent without a representation error
+    return round(steps * step, _decimals(step))
+
+
+def _below(value: float, limit: Optional[float]) -> bool:
+    return (limit != None) and (value < (limit * (1 - _TOLERANCE)))
+
+
+def _above(value: float, limit: Optional[float]) -> bool:
+    return (limit != None) and (value > (limit * (1 + _TOLERANCE)))
+
+
+def applyConstraints(
+        constraints: TradingConstraintsModel,
+        mode: ConstraintMode,
+        side: OrderSide,
+        tif: Optional[TimeInForce],
+        qty: Optional[float] = None,
+        cost: Optional[float] = None,
+        limitPrice: Optional[float] = None) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+        Checks an order against the trading constraints of its asset before it is sent.
+
+        In "round" mode, quantities are rounded down to the lot size, and limit prices to the tick size away from the market: buy prices down, sell prices up. Rounding therefore never makes an order larger or its price worse. The limits of the quantity, price and order value are checked after rounding.
+
+        Parameters
+        ----------
+            constraints: TradingConstraintsModel
+                Trading constraints of the asset.
+            mode: ConstraintMode
+                "off", "reject" or "round", see `ConstraintMode`.
+            side: OrderSide
+                Side of the order.
+            tif: Optional[TimeInForce]
+                Time in force of the order, `None` if it has none of the Hermes ones.
+            qty: Optional[float]
+                Quantity of the order, `None` for orders by cost.
+            cost: Optional[float]
+                Cost of the order, `None` for orders by quantity.
+            limitPrice: Optional[float]
+                Limit price, `None` for market orders.
+
+        Returns
+        -------
+            tuple[Optional[float], Optional[float], Optional[float]]
+                The quantity, cost and limit price to be sent.
+
+        Raises
+        ------
+            OrderViolatesConstraints
+                The order violates the constraints, with a message naming the violated constraint.
+    """
+    if mode == "off":
+        return qty, cost, limitPrice
+    if mode not in ["reject", "round"]:
+        raise UnsupportedParameterValue
+    rounding = (mode == "round")
+    symbol = constraints.symbol
+
+    if constraints.tradable != True:
+        raise OrderViolatesConstraints(f"{symbol} is not tradable")
+
+    if qty != None:
+        step = constraints.qtyStep
+        if constraints.fractionable != True:
+            step = 1.0 if (step == None) else max(step, 1.0)
+        if (step != None) and (_isMultiple(qty, step) != True):
+            if rounding != True:
+                raise OrderViolatesConstraints(f"Quantity {qty} of {symbol} is not a multiple of {step}")
+            qty = _roundToStep(qty, step, up=False)
+        if qty <= 0:
+            raise OrderViolatesConstraints(f"Quantity of {symbol} is below the lot size {step}")
+        if _below(qty, constraints.minQty):
+            raise OrderViolatesConstraints(f"Quantity {qty} of {symbol} is below the minimum {constraints.minQty}")
+        if _above(qty, constraints.maxQty):
+            raise OrderViolatesConstraints(f"Quantity {qty} of {symbol} is above the maximum {constraints.maxQty}")
+
+    if cost != None:
+        if constraints.fractionable != True:
+            raise OrderViolatesConstraints(f"{symbol} is not fractionable, orders by cost are not accepted")
+        if cost <= 0:
+            raise OrderViolatesConstraints(f"Cost of {symbol} must be positive")
+
+    if limitPrice != None:
+        step = constraints.priceStep
+        if (constraints.subDollarPriceStep != None) and (limitPrice < 1.0):
+            step = constraints.subDollarPriceStep
+        if (step != None) and (_isMultiple(limitPrice, step) != True):
+            if rounding != True:
+                raise OrderViolatesConstraints(f"Limit price {limitPrice} of {symbol} is not a multiple of {step}")
+            limitPrice = _roundToStep(limitPrice, step, up=(side == OrderSide.SELL))
+        if (limitPrice <= 0) or _below(limitPrice, constraints.minPrice):
+            raise OrderViolatesConstraints(f"Limit price {limitPrice} of {symbol} is below the minimum {constraints.minPrice}")
+        if _above(limitPrice, constraints.maxPrice):
+            raise OrderViolatesConstraints(f"Limit price {limitPrice} of {symbol} is above the maximum {constraints.maxPrice}")
+
+    # The value of market orders by quantity is not known before they are filled
+    value = cost
+    if (qty != None) and (limitPrice != None):
+        value = qty * limitPrice
+    if value != None:
+        if _below(value, constraints.minNotional):
+            raise OrderViolatesConstraints(f"Order value {value} of {symbol} is below the minimum {constraints.minNotional}")
+        if _above(value, constraints.maxNotional):
+            raise OrderViolatesConstraints(f"Order value {value} of {symbol} is above the maximum {constraints.maxNotional}")
+
+    fractional = (cost != None) or ((qty != None) and (_isMultiple(qty, 1.0) != True))
+    if fractional and (constraints.fractionalTimeInForce != None) and (tif not in constraints.fractionalTimeInForce):
+        raise OrderViolatesConstraints(f"Fractional orders of {symbol} are not accepted with the time in force {tif}")
+
+    return qty, cost, limitPrice
+
+
+class ConstraintsCache:
+
+    """
+        Trading constraints of the assets of a connector, indexed by symbol. The constraints of an asset are requested through `loader` on first use, and again once they are older than `ttl` seconds.
+
+        Parameters
+        ----------
+            loader: Callable[[str], TradingConstraintsModel]
+                Requests the constraints of a symbol from the exchange.
+            ttl: Optional[float]
+                Seconds the constraints are kept for, `None` to keep them until `invalidate` is called.
+    """
+
+    def __init__(
+            self,
+            loader: Callable[[str], TradingConstraintsModel],
+            ttl: Optional[float] = 3600.0):
+        self._loader = loader
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # Constraints and the monotonic time they were stored at, by symbol
+        self._entries: dict[str, tuple[TradingConstraintsModel, float]] = {}
+
+    def put(self, constraints: TradingConstraintsModel) -> None:
+        with self._lock:
+            self._entries[constraints.symbol] = (constraints, time.monotonic())
+
+    def get(self, symbol: str, forceRefresh: bool = False) -> TradingConstraintsModel:
+        entry = self._entries.get(symbol)
+        if (forceRefresh != True) and (entry != None) and ((self._ttl == None) or ((time.monotonic() - entry[1]) < self._ttl)):
+            return entry[0]
+        # Requested outside the lock, concurrent requests of the same symbol store the same values
+        constraints = self._loader(symbol)
+        self.put(constraints)
+        return constraints
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+            Drops the constraints of `symbol`, or of every symbol if `None`, so they are requested again on next use.
+        """
+        with self._lock:
+            if symbol == None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
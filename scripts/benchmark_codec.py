@@ -0,0 +1,59 @@
+#
+# Binary Codec Benchmark
+# By Anas Arkawi, 2025.
+#
+# Compares the binary codec against pickle on batches of bars and orders, by encoded size and encode and decode time.
+#
+
+
+# Module imports
+import pickle
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from hermesConnector import codec
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+from hermesConnector.models import BaseOrderResult, ClockReturnModel, LiveMarketData
+
+
+NOW = datetime(2025, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+
+def makeBars(n: int) -> list[LiveMarketData]:
+    return [
+        LiveMarketData(openTime=60_000 * i, openPrice=100.0 + i, highPrice=101.0 + i, lowPrice=99.0 + i, closePrice=100.5 + i, closeTime=60_000 * i + 59_999, volume=1000.0 + i)
+        for i in range(n)]
+
+
+def makeOrders(n: int) -> list[BaseOrderResult]:
+    # The raw exchange response is left short, as it is stored verbatim by both
+    return [
+        BaseOrderResult(
+            order_id=f"61e69015-8549-4bfd-b9c3-{i:012d}", created_at=NOW, updated_at=NOW + timedelta(seconds=i), submitted_at=NOW,
+            filled_at=NOW + timedelta(seconds=i), expired_at=None, expires_at=None, canceled_at=None, failed_at=None,
+            asset_id="b0b6dd9d-8b9b-48a9-ba46-b9d54906e415", symbol="AAPL", notional=None, qty=1.0, filled_qty=1.0, filled_avg_price=100.25,
+            type=OrderType.MARKET, side=OrderSide.BUY, time_in_force=TimeInForce.DAY, status=OrderStatus.FILLED, client_order_id=f"hm-{i:032x}", raw="{}")
+        for i in range(n)]
+
+
+def best(case, number: int) -> float:
+    return min(timeit.repeat(case, number=number, repeat=5)) / number
+
+
+def main(number: int = 50) -> None:
+    clock = ClockReturnModel(isOpen=True, nextOpen=NOW, nextClose=NOW, currentTimestamp=NOW)
+    batches = [("1000 bars", makeBars(1000), number), ("500 orders", makeOrders(500), number), ("1 clock", [clock], number * 1000)]
+    print(f"Best of 5 runs, {datetime.now(timezone.utc):%Y-%m-%d}")
+    for name, models, runs in batches:
+        pickled = pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL)
+        encoded = codec.encodeBatch(models)
+        print(f"    {name}")
+        print(f"        pickle    {len(pickled):8d} bytes    encode {best(lambda: pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL), runs) * 1e6:9.1f} us    decode {best(lambda: pickle.loads(pickled), runs) * 1e6:9.1f} us")
+        print(f"        codec     {len(encoded):8d} bytes    encode {best(lambda: codec.encodeBatch(models), runs) * 1e6:9.1f} us    decode {best(lambda: codec.decodeBatch(encoded), runs) * 1e6:9.1f} us")
+    encoded = codec.encodeBatch(batches[0][1])
+    print(f"    1000 bars as columns: decode {best(lambda: codec.decodeBarColumns(encoded), number * 100) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,74 @@
+#
+# Model Validation Benchmark
+# By Anas Arkawi, 2025.
+#
+# Compares building the Hermes models with validation against the trusted mode, and list conversions through a cached type adapter against per-item validation.
+#
+
+
+# Module imports
+import sys
+import timeit
+from datetime import datetime, timezone
+
+from pydantic import TypeAdapter
+
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+from hermesConnector.models import BaseOrderResult, ClockReturnModel, LiveMarketData
+from hermesConnector.models_utilities import typeAdapter
+
+
+NOW = datetime(2025, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+ORDER = dict(
+    order_id="61e69015-8549-4bfd-b9c3-01e75843f47d",
+    created_at=NOW,
+    updated_at=NOW,
+    submitted_at=NOW,
+    filled_at=None,
+    expired_at=None,
+    expires_at=None,
+    canceled_at=None,
+    failed_at=None,
+    asset_id="b0b6dd9d-8b9b-48a9-ba46-b9d54906e415",
+    symbol="AAPL",
+    notional=None,
+    qty=1.0,
+    filled_qty=None,
+    filled_avg_price=None,
+    type=OrderType.MARKET,
+    side=OrderSide.BUY,
+    time_in_force=TimeInForce.DAY,
+    status=OrderStatus.ACCEPTED,
+    client_order_id="hm-0",
+    raw="{}")
+
+BAR = dict(openTime=1735830000000, openPrice=1.0, highPrice=2.0, lowPrice=0.5, closePrice=1.5, closeTime=1735830059999, volume=10.0)
+
+CLOCK = dict(isOpen=True, nextOpen=NOW, nextClose=NOW, currentTimestamp=NOW)
+
+
+def best(case, number: int) -> float:
+    return min(timeit.repeat(case, number=number, repeat=5)) / number
+
+
+def main(number: int = 20000) -> None:
+    print(f"Model construction, best of 5 runs of {number}, {datetime.now(timezone.utc):%Y-%m-%d}")
+    for name, model, fields in [("BaseOrderResult", BaseOrderResult, ORDER), ("LiveMarketData", LiveMarketData, BAR), ("ClockReturnModel", ClockReturnModel, CLOCK)]:
+        validated = best(lambda: model.fromExchange(False, **fields), number)
+        trusted = best(lambda: model.fromExchange(True, **fields), number)
+        print(f"    {name:<20}validated {validated * 1e6:6.2f} us    trusted {trusted * 1e6:6.2f} us")
+
+    rows = [BaseOrderResult(**ORDER).model_dump_json()] * 500
+    listNumber = max(number // 500, 10)
+    perItem = best(lambda: [BaseOrderResult.model_validate_json(row) for row in rows], listNumber)
+    cached = best(lambda: typeAdapter(list[BaseOrderResult]).validate_json("[" + ",".join(rows) + "]"), listNumber)
+    uncached = best(lambda: TypeAdapter(list[BaseOrderResult]).validate_json("[" + ",".join(rows) + "]"), listNumber)
+    print(f"List of 500 orders from JSON, best of 5 runs of {listNumber}")
+    print(f"    per-item model_validate_json    {perItem * 1e3:6.2f} ms")
+    print(f"    cached type adapter             {cached * 1e3:6.2f} ms")
+    print(f"    type adapter built per call     {uncached * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,111 @@
+#
+# Order Submission Overhead Benchmark
+# By Anas Arkawi, 2025.
+#
+# Measures the local overhead of submitting an order through the regular and the fast order path.
+# The exchange is replaced by a stand-in trading client that returns a canned response, so only the work done by Hermes and the SDK is measured.
+#
+
+
+# Module imports
+import sys
+import timeit
+from datetime import datetime, timezone
+
+from alpaca.trading.client import TradingClient
+from alpaca.trading.models import Asset
+
+from hermesConnector.connector_alpaca import Alpaca
+from hermesConnector.hermes_enums import OrderSide, OrderType, TimeInForce
+from hermesConnector.models import LimitOrderBaseParams, MarketOrderQtyParams
+
+
+RESPONSE = {
+    "id": "61e69015-8549-4bfd-b9c3-01e75843f47d",
+    "client_order_id": "hm-0",
+    "created_at": "2025-01-02T15:00:00.123456Z",
+    "updated_at": "2025-01-02T15:00:00.123456Z",
+    "submitted_at": "2025-01-02T15:00:00.123456Z",
+    "filled_at": None,
+    "expired_at": None,
+    "canceled_at": None,
+    "failed_at": None,
+    "replaced_at": None,
+    "replaced_by": None,
+    "replaces": None,
+    "asset_id": "b0b6dd9d-8b9b-48a9-ba46-b9d54906e415",
+    "symbol": "AAPL",
+    "asset_class": "us_equity",
+    "notional": None,
+    "qty": "1",
+    "filled_qty": "0",
+    "filled_avg_price": None,
+    "order_class": "simple",
+    "order_type": "market",
+    "type": "market",
+    "side": "buy",
+    "time_in_force": "day",
+    "limit_price": None,
+    "stop_price": None,
+    "status": "accepted",
+    "extended_hours": False,
+    "legs": None,
+    "trail_percent": None,
+    "trail_price": None,
+    "hwm": None,
+}
+
+ASSET = {
+    "id": "b0b6dd9d-8b9b-48a9-ba46-b9d54906e415",
+    "class": "us_equity",
+    "exchange": "NASDAQ",
+    "symbol": "AAPL",
+    "status": "active",
+    "tradable": True,
+    "marginable": True,
+    "shortable": True,
+    "easy_to_borrow": True,
+    "fractionable": True,
+}
+
+
+class StandInTradingClient(TradingClient):
+
+    # Answers every request locally with an order echoing the request, the SDK models still run on both sides of it
+
+    def post(self, path, data=None):
+        response = dict(RESPONSE)
+        for field in ["side", "type", "time_in_force", "client_order_id"]:
+            response[field] = str(getattr(data[field], "value", data[field]))
+        for field in ["qty", "notional", "limit_price"]:
+            if data.get(field) != None:
+                response[field] = str(data[field])
+        return response
+
+
+class StandInAlpaca(Alpaca):
+
+    def _getAssetInfo(self, assetNameOrId):
+        return Asset(**ASSET)
+
+
+def main(number: int = 5000) -> None:
+    connector = StandInAlpaca(tradingPair="AAPL", interval="1m", mode="test", credentials=["key", "secret"])
+    connector._tradingClient = StandInTradingClient("key", "secret", paper=True)
+    connector.prepareFastOrders()
+
+    cases = {
+        "marketOrderQty"        : lambda: connector.marketOrderQty(MarketOrderQtyParams(side=OrderSide.BUY, tif=TimeInForce.DAY, qty=1)),
+        "fastOrder (market)"    : lambda: connector.fastOrder(OrderType.MARKET, OrderSide.BUY, TimeInForce.DAY, qty=1),
+        "limitOrder"            : lambda: connector.limitOrder(LimitOrderBaseParams(side=OrderSide.BUY, tif=TimeInForce.DAY, qty=1, limitPrice=100.0)),
+        "fastOrder (limit)"     : lambda: connector.fastOrder(OrderType.LIMIT, OrderSide.BUY, TimeInForce.DAY, qty=1, limitPrice=100.0),
+        "fastOrder + result()"  : lambda: connector.fastOrder(OrderType.MARKET, OrderSide.BUY, TimeInForce.DAY, qty=1).result(),
+    }
+    print(f"Submit overhead, best of 5 runs of {number} orders, {datetime.now(timezone.utc):%Y-%m-%d}")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=number, repeat=5)) / number
+        print(f"    {name:<24}{best * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
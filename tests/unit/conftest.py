@@ -0,0 +1,55 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Shared stand-ins and factories of the unit tests
+
+# Import Hermes Library
+from hermesConnector.connector_alpaca import Alpaca
+from hermesConnector.models import BaseOrderResult
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+
+# Import libraries
+from datetime import datetime, timedelta, timezone
+from alpaca.trading.models import Asset, Order as AlpacaOrder
+
+
+T0 = datetime(2025, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+ASSET = {"id": "b0b6dd9d-8b9b-48a9-ba46-b9d54906e415", "class": "us_equity", "exchange": "NASDAQ", "symbol": "AAPL", "status": "active", "tradable": True, "marginable": True, "shortable": True, "easy_to_borrow": True, "fractionable": True}
+
+# Order as returned by the Alpaca API, without the fields taken from the request
+ORDER_RESPONSE = {
+    "id": "61e69015-8549-4bfd-b9c3-01e75843f47d", "created_at": "2025-01-02T15:00:00Z", "updated_at": "2025-01-02T15:00:00Z", "submitted_at": "2025-01-02T15:00:00Z",
+    "filled_at": None, "expired_at": None, "canceled_at": None, "failed_at": None, "replaced_at": None, "replaced_by": None, "replaces": None,
+    "asset_id": "b0b6dd9d-8b9b-48a9-ba46-b9d54906e415", "symbol": "AAPL", "asset_class": "us_equity", "notional": None, "qty": None, "filled_qty": "0", "filled_avg_price": None,
+    "order_class": "simple", "order_type": "market", "limit_price": None, "stop_price": None, "status": "accepted", "extended_hours": False, "legs": None, "trail_percent": None, "trail_price": None, "hwm": None,
+}
+
+
+class StandInAlpaca(Alpaca):
+    # Serves the asset without a request, the clients are replaced by the tests
+    def _getAssetInfo(self, assetNameOrId):
+        return Asset(**ASSET)
+
+
+def makeAlpaca(**options):
+    return StandInAlpaca(**({"tradingPair": "AAPL", "interval": "1m", "mode": "test", "credentials": ["key", "secret"]} | options))
+
+
+def makeAlpacaOrder(orderId, submitted=T0, **fields):
+    # A filled-in market buy order of the Alpaca API
+    response = ORDER_RESPONSE | {
+        "id": orderId, "client_order_id": f"c-{orderId}", "created_at": submitted, "updated_at": submitted, "submitted_at": submitted,
+        "qty": "1", "type": "market", "side": "buy", "time_in_force": "day"}
+    return AlpacaOrder(**(response | fields))
+
+
+def makeOrder(i, cls=BaseOrderResult, status=OrderStatus.NEW, updated=0, **fields):
+    # Order `i` is submitted `i` seconds after T0, and updated `updated` seconds after its submission
+    submitted = T0 + timedelta(seconds=i)
+    values = {
+        "order_id": f"id{i}", "client_order_id": f"c{i}", "created_at": submitted, "updated_at": submitted + timedelta(seconds=updated), "submitted_at": submitted,
+        "filled_at": None, "expired_at": None, "expires_at": None, "canceled_at": None, "failed_at": None, "asset_id": None, "symbol": "AAPL",
+        "notional": None, "qty": 1.0, "filled_qty": None, "filled_avg_price": None,
+        "type": OrderType.MARKET, "side": OrderSide.BUY, "time_in_force": TimeInForce.DAY, "status": status, "raw": "{}"}
+    return cls(**(values | fields))
@@ -0,0 +1,119 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.account_snapshot import AccountSnapshot
+from hermesConnector.models import AccountModel, PositionModel
+from hermesConnector.hermes_enums import OrderSide
+
+# Import libraries
+import time
+from datetime import datetime, timezone
+
+
+def fetch():
+    account = AccountModel(
+        account_id="test",
+        currency="USD",
+        cash=10_000.0,
+        buying_power=20_000.0,
+        equity=11_000.0,
+        portfolio_value=11_000.0,
+        long_market_value=1_000.0,
+        short_market_value=0.0,
+        pattern_day_trader=False,
+        trading_blocked=False,
+        updated_at=datetime.now(timezone.utc))
+    position = PositionModel(
+        symbol="AAPL",
+        asset_id="aapl",
+        qty=10.0,
+        avg_entry_price=100.0,
+        cost_basis=1_000.0,
+        current_price=100.0,
+        market_value=1_000.0,
+        unrealized_pl=0.0)
+    return account, [position]
+
+
+def test_fillsUpdatePositionsAndCash():
+    snapshot = AccountSnapshot(fetch=fetch, reconcileInterval=None).start()
+
+    snapshot.applyFill(symbol="AAPL", side=OrderSide.BUY, qty=10, price=110.0)
+    position = snapshot.position("AAPL")
+    assert position.qty == 20
+    assert position.avg_entry_price == 105.0
+    assert snapshot.account().cash == 8_900.0
+    assert snapshot.account().buying_power == 18_900.0
+
+    # Reducing keeps the entry price and leaves the buying power to the next reconciliation
+    snapshot.applyFill(symbol="AAPL", side=OrderSide.SELL, qty=5, price=120.0, positionQty=15)
+    assert snapshot.position("AAPL").avg_entry_price == 105.0
+    assert snapshot.account().cash == 9_500.0
+    assert snapshot.account().buying_power == 18_900.0
+
+    # Flipping into a short starts a new entry price
+    snapshot.applyFill(symbol="AAPL", side=OrderSide.SELL, qty=20, price=90.0)
+    assert snapshot.position("AAPL").qty == -5
+    assert snapshot.position("AAPL").avg_entry_price == 90.0
+
+    snapshot.applyFill(symbol="AAPL", side=OrderSide.BUY, qty=5, price=95.0)
+    assert snapshot.positions() == []
+
+    snapshot.reconcile()
+    assert snapshot.position("AAPL").qty == 10
+    assert snapshot.account().cash == 10_000.0
+
+
+def test_responsesOverlappingFillsAreRequestedAgain():
+    snapshot = AccountSnapshot(fetch=fetch, reconcileInterval=None).start()
+    requests = []
+
+    def fetchWithFill():
+        # The fill arrives while the first request is in flight, and is already part of its response
+        requests.append(True)
+        if len(requests) == 1:
+            snapshot.applyFill(symbol="AAPL", side=OrderSide.SELL, qty=10, price=100.0)
+        account, positions = fetch()
+        return account.model_copy(update={"cash": 11_000.0}), []
+    snapshot._fetch = fetchWithFill
+
+    # The first response is discarded, the second one holds the fill once
+    assert snapshot.reconcile()
+    assert len(requests) == 2
+    assert snapshot.positions() == []
+    assert snapshot.account().cash == 11_000.0
+
+
+def test_snapshotIsKeptWhileFillsKeepArriving():
+    errors = []
+    snapshot = AccountSnapshot(fetch=fetch, reconcileInterval=None, onError=errors.append).start()
+
+    def fetchWithFills():
+        snapshot.applyFill(symbol="AAPL", side=OrderSide.BUY, qty=1, price=100.0)
+        return fetch()
+    snapshot._fetch = fetchWithFills
+
+    # Every response overlaps a fill, the fills are all kept locally
+    assert snapshot.reconcile() == False
+    assert snapshot.position("AAPL").qty == 10 + AccountSnapshot._maxReconcileAttempts
+    assert snapshot._fillsInFlight == None
+
+
+
+def test_failedReconciliationsAreReported():
+    errors = []
+    requests = []
+
+    def failingAfterTheFirst():
+        requests.append(True)
+        if len(requests) > 1:
+            raise ConnectionError("Connection reset")
+        return fetch()
+
+    snapshot = AccountSnapshot(fetch=failingAfterTheFirst, reconcileInterval=0.01, onError=errors.append).start()
+    time.sleep(0.05)
+    snapshot.stop()
+    assert len(errors) >= 2
+    assert isinstance(snapshot.lastError, ConnectionError)
+    assert snapshot.position("AAPL").qty == 10
@@ -0,0 +1,113 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector import connector_binance
+from hermesConnector.connector_binance import Binance
+
+# Import libraries
+import json
+
+
+class FakeSpot:
+    def __init__(self):
+        self.listenKeys = []
+        # Called before the account response is returned, as if a stream event arrived during the request
+        self.duringRequest = None
+
+    def account(self):
+        if self.duringRequest != None:
+            self.duringRequest()
+        return {
+            "updateTime": 20,
+            "balances": [
+                {"asset": "BTC", "free": "1.5", "locked": "0.5"},
+                {"asset": "USDT", "free": "1000", "locked": "0"},
+                {"asset": "DOGE", "free": "0", "locked": "0"}],
+            "commissionRates": {"maker": "0.001", "taker": "0.001", "buyer": "0", "seller": "0"},
+            "canTrade": True,
+            "canDeposit": True,
+            "canWithdraw": True}
+
+    def new_listen_key(self):
+        self.listenKeys.append("key")
+        return {"listenKey": "key"}
+
+    def close_listen_key(self, listenKey):
+        self.listenKeys.remove(listenKey)
+
+    def ticker_price(self):
+        return [{"symbol": "BTCUSDT", "price": "50000"}, {"symbol": "ETHBTC", "price": "0.05"}]
+
+
+def makeBinance():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    binance.clients["spot"] = FakeSpot()
+    return binance
+
+
+def test_balancesAreIndexedPerInstance():
+    binance = makeBinance()
+    binance.account()
+    assert binance.balance("BTC") == {"free": 1.5, "locked": 0.5}
+    assert binance.balance("ETH") == {"free": 0.0, "locked": 0.0}
+    assert makeBinance().accountData["assets"] == {}
+    assert binance.portfolioValue("USDT") == 101_000.0
+
+
+def test_userDataStreamUpdates():
+    binance = makeBinance()
+    binance.account()
+
+    binance.userDataHandlerInternal(None, json.dumps({
+        "e": "outboundAccountPosition", "E": 10, "u": 10,
+        "B": [{"a": "ETH", "f": "2.0", "l": "0.0"}, {"a": "BTC", "f": "1.0", "l": "0.5"}]}))
+    assert binance.balance("ETH")["free"] == 2.0
+    assert binance.balance("BTC")["free"] == 1.0
+
+    # A delta older than the absolute balance is already included in it
+    binance.userDataHandlerInternal(None, json.dumps({"e": "balanceUpdate", "E": 11, "a": "ETH", "d": "1.0", "T": 9}))
+    assert binance.balance("ETH")["free"] == 2.0
+    binance.userDataHandlerInternal(None, json.dumps({"e": "balanceUpdate", "E": 12, "a": "ETH", "d": "1.0", "T": 12}))
+    assert binance.balance("ETH")["free"] == 3.0
+
+
+class StandInUserStream:
+    def __init__(self, on_message, stream_url):
+        self.on_message = on_message
+        self.stopped = False
+
+    def user_data(self, listen_key):
+        pass
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_updatesDuringTheAccountRequestAreKept(monkeypatch):
+    monkeypatch.setattr(connector_binance, "WebSocketClient", StandInUserStream)
+    binance = makeBinance()
+    spot = binance.clients["spot"]
+
+    def streamEvents():
+        # Newer than the response for BTC, older for USDT
+        binance.userDataHandlerInternal(None, json.dumps({
+            "e": "outboundAccountPosition", "E": 25, "u": 25,
+            "B": [{"a": "BTC", "f": "1.0", "l": "0.0"}]}))
+        binance.userDataHandlerInternal(None, json.dumps({
+            "e": "outboundAccountPosition", "E": 15, "u": 15,
+            "B": [{"a": "USDT", "f": "900", "l": "0"}]}))
+    spot.duringRequest = streamEvents
+
+    binance.trackAccount()
+    assert binance.balance("BTC") == {"free": 1.0, "locked": 0.0}
+    assert binance.balance("USDT") == {"free": 1000.0, "locked": 0.0}
+    # A delta the response already includes is skipped
+    binance.userDataHandlerInternal(None, json.dumps({"e": "balanceUpdate", "E": 26, "a": "USDT", "d": "5", "T": 18}))
+    assert binance.balance("USDT")["free"] == 1000.0
+
+    stream = binance.clients["userWs"]
+    binance.stop()
+    assert stream.stopped
+    assert spot.listenKeys == []
+    assert binance._listenKey == None
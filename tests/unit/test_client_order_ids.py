@@ -0,0 +1,108 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.retry import RetryPolicy
+
+# Import libraries
+import uuid
+import pytest
+from requests import ConnectionError, HTTPError, Response
+from alpaca.common.exceptions import APIError
+from alpaca.trading.enums import OrderSide, TimeInForce
+from alpaca.trading.requests import MarketOrderRequest
+
+from .conftest import makeAlpaca, makeAlpacaOrder
+
+
+def apiError(statusCode, message="{}"):
+    response = Response()
+    response.status_code = statusCode
+    return APIError(message, http_error=HTTPError(response=response))
+
+
+class StandInTradingClient:
+    # Fails the submissions with the queued errors, an order marked as accepted reaches the exchange despite its error
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.orders = {}
+        self.submissions = 0
+        self.lookups = 0
+
+    def submit_order(self, order_data):
+        self.submissions += 1
+        clientOrderId = order_data.client_order_id
+        if clientOrderId in self.orders:
+            raise apiError(422, '{"code": 40010001, "message": "client_order_id must be unique"}')
+        error, accepted = self.failures.pop(0) if (len(self.failures) > 0) else (None, True)
+        if accepted:
+            self.orders[clientOrderId] = makeAlpacaOrder(str(uuid.UUID(int=len(self.orders))), client_order_id=clientOrderId)
+        if error != None:
+            raise error
+        return self.orders[clientOrderId]
+
+    def get_order_by_client_id(self, client_id):
+        self.lookups += 1
+        if client_id not in self.orders:
+            raise apiError(404, '{"code": 40410000, "message": "order not found"}')
+        return self.orders[client_id]
+
+
+def makeConnector(failures=()):
+    connector = makeAlpaca(retryPolicy=RetryPolicy(maxAttempts=3, baseDelay=0.0))
+    connector._tradingClient = StandInTradingClient(failures)
+    return connector
+
+
+def request(clientOrderId="c1"):
+    return MarketOrderRequest(symbol="AAPL", qty=1, side=OrderSide.BUY, time_in_force=TimeInForce.DAY, client_order_id=clientOrderId)
+
+
+def test_orderThatReachedTheExchangeIsNotResubmitted():
+    # The response is lost, but the order went through
+    connector = makeConnector([(apiError(503), True)])
+    order = connector._submitOrderRequest(request())
+    client = connector._tradingClient
+    assert (order.client_order_id, len(client.orders)) == ("c1", 1)
+    assert (client.submissions, client.lookups) == (1, 1)
+
+
+def test_orderThatDidNotReachTheExchangeIsResubmitted():
+    connector = makeConnector([(apiError(503), False), (ConnectionError("Connection reset"), False)])
+    order = connector._submitOrderRequest(request())
+    client = connector._tradingClient
+    assert (order.client_order_id, len(client.orders)) == ("c1", 1)
+    assert (client.submissions, client.lookups) == (3, 2)
+
+
+def test_resubmittedDuplicateReturnsTheExistingOrder():
+    # The order went through but the lookup failed as well, the resubmission is rejected as a duplicate
+    connector = makeConnector([(apiError(503), True)])
+    client = connector._tradingClient
+    lookup = client.get_order_by_client_id
+
+    def failingOnce(client_id):
+        if client.lookups == 0:
+            client.lookups += 1
+            raise apiError(503)
+        return lookup(client_id)
+    client.get_order_by_client_id = failingOnce
+
+    order = connector._submitOrderRequest(request())
+    assert (order.client_order_id, len(client.orders)) == ("c1", 1)
+    assert (client.submissions, client.lookups) == (2, 2)
+
+
+def test_persistentFailureRaisesAfterTheLastAttempt():
+    connector = makeConnector([(apiError(503), False)] * 3)
+    with pytest.raises(APIError):
+        connector._submitOrderRequest(request())
+    assert (connector._tradingClient.submissions, len(connector._tradingClient.orders)) == (3, 0)
+
+
+def test_queryOrderByClientId():
+    connector = makeConnector()
+    connector._submitOrderRequest(request("c7"))
+    order = connector.queryOrderByClientId("c7")
+    assert (order.order_id, order.client_order_id) == (str(uuid.UUID(int=0)), "c7")
+    assert connector._lookupClientOrder("c8") == None
@@ -0,0 +1,72 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector import clock as clockModule
+from hermesConnector.clock import CachedExchangeClock
+from hermesConnector.models import ClockReturnModel
+
+# Import libraries
+from datetime import datetime, timedelta, timezone
+
+
+START = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+
+
+class FakeMonotonic:
+    def __init__(self):
+        self.ns = 0
+
+    def __call__(self):
+        return self.ns
+
+
+def makeClock(monkeypatch, ttl=None):
+    monotonic = FakeMonotonic()
+    monkeypatch.setattr(clockModule.time, "monotonic_ns", monotonic)
+    fetches = []
+
+    def fetch():
+        # The exchange follows the same monotonic clock, the session closes at 21:00
+        now = START + timedelta(microseconds=(monotonic.ns // 1000))
+        isOpen = now < (START + timedelta(hours=6))
+        fetches.append(now)
+        return ClockReturnModel(
+            isOpen=isOpen,
+            nextOpen=START + timedelta(days=1, hours=-0.5),
+            nextClose=START + timedelta(hours=6) if isOpen else START + timedelta(days=1, hours=6),
+            currentTimestamp=now)
+
+    return CachedExchangeClock(fetch=fetch, ttl=ttl), monotonic, fetches
+
+
+def test_extrapolatesUntilSessionBoundary(monkeypatch):
+    cache, monotonic, fetches = makeClock(monkeypatch)
+
+    assert cache.now().isOpen == True
+    monotonic.ns = 3_600 * 10**9
+    clock = cache.now()
+    assert clock.currentTimestamp == START + timedelta(hours=1)
+    assert clock.isOpen == True
+    assert len(fetches) == 1
+
+    # Crossing the close refreshes the clock once
+    monotonic.ns = 6 * 3_600 * 10**9
+    assert cache.now().isOpen == False
+    monotonic.ns += 10**9
+    assert cache.now().isOpen == False
+    assert len(fetches) == 2
+
+
+def test_ttlAndForcedRefresh(monkeypatch):
+    cache, monotonic, fetches = makeClock(monkeypatch, ttl=60)
+
+    cache.now()
+    monotonic.ns = 59 * 10**9
+    cache.now()
+    assert len(fetches) == 1
+    monotonic.ns = 60 * 10**9
+    cache.now()
+    assert len(fetches) == 2
+    cache.now(forceRefresh=True)
+    assert len(fetches) == 3
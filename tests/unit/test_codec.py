@@ -0,0 +1,67 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector import codec
+from hermesConnector.models import BaseOrderResult, ClockReturnModel, LatencyPercentiles, LimitOrderResult, LiveMarketData
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+from hermesConnector.hermes_exceptions import UnexpectedInput
+
+# Import libraries
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+from .conftest import makeOrder
+
+
+NOW = datetime(2025, 1, 2, 15, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+def makeCodecOrder(i, cls=BaseOrderResult, **extra):
+    # Times with microseconds and a non-ASCII client order ID
+    return makeOrder(
+        i, cls, status=OrderStatus.PARTIALLY_FILLED, created_at=NOW, updated_at=NOW + timedelta(seconds=i), submitted_at=NOW,
+        qty=1.5, type=OrderType.LIMIT, side=OrderSide.SELL, time_in_force=TimeInForce.GTC, client_order_id="çlient", raw='{"id": 1}', **extra)
+
+
+def test_roundTripsEveryKind():
+    pytest.importorskip("msgpack")
+    bars = [LiveMarketData(openTime=60_000 * i, openPrice=1.0, highPrice=2.0, lowPrice=0.5, closePrice=1.5 + i, closeTime=60_000 * i + 59_999, volume=10.0) for i in range(3)]
+    assert codec.decodeBatch(codec.encodeBatch(bars)) == bars
+
+    eastern = timezone(timedelta(hours=-5))
+    clock = ClockReturnModel(isOpen=False, nextOpen=datetime(2025, 1, 3, 9, 30, tzinfo=eastern), nextClose=datetime(2025, 1, 3, 16, tzinfo=eastern), currentTimestamp=NOW)
+    assert codec.decode(codec.encode(clock)) == clock
+
+    orders = [makeCodecOrder(i) for i in range(3)]
+    assert codec.decodeBatch(codec.encodeBatch(orders)) == orders
+    limitOrder = makeCodecOrder(9, LimitOrderResult, limit_price=101.25)
+    decoded = codec.decode(codec.encode(limitOrder))
+    assert (type(decoded), decoded) == (LimitOrderResult, limitOrder)
+    assert decoded.model_dump_json() == limitOrder.model_dump_json()
+
+    # Models without a row layout are stored by their dumped fields
+    percentiles = LatencyPercentiles(p50=1.0, p90=2.0, p99=3.0, max=4.0, mean=1.5)
+    assert codec.decode(codec.encode(percentiles)) == percentiles
+    assert codec.decodeBatch(codec.encodeBatch([])) == []
+
+
+def test_barColumnsAndVersionCheck():
+    columns = {"openTime": np.array([0.0, 60_000.0]), "open": np.array([1.0, 2.0]), "high": np.array([2.0, 3.0]), "low": np.array([0.5, 1.5]), "close": np.array([1.5, 2.5]), "closeTime": np.array([59_999.0, 119_999.0]), "volume": np.array([5.0, 6.0])}
+    data = codec.encodeBarColumns(columns)
+    records = codec.decodeBarColumns(data)
+    assert list(records["closePrice"]) == [1.5, 2.5]
+    assert records["openTime"].dtype == np.int64
+    assert codec.decodeBatch(data)[1].closeTime == 119_999
+
+    # Bars encoded one at a time are decoded together
+    bars = [LiveMarketData(openTime=60_000 * i, openPrice=1.0, highPrice=2.0, lowPrice=0.5, closePrice=1.5 + i, closeTime=60_000 * i + 59_999, volume=10.0) for i in range(3)]
+    assert list(codec.decodeBarBatches([codec.encode(bar) for bar in bars])["closePrice"]) == [1.5, 2.5, 3.5]
+    assert list(codec.decodeBarBatches([codec.encode(bars[0]), data])["openTime"]) == [0, 0, 60_000]
+
+    # Another schema version is rejected
+    with pytest.raises(UnexpectedInput):
+        codec.decodeBatch(data[:2] + bytes([codec.SCHEMA_VERSION + 1]) + data[3:])
+    with pytest.raises(UnexpectedInput):
+        codec.encodeBatch([makeCodecOrder(0), makeCodecOrder(1, LimitOrderResult)])
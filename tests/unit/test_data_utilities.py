@@ -0,0 +1,81 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.data_utilities import HISTORIC_COLUMNS, SYMBOL_COLUMN, buildHistoricFrame, buildLongHistoricFrame
+from hermesConnector.connector_binance import Binance
+from hermesConnector.timeframe import TimeFrame
+
+# Import libraries
+import numpy as np
+import pytest
+from datetime import timedelta
+from alpaca.data.models import BarSet
+
+from .conftest import T0, makeAlpaca
+
+
+def makeColumns():
+    openTime = np.arange(4, dtype=np.int64) * 60_000
+    close = np.array([10.0, 11.0, 9.9, 9.9])
+    return {
+        "openTime": openTime,
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "volume": np.ones(4),
+        "closeTime": openTime + 59_999}
+
+
+def test_pandasFrame():
+    df = buildHistoricFrame(makeColumns(), floatPrecision="float32")
+    assert list(df.columns) == HISTORIC_COLUMNS
+    assert df["openTime"].dtype == np.int64
+    assert df["close"].dtype == np.float32
+    assert np.isnan(df["pChange"].iloc[0])
+    assert list(df["pChange"].iloc[1:]) == pytest.approx([10.0, -10.0, 0.0])
+
+
+@pytest.mark.parametrize("outputFormat, module", [("arrow", "pyarrow"), ("polars", "polars")])
+def test_columnarFrames(outputFormat, module):
+    pytest.importorskip(module)
+    frame = buildHistoricFrame(makeColumns(), outputFormat=outputFormat)
+    assert list(frame.column_names if outputFormat == "arrow" else frame.columns) == HISTORIC_COLUMNS
+    assert len(frame) == 4
+
+
+@pytest.mark.parametrize("outputFormat, module", [("pandas", "pandas"), ("arrow", "pyarrow"), ("polars", "polars")])
+def test_longFrames(outputFormat, module):
+    pytest.importorskip(module)
+    frame = buildLongHistoricFrame({"A": makeColumns(), "B": makeColumns()}, floatPrecision="float32", outputFormat=outputFormat)
+    assert list(frame.column_names if outputFormat == "arrow" else frame.columns) == [SYMBOL_COLUMN] + HISTORIC_COLUMNS
+    assert len(frame) == 8
+    pChange = np.asarray(frame["pChange"])
+    # The change is not carried over from one symbol to the next
+    assert np.isnan(pChange[0]) and np.isnan(pChange[4])
+    assert pChange[5] == pytest.approx(10.0)
+
+
+class StandInSpot:
+    # Klines as returned by Binance, the close time being the last millisecond of the candlestick
+    def klines(self, symbol, interval, limit):
+        openTime = int(T0.timestamp() * 1000)
+        return [[openTime + (i * 60_000), "1.0", "2.0", "0.5", "1.5", "10.0", openTime + (i * 60_000) + 59_999, "15.0", 1, "5.0", "7.5", "0"] for i in range(3)]
+
+
+class StandInHistoricalClient:
+    def get_stock_bars(self, request):
+        return BarSet({"AAPL": [
+            {"t": (T0 + timedelta(minutes=i)).isoformat(), "o": 1.0, "h": 2.0, "l": 0.5, "c": 1.5, "v": 10.0, "n": 1, "vw": 1.0} for i in range(3)]})
+
+
+def test_closeTimesMatchAcrossConnectors():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1m", credentials=["key", "secret"])
+    binance.clients["spot"] = StandInSpot()
+    alpaca = makeAlpaca()
+    alpaca._historicalDataClient = StandInHistoricalClient()
+
+    expected = [TimeFrame.parse("1m").closeTime(openTime) for openTime in binance.historicData()["openTime"]]
+    for frame in [binance.historicData(), alpaca.historicData()]:
+        assert list(frame["closeTime"]) == expected
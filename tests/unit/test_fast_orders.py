@@ -0,0 +1,60 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+from hermesConnector.hermes_exceptions import InsufficientParameters
+from hermesConnector.models import LimitOrderBaseParams, LimitOrderResult
+
+# Import libraries
+import pytest
+from alpaca.trading.client import TradingClient
+
+from .conftest import ORDER_RESPONSE, makeAlpaca
+
+
+class StandInTradingClient(TradingClient):
+    def __init__(self):
+        super().__init__("key", "secret", paper=True)
+        self.bodies = []
+
+    def post(self, path, data=None):
+        self.bodies.append({field: getattr(value, "value", value) for field, value in data.items()})
+        response = dict(ORDER_RESPONSE)
+        for field, value in self.bodies[-1].items():
+            response[field] = value if isinstance(value, str) else str(value)
+        return response
+
+
+def makeConnector():
+    connector = makeAlpaca()
+    connector._tradingClient = StandInTradingClient()
+    return connector
+
+
+def test_fastOrderSendsTheSameRequest():
+    connector = makeConnector()
+    regular = connector.limitOrder(LimitOrderBaseParams(side=OrderSide.SELL, tif=TimeInForce.GTC, qty=2, limitPrice=101.5, clientOrderId="c1"))
+    fast = connector.fastOrder(OrderType.LIMIT, OrderSide.SELL, TimeInForce.GTC, qty=2, limitPrice=101.5, clientOrderId="c1")
+
+    regularBody, fastBody = connector._tradingClient.bodies
+    assert fastBody == regularBody
+    assert (fast.orderId, fast.clientOrderId, fast.status) == (regular.order_id, "c1", OrderStatus.ACCEPTED)
+
+    # The full result is only built on request, and matches the regular one
+    assert fast._result == None
+    assert isinstance(fast.result(), LimitOrderResult)
+    assert fast.result() == regular
+    assert fast.result() is fast.result()
+
+
+def test_fastOrderChecksItsParameters():
+    connector = makeConnector()
+    connector.fastOrder(OrderType.MARKET, OrderSide.BUY, cost=250.0)
+    assert connector._tradingClient.bodies[-1]["notional"] == 250.0
+    assert connector._tradingClient.bodies[-1]["client_order_id"].startswith("hm-")
+
+    with pytest.raises(InsufficientParameters):
+        connector.fastOrder(OrderType.MARKET, OrderSide.BUY, qty=1, cost=250.0)
+    with pytest.raises(InsufficientParameters):
+        connector.fastOrder(OrderType.LIMIT, OrderSide.BUY, qty=1)
@@ -0,0 +1,64 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.data_utilities import HISTORIC_COLUMNS, SYMBOL_COLUMN
+
+# Import libraries
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from alpaca.data.models import BarSet
+
+from .conftest import T0, makeAlpaca
+
+
+class StandInHistoricalClient:
+    # Serves `count` bars per symbol, none for the symbols starting with "X"
+    def __init__(self, count):
+        self.count = count
+        self.requests = []
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        return BarSet({
+            symbol: [
+                {"t": (T0 + timedelta(minutes=i)).isoformat(), "o": 1.0, "h": 2.0, "l": 0.5, "c": float(i + 1), "v": 10.0, "n": 1, "vw": 1.0}
+                for i in range(self.count)]
+            for symbol in request.symbol_or_symbols if (symbol.startswith("X") != True)})
+
+
+def makeConnector(count):
+    connector = makeAlpaca(limit=3)
+    connector._historicalDataClient = StandInHistoricalClient(count)
+    return connector
+
+
+def test_symbolsAreBatched():
+    connector = makeConnector(5)
+    symbols = [f"S{i}" for i in range(5)] + ["XNONE", "S0"]
+    frame = connector.historicDataMany(symbols, batchSize=2)
+
+    requests = connector._historicalDataClient.requests
+    assert [request.symbol_or_symbols for request in requests] == [["S0", "S1"], ["S2", "S3"], ["S4", "XNONE"]]
+    # The limit applies per symbol, so it is not passed on
+    assert all(request.limit == None for request in requests)
+    # Three minute bars of a stock reach back over a weekend or holidays at most
+    lookback = datetime.now(timezone.utc).replace(tzinfo=None) - requests[0].start.replace(tzinfo=None)
+    assert timedelta(days=5) < lookback < timedelta(days=6)
+
+    assert list(frame.columns) == [SYMBOL_COLUMN] + HISTORIC_COLUMNS
+    assert list(frame[SYMBOL_COLUMN].cat.categories) == ["S0", "S1", "S2", "S3", "S4", "XNONE"]
+    assert len(frame) == 15
+    # The most recent bars of each symbol, with the change computed per symbol
+    first = frame[frame[SYMBOL_COLUMN] == "S1"]
+    assert list(first["close"]) == [3.0, 4.0, 5.0]
+    assert np.isnan(first["pChange"].iloc[0])
+
+
+def test_framePerSymbol():
+    connector = makeConnector(2)
+    frames = connector.historicDataMany(["S0", "XNONE"], limit=5, asDict=True)
+    assert list(frames) == ["S0", "XNONE"]
+    assert list(frames["S0"]["close"]) == [1.0, 2.0]
+    assert list(frames["S0"].columns) == HISTORIC_COLUMNS
+    assert len(frames["XNONE"]) == 0
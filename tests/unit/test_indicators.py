@@ -0,0 +1,114 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.indicators import IndicatorEngine, SMA, EMA, RSI, ATR, RollingVolatility, PChange
+from hermesConnector.models import LiveMarketData
+
+# Import libraries
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta, timezone
+from alpaca.data.models import BarSet
+
+from .conftest import makeAlpaca
+
+
+def makeFrame(n=60):
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        "openTime": np.arange(n, dtype=np.int64) * 60_000,
+        "open": close,
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close,
+        "volume": np.ones(n)})
+
+
+def makeEngine():
+    return IndicatorEngine({
+        "sma": SMA(10),
+        "ema": EMA(10),
+        "rsi": RSI(14),
+        "atr": ATR(14),
+        "vol": RollingVolatility(20),
+        "pChange": PChange()})
+
+
+def test_seedAgainstFullRecomputation():
+    df = makeFrame()
+    values = makeEngine().seed(df)
+    close = df["close"]
+
+    assert values["sma"] == pytest.approx(close.rolling(10).mean().iloc[-1])
+    assert values["pChange"] == pytest.approx((close.pct_change() * 100).iloc[-1])
+    assert values["vol"] == pytest.approx((close.pct_change() * 100).rolling(20).std().iloc[-1])
+
+    # EMA seeded with the SMA of the first window
+    ema = close.iloc[:10].mean()
+    for price in close.iloc[10:]:
+        ema = (2 / 11) * price + (9 / 11) * ema
+    assert values["ema"] == pytest.approx(ema)
+
+    # Wilder RSI
+    change = close.diff().iloc[1:]
+    gain, loss = change.clip(lower=0), (-change).clip(lower=0)
+    avgGain, avgLoss = gain.iloc[:14].mean(), loss.iloc[:14].mean()
+    for g, l in zip(gain.iloc[14:], loss.iloc[14:]):
+        avgGain = (avgGain * 13 + g) / 14
+        avgLoss = (avgLoss * 13 + l) / 14
+    assert values["rsi"] == pytest.approx(100 - 100 / (1 + avgGain / avgLoss))
+
+
+def test_intraCandleRevision():
+    df = makeFrame()
+    engine = makeEngine()
+    engine.seed(df.iloc[:-1])
+
+    # Revising the forming bar several times matches seeding with its final state
+    last = df.iloc[-1]
+    for close in [last["close"] + 3, last["close"] - 2, last["close"]]:
+        engine.update(LiveMarketData(
+            openTime=float(last["openTime"]),
+            openPrice=last["open"],
+            highPrice=close + 0.5,
+            lowPrice=close - 0.5,
+            closePrice=close,
+            closeTime=float(last["openTime"] + 59_999),
+            volume=1.0))
+    
+    expected = makeEngine().seed(df)
+    for name, value in engine.values().items():
+        assert value == pytest.approx(expected[name])
+
+
+class StandInHistoricalClient:
+    # Minute bars of the last five days, served in ascending order from the start of the request
+    def __init__(self):
+        self.now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        self.requests = []
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        start = request.start.replace(tzinfo=timezone.utc)
+        times = [self.now - timedelta(minutes=i) for i in range(5 * 24 * 60, -1, -1)]
+        return BarSet({"AAPL": [
+            {"t": time.isoformat(), "o": 1.0, "h": 2.0, "l": 0.5, "c": 1.0, "v": 10.0, "n": 1, "vw": 1.0} for time in times if time >= start]})
+
+
+def test_seedFromTheLatestLiveBars():
+    connector = makeAlpaca(interval="1h", limit=30)
+    connector._historicalDataClient = StandInHistoricalClient()
+    seeded = []
+    engine = makeEngine()
+    seed = engine.seed
+    engine.seed = lambda frame: seeded.append(frame) or seed(frame)
+    connector.attachIndicators(engine)
+
+    # The live stream pushes minute bars, the engine is seeded with the most recent ones whatever the interval
+    openTime = np.asarray(seeded[0]["openTime"])
+    assert len(openTime) == 30
+    assert set(np.diff(openTime)) == {60_000}
+    assert openTime[-1] == int(connector._historicalDataClient.now.timestamp() * 1000)
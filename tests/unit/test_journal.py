@@ -0,0 +1,91 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.journal import EventJournal, JournalReader
+from hermesConnector.models import LimitOrderBaseParams, LiveMarketData, MarketOrderQtyParams
+from hermesConnector.hermes_enums import JournalEventKind, OrderSide, OrderStatus, TimeInForce
+from hermesConnector.hermes_exceptions import UnexpectedInput
+
+# Import libraries
+import pytest
+
+from .conftest import makeOrder
+
+
+pytest.importorskip("msgpack")
+
+
+def makeBar(i, close=1.5):
+    return LiveMarketData(openTime=60_000 * i, openPrice=1.0, highPrice=2.0, lowPrice=0.5, closePrice=close, closeTime=60_000 * i + 59_999, volume=10.0)
+
+
+def test_eventsAreReadBackInOrder(tmp_path):
+    path = str(tmp_path / "session.journal")
+    journal = EventJournal(path)
+    journal.appendBar(makeBar(0), closed=False, timeNs=1)
+    journal.appendSubmission(MarketOrderQtyParams(side=OrderSide.BUY, tif=TimeInForce.DAY, clientOrderId="c0", qty=1.0))
+    journal.appendOrders([makeOrder(0)])
+    journal.appendBar(makeBar(0, close=1.75), closed=True)
+    journal.appendCancel("id0")
+    journal.close()
+
+    reader = JournalReader(path)
+    events = list(reader)
+    assert [event.kind for event in events] == [
+        JournalEventKind.BAR, JournalEventKind.ORDER_SUBMITTED, JournalEventKind.ORDER_RESULT, JournalEventKind.BAR, JournalEventKind.ORDER_CANCELED]
+    assert (events[0].timeNs, events[0].closed, events[0].data) == (1, False, makeBar(0))
+    assert events[1].data.clientOrderId == "c0"
+    assert events[2].data == [makeOrder(0)]
+    assert (events[3].closed, events[3].data.closePrice) == (True, 1.75)
+    assert events[4].data == "id0"
+    assert [kind for kind, _, _, _ in reader.records([JournalEventKind.BAR])] == [JournalEventKind.BAR] * 2
+    reader.close()
+
+
+def test_recoveryState(tmp_path):
+    path = str(tmp_path / "session.journal")
+    # Small enough to grow while being written
+    journal = EventJournal(path, initialSize=256)
+    for i in [2, 0, 1]:
+        journal.appendBar(makeBar(i), closed=True)
+    journal.appendBar(makeBar(1, close=9.0), closed=True)
+    journal.appendSubmission(MarketOrderQtyParams(side=OrderSide.BUY, tif=TimeInForce.DAY, clientOrderId="c0", qty=1.0))
+    journal.appendOrders([makeOrder(0, updated=5, status=OrderStatus.FILLED)])
+    journal.appendOrders([makeOrder(0, updated=1)])
+    journal.close()
+
+    # A reopened journal is continued
+    journal = EventJournal(path)
+    journal.appendSubmission(LimitOrderBaseParams(side=OrderSide.SELL, tif=TimeInForce.GTC, clientOrderId="c1", qty=2, limitPrice=101.0))
+    journal.flush()
+
+    reader = JournalReader(path)
+    columns = reader.barColumns()
+    assert list(columns["openTime"]) == [0, 60_000, 120_000]
+    assert list(columns["close"]) == [1.5, 9.0, 1.5]
+    assert reader.latestOrders()["id0"].status == OrderStatus.FILLED
+    assert [params.clientOrderId for params in reader.pendingSubmissions()] == ["c1"]
+    reader.close()
+    journal.close()
+
+
+def test_incompleteRecordsAreLeftOut(tmp_path):
+    path = str(tmp_path / "session.journal")
+    journal = EventJournal(path)
+    journal.appendCancel("id0")
+    end = journal.size
+    journal.close()
+
+    # Bytes of a record whose write was cut short, the end in the header still points before them
+    with open(path, "r+b") as file:
+        file.seek(end)
+        file.write(b"\xff" * 20)
+    reader = JournalReader(path)
+    assert [event.data for event in reader] == ["id0"]
+    reader.close()
+
+    with open(path, "r+b") as file:
+        file.write(b"NOTAJRNL")
+    with pytest.raises(UnexpectedInput):
+        JournalReader(path)
@@ -0,0 +1,40 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.latency import LatencyTracker
+
+# Import libraries
+import pytest
+
+
+def test_clockOffset():
+    tracker = LatencyTracker()
+    assert tracker.clockOffsetNs == None
+
+    # Exchange clock 5ms ahead, the shorter round trip wins
+    tracker.addClockSample(localSendNs=0, exchangeTimeNs=20_000_000, localReceiveNs=30_000_000)
+    tracker.addClockSample(localSendNs=100_000_000, exchangeTimeNs=106_000_000, localReceiveNs=102_000_000)
+    assert tracker.clockOffsetNs == 5_000_000
+
+
+def test_stats():
+    tracker = LatencyTracker(window=4)
+    tracker.addClockSample(localSendNs=0, exchangeTimeNs=1_000_000, localReceiveNs=0)
+
+    # Overflow the window, only the last four samples should be kept
+    for i in range(6):
+        tracker.record(
+            exchangeTimeNs=10_000_000,
+            receiveTimeNs=(12_000_000 + (i * 1_000_000)),
+            parseDurationNs=100_000,
+            handlerDurationNs=500_000)
+    
+    stats = tracker.stats()
+    assert stats.samples == 4
+    assert stats.clockOffsetMs == 1.0
+    assert stats.parse.p50 == pytest.approx(0.1)
+    assert stats.handler.max == pytest.approx(0.5)
+    # Receive times of 4..7ms past the event, shifted onto the exchange clock which runs 1ms ahead
+    assert stats.feed.max == pytest.approx(8.0)
+    assert stats.total.max == pytest.approx(8.6)
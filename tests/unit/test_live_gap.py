@@ -0,0 +1,119 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.clock import CachedExchangeClock
+from hermesConnector.models import ClockReturnModel
+
+# Import libraries
+import asyncio
+from datetime import datetime, timedelta, timezone
+from alpaca.data.models import Bar, BarSet
+
+from .conftest import T0, makeAlpaca
+
+
+def rawBar(minute, close=1.0):
+    return {"t": (T0 + timedelta(minutes=minute)).isoformat(), "o": 1.0, "h": 2.0, "l": 0.5, "c": close, "v": 10.0, "n": 1, "vw": 1.0}
+
+
+class StandInHistoricalClient:
+    # Serves minute bars of AAPL at the given minutes after T0, within the requested range
+    def __init__(self, minutes):
+        self.minutes = minutes
+        self.requests = []
+
+    def get_stock_bars(self, request):
+        self.requests.append(request)
+        # The request times are naive UTC
+        times = {minute: T0.replace(tzinfo=None) + timedelta(minutes=minute) for minute in self.minutes}
+        bars = [
+            rawBar(minute, close=float(minute)) for minute, time in times.items()
+            if (request.start <= time) and ((request.end == None) or (time <= request.end))]
+        return BarSet({"AAPL": bars})
+
+
+def makeConnector(minutes, interval="1m"):
+    errors = []
+    connector = makeAlpaca(interval=interval, errorHandler=errors.append)
+    connector.errors = errors
+    connector._historicalDataClient = StandInHistoricalClient(minutes)
+    received = []
+    connector.options.dataHandler = lambda data, closed: received.append(data)
+    return connector, received
+
+
+def sendBars(connector, *minutes):
+    # Sends the bars on one event loop, and waits for a recovery they started
+    async def send():
+        for minute in minutes:
+            await connector.wsHandlerInternal(Bar("AAPL", rawBar(minute, close=float(minute))))
+        if connector._gapRecovery != None:
+            await connector._gapRecovery
+    asyncio.run(send())
+
+
+def test_barsBetweenUseTheLiveBarPeriod():
+    # The live stream and the recovery both carry minute bars, whatever the interval of the connector
+    connector, received = makeConnector([1, 2], interval="1h")
+    columns = connector._barsBetween(0, int(T0.timestamp() * 1000) + (3 * 60_000))
+    assert list(columns["closeTime"] - columns["openTime"]) == [59_999, 59_999]
+
+    sendBars(connector, 0)
+    assert received[0].closeTime - received[0].openTime == 59_999
+
+
+def useEasternClock(connector):
+    eastern = timezone(timedelta(hours=-5))
+    clock = ClockReturnModel(isOpen=True, nextOpen=datetime(2025, 1, 3, 9, 30, tzinfo=eastern), nextClose=datetime(2025, 1, 2, 16, tzinfo=eastern), currentTimestamp=T0.astimezone(eastern))
+    connector._clockCache = CachedExchangeClock(fetch=lambda: clock, ttl=None)
+
+
+def test_missedBarsAreReplayedInOrder():
+    connector, received = makeConnector(range(12))
+    useEasternClock(connector)
+    sendBars(connector, 0, 1)
+    assert len(connector._historicalDataClient.requests) == 0
+
+    # Bars 2 to 8 were missed, only their range is requested. Bar 10 arrives during the recovery and waits for it
+    sendBars(connector, 9, 10)
+    request = connector._historicalDataClient.requests[0]
+    assert (request.start.minute, request.end.minute) == (2, 8)
+    assert [bar.closePrice for bar in received] == [float(minute) for minute in range(11)]
+
+
+def test_quietMinutesAreNotRecovered():
+    # No bars are published for the minutes without trades
+    connector, received = makeConnector([])
+    useEasternClock(connector)
+    sendBars(connector, 0, 3, 7)
+    assert len(connector._historicalDataClient.requests) == 0
+    assert [bar.closePrice for bar in received] == [0.0, 3.0, 7.0]
+
+
+def test_failedRecoveryStillDispatchesTheBar():
+    connector, received = makeConnector([])
+    useEasternClock(connector)
+
+    def failingRequest(request):
+        raise ConnectionError("Connection reset")
+    connector._historicalDataClient.get_stock_bars = failingRequest
+
+    sendBars(connector, 0, 10, 11)
+    assert [bar.closePrice for bar in received] == [0.0, 10.0, 11.0]
+    assert isinstance(connector.lastError, ConnectionError)
+    assert connector.errors == [connector.lastError]
+
+
+def test_noRecoveryAcrossTheClosedMarket():
+    connector, received = makeConnector([])
+    useEasternClock(connector)
+    # The last bar before the close of the previous day, 15:59 Eastern, then the open of this one, T0 being 10:00 Eastern
+    sendBars(connector, -(18 * 60) - 1, -30)
+    assert len(connector._historicalDataClient.requests) == 0
+    assert len(received) == 2
+
+    # Cryptocurrencies trade around the clock, their gaps are always recovered
+    connector.hasTradingSessions = lambda: False
+    sendBars(connector, 0)
+    assert len(connector._historicalDataClient.requests) == 1
@@ -0,0 +1,53 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.models import BaseOrderResult, LimitOrderResult, LiveMarketData
+from hermesConnector.models_utilities import setTrustedMode, trustedMode, typeAdapter
+from hermesConnector.hermes_enums import OrderSide, OrderStatus, OrderType, TimeInForce
+
+# Import libraries
+import pytest
+from datetime import datetime, timezone
+from pydantic import ValidationError
+
+
+NOW = datetime(2025, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+ORDER = dict(
+    order_id="id0", created_at=NOW, updated_at=NOW, submitted_at=NOW, filled_at=None, expired_at=None, expires_at=None, canceled_at=None, failed_at=None,
+    asset_id=None, symbol="AAPL", notional=None, qty=1.0, filled_qty=None, filled_avg_price=None,
+    type=OrderType.LIMIT, side=OrderSide.BUY, time_in_force=TimeInForce.DAY, status=OrderStatus.NEW, raw="{}")
+
+
+def test_trustedModelsMatchValidatedOnes():
+    validated = LimitOrderResult.fromExchange(False, **ORDER)
+    trusted = LimitOrderResult.fromExchange(True, **ORDER)
+    assert trusted == validated
+    assert (trusted.client_order_id, trusted.limit_price) == (None, None)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.model_copy(update={"qty": 2.0}).qty == 2.0
+
+    # Nothing is checked in trusted mode
+    bar = dict(openTime="1", openPrice=1.0, highPrice=1.0, lowPrice=1.0, closePrice=1.0, closeTime=2, volume=0.0)
+    assert LiveMarketData.fromExchange(True, **bar).openTime == "1"
+    assert LiveMarketData.fromExchange(False, **bar).openTime == 1
+
+
+def test_connectorSettingOverridesTheDefault():
+    assert trustedMode() == False
+    setTrustedMode(True)
+    try:
+        assert LiveMarketData.fromExchange(openTime="x", openPrice=1.0, highPrice=1.0, lowPrice=1.0, closePrice=1.0, closeTime=2, volume=0.0).openTime == "x"
+        with pytest.raises(ValidationError):
+            LiveMarketData.fromExchange(False, openTime="x", openPrice=1.0, highPrice=1.0, lowPrice=1.0, closePrice=1.0, closeTime=2, volume=0.0)
+    finally:
+        setTrustedMode(False)
+
+
+def test_typeAdaptersAreCached():
+    adapter = typeAdapter(list[BaseOrderResult])
+    assert typeAdapter(list[BaseOrderResult]) is adapter
+    row = BaseOrderResult(**ORDER).model_dump_json()
+    orders = adapter.validate_json(f"[{row},{row}]")
+    assert [order.order_id for order in orders] == ["id0", "id0"]
@@ -0,0 +1,114 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.order_book import LocalOrderBook
+from hermesConnector.connector_binance import Binance
+
+# Import libraries
+import json
+from binance.error import ServerError
+
+
+def test_levelsStaySortedWithBestFirst():
+    book = LocalOrderBook("BTCUSDT")
+    book.applySnapshot(10, bids=[["99", "1"], ["100", "2"], ["98", "0"]], asks=[["102", "1"], ["101", "3"]])
+    assert book.bid() == (100.0, 2.0)
+    assert book.ask() == (101.0, 3.0)
+    assert book.depth() == (2, 2)
+
+    assert book.applyUpdate(11, 12, bids=[["100", "0"], ["99.5", "4"]], asks=[["100.5", "1"], ["105", "0"]])
+    assert book.bid() == (99.5, 4.0)
+    assert book.bid(1) == (99.0, 1.0)
+    assert book.bid(2) == None
+    assert book.spread() == 1.0
+
+    top = book.snapshot(depth=2)
+    assert list(top["askPrice"]) == [100.5, 101.0]
+    assert list(top["bidSize"]) == [4.0, 1.0]
+
+
+def test_updatesAreSequencedAgainstTheSnapshot():
+    book = LocalOrderBook("BTCUSDT")
+    # Buffered until the snapshot arrives, the first one is already part of it
+    book.applyUpdate(5, 8, bids=[["1", "1"]], asks=[])
+    book.applyUpdate(9, 11, bids=[["2", "1"]], asks=[])
+    assert book.isSynced == False
+
+    assert book.applySnapshot(8, bids=[["0.5", "1"]], asks=[])
+    assert book.lastUpdateId == 11
+    assert book.depth() == (2, 0)
+
+    # A gap takes the book out of sync until the next snapshot
+    assert book.applyUpdate(13, 14, bids=[], asks=[["3", "1"]]) == False
+    assert (book.isSynced, book.resyncs) == (False, 1)
+    assert book.applySnapshot(10, bids=[], asks=[]) == False
+    assert book.applySnapshot(12, bids=[], asks=[])
+    assert (book.lastUpdateId, book.ask()) == (14, (3.0, 1.0))
+
+
+class FakeSpot:
+    # Serves the snapshots in order, raising the ones that are exceptions
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.requests = 0
+
+    def depth(self, symbol, limit=100):
+        self.requests += 1
+        snapshot = self.snapshots.pop(0)
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+
+class FakeWs:
+    def diff_book_depth(self, symbol, speed=1000):
+        pass
+
+
+def sendUpdate(binance, first, last, bids):
+    binance.depthHandlerInternal(None, json.dumps({"e": "depthUpdate", "s": "BTCUSDT", "U": first, "u": last, "b": bids, "a": []}))
+
+
+def test_binanceResyncsOnMissedUpdate():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    binance.clients["spot"] = FakeSpot([
+        {"lastUpdateId": 100, "bids": [["10", "1"]], "asks": [["11", "1"]]},
+        {"lastUpdateId": 200, "bids": [["9", "2"]], "asks": [["12", "2"]]}])
+    binance.clients["depthWs"] = FakeWs()
+    book = binance.trackOrderBook()
+    assert book.bid() == (10.0, 1.0)
+
+    sendUpdate(binance, 101, 101, [["10.5", "1"]])
+    assert book.bid() == (10.5, 1.0)
+    sendUpdate(binance, 150, 201, [["9.5", "1"]])
+    assert book.isSynced
+    assert (book.lastUpdateId, book.bid(), book.ask()) == (201, (9.5, 1.0), (12.0, 2.0))
+
+
+def test_binanceRetriesFailedSnapshotsWithBackoff():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    spot = FakeSpot([
+        ServerError(503, "Service Unavailable"),
+        ServerError(503, "Service Unavailable"),
+        {"lastUpdateId": 100, "bids": [["10", "1"]], "asks": [["11", "1"]]}])
+    binance.clients["spot"] = spot
+    binance.clients["depthWs"] = FakeWs()
+
+    # The first sync fails without raising, the updates are buffered until the retry is due
+    book = binance.trackOrderBook()
+    assert (book.isSynced, spot.requests) == (False, 1)
+    sendUpdate(binance, 99, 101, [["10.5", "1"]])
+    assert spot.requests == 1
+
+    # A failed retry from the stream handler doubles the backoff
+    binance._orderBookRetries["BTCUSDT"] = (0.0, binance._orderBookRetries["BTCUSDT"][1])
+    sendUpdate(binance, 102, 102, [["10.6", "1"]])
+    assert (book.isSynced, spot.requests) == (False, 2)
+    assert binance._orderBookRetries["BTCUSDT"][1] == 2 * binance._orderBookRetryDelay
+
+    binance._orderBookRetries["BTCUSDT"] = (0.0, binance._orderBookRetries["BTCUSDT"][1])
+    sendUpdate(binance, 103, 103, [["10.7", "1"]])
+    assert (book.isSynced, spot.requests, book.lastUpdateId) == (True, 3, 103)
+    assert book.bid() == (10.7, 1.0)
+    assert "BTCUSDT" not in binance._orderBookRetries
@@ -0,0 +1,122 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.connector_binance import Binance
+from hermesConnector.hermes_enums import OrderQueryStatus
+from hermesConnector.hermes_exceptions import UnexpectedOutputType
+
+# Import libraries
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from .conftest import T0, makeAlpaca, makeAlpacaOrder
+
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+class FakeSpot:
+    def __init__(self, orders):
+        self.orders = orders
+        self.requests = []
+
+    def get_orders(self, symbol, limit=500, orderId=None, startTime=None, endTime=None):
+        self.requests.append((orderId, startTime))
+        if startTime != None:
+            # Time windows are limited to 24 hours
+            assert endTime - startTime < DAY_MS
+            selected = [order for order in self.orders if startTime <= order["time"] <= endTime]
+        else:
+            selected = [order for order in self.orders if order["orderId"] >= orderId]
+        return selected[:limit]
+
+
+def makeOrders(n):
+    return [
+        {"orderId": 100 + i, "time": 1_000 * i, "status": ("NEW" if (i % 3 == 0) else "FILLED")}
+        for i in range(n)]
+
+
+def test_binanceWalksOrderIdCursor():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    spot = FakeSpot(makeOrders(25))
+    binance.clients["spot"] = spot
+
+    orders = list(binance.iterOrders(batchSize=10))
+    assert [order["orderId"] for order in orders] == list(range(100, 125))
+    assert spot.requests == [(0, None), (110, None), (120, None)]
+
+    # Bounded by time and filtered by status
+    start = datetime.fromtimestamp(5, tz=timezone.utc)
+    end = datetime.fromtimestamp(15, tz=timezone.utc)
+    openOrders = list(binance.iterOrders(start=start, end=end, status=OrderQueryStatus.OPEN, batchSize=4))
+    assert [order["orderId"] for order in openOrders] == [106, 109, 112, 115]
+
+
+def test_binanceWalksTimeWindowsToTheFirstOrder():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    # Five old orders, then one order every 10 hours, starting after two empty days
+    oldOrders = [{"orderId": 1 + i, "time": i, "status": "FILLED"} for i in range(5)]
+    orders = [{"orderId": 100 + i, "time": (2 * DAY_MS) + (i * 36_000_000), "status": "FILLED"} for i in range(12)]
+    spot = FakeSpot(oldOrders + orders)
+    binance.clients["spot"] = spot
+    start = datetime.fromtimestamp(1, tz=timezone.utc)
+
+    # The first page ends before the start time, a window holding fewer orders than a page does not end the history
+    returned = list(binance.iterOrders(start=start, batchSize=5))
+    assert [order["orderId"] for order in returned] == list(range(100, 112))
+    assert spot.requests == [(0, None), (None, 1_000), (None, 1_000 + DAY_MS), (100, None), (105, None), (110, None)]
+
+    # Past the last window, the cursor carries on from the first page
+    spot.requests = []
+    binance._maxOrderWindows = 1
+    returned = list(binance.iterOrders(start=start, batchSize=5))
+    assert [order["orderId"] for order in returned] == list(range(100, 112))
+    assert spot.requests == [(0, None), (None, 1_000), (6, None), (105, None), (110, None)]
+
+    # Bounded by an end time before the first order
+    binance._maxOrderWindows = 30
+    end = datetime.fromtimestamp(DAY_MS / 1000, tz=timezone.utc)
+    assert list(binance.iterOrders(start=start, end=end, batchSize=5)) == []
+
+
+class StandInTradingClient:
+    # Serves the orders in ascending order of submission, ties in a fixed order, `after` being exclusive
+    def __init__(self, orders):
+        self.orders = sorted(orders, key=lambda order: (order.submitted_at, str(order.id)))
+        self.limits = []
+
+    def get_orders(self, filter):
+        self.limits.append(filter.limit)
+        selected = [order for order in self.orders if (filter.after == None) or (order.submitted_at > filter.after)]
+        return selected[:filter.limit]
+
+
+def makeTiedOrders(n, groupSize):
+    # `n` orders, submitted in groups of `groupSize` sharing the same time
+    return [makeAlpacaOrder(str(uuid.UUID(int=i)), submitted=(T0 + timedelta(seconds=(i // groupSize)))) for i in range(n)]
+
+
+def test_alpacaReturnsTiesLargerThanAPage():
+    orders = makeTiedOrders(20, 3)
+    expected = sorted(str(order.id) for order in orders)
+    for batchSize in [1, 2, 3, 5]:
+        connector = makeAlpaca()
+        connector._tradingClient = StandInTradingClient(orders)
+        returned = [order.order_id for order in connector.iterOrders(batchSize=batchSize)]
+        assert returned == expected
+
+    # The pages are enlarged by the orders already returned at the boundary time
+    connector._tradingClient = StandInTradingClient(makeTiedOrders(4, 4))
+    assert len(list(connector.iterOrders(batchSize=1))) == 4
+    assert connector._tradingClient.limits == [1, 2, 3, 4, 5]
+
+
+def test_alpacaRejectsTiesLargerThanTheLargestPage():
+    connector = makeAlpaca()
+    connector._ordersPageLimit = 3
+    connector._tradingClient = StandInTradingClient(makeTiedOrders(5, 5))
+    with pytest.raises(UnexpectedOutputType):
+        list(connector.iterOrders(batchSize=2))
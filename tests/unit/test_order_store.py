@@ -0,0 +1,115 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.order_store import OrderStore
+from hermesConnector.hermes_enums import OrderStatus
+from hermesConnector.retry import RetryPolicy
+
+# Import libraries
+import time
+import uuid
+from datetime import timedelta
+
+from .conftest import T0, makeAlpaca, makeAlpacaOrder, makeOrder
+
+
+class FakeConnector:
+    def __init__(self, orders):
+        self.orders = orders
+        self.starts = []
+
+    def iterOrders(self, start=None, end=None, status=None, symbols=None, batchSize=500):
+        self.starts.append(start)
+        return iter([order for order in self.orders if (start == None) or (order.submitted_at > start)])
+
+
+def test_queriesAndNewerVersionsWin():
+    store = OrderStore()
+    store.upsert([makeOrder(i, status=OrderStatus.FILLED, symbol=("AAPL" if i % 2 == 0 else "MSFT")) for i in range(6)])
+    assert store.get("id3").symbol == "MSFT"
+    assert store.getByClientId("c4").order_id == "id4"
+    assert [o.order_id for o in store.query(symbols=["AAPL"], limit=2, newestFirst=True)] == ["id4", "id2"]
+    assert [o.order_id for o in store.query(start=T0 + timedelta(seconds=3))] == ["id4", "id5"]
+
+    # An older version never replaces a newer one
+    store.upsert([makeOrder(1, status=OrderStatus.CANCELED, updated=5)])
+    store.upsert([makeOrder(1, status=OrderStatus.NEW, updated=1)])
+    assert store.get("id1").status == OrderStatus.CANCELED
+
+
+def test_incrementalSyncReachesBackToOpenOrders():
+    FILLED = OrderStatus.FILLED
+    orders = [makeOrder(0, status=FILLED), makeOrder(1), makeOrder(2, status=FILLED)]
+    connector = FakeConnector(orders)
+    store = OrderStore()
+    assert store.isFresh(60) == False
+
+    assert store.sync(connector) == 3
+    assert store.isFresh(60)
+
+    # The open order changed and a new one arrived, the sync starts just before the open order
+    connector.orders = [makeOrder(1, status=FILLED, updated=10), makeOrder(2, status=FILLED), makeOrder(3, status=FILLED)]
+    store.sync(connector)
+    assert connector.starts[-1] == T0 + timedelta(seconds=1) - timedelta(microseconds=1)
+    assert store.get("id1").status == OrderStatus.FILLED
+    assert len(store.query()) == 4
+
+    store.sync(connector)
+    assert connector.starts[-1] == T0 + timedelta(seconds=3) - timedelta(microseconds=1)
+
+
+class StandInTradingClient:
+    def __init__(self, order):
+        self.order = order
+        self.canceled = []
+
+    def get_order_by_id(self, order_id):
+        return self.order
+
+    def cancel_order_by_id(self, order_id):
+        self.canceled.append(order_id)
+
+
+def test_cancelOrderChecksTheBroker():
+    orderId = str(uuid.UUID(int=1))
+    store = OrderStore()
+    store.sync(FakeConnector([makeOrder(0, order_id=orderId)]))
+    connector = makeAlpaca()
+    connector.attachOrderStore(store, maxStaleness=60, sync=False)
+    assert connector.queryOrder(orderId).status == OrderStatus.NEW
+
+    # The order was filled since the last sync, the stale stored order is not trusted for the cancellation
+    connector._tradingClient = StandInTradingClient(makeAlpacaOrder(orderId, status="filled", updated_at=T0 + timedelta(seconds=10)))
+    assert connector.cancelOrder(orderId) == False
+    assert connector._tradingClient.canceled == []
+    assert store.get(orderId).status == OrderStatus.FILLED
+
+    connector._tradingClient.order = makeAlpacaOrder(orderId, status="new", updated_at=T0 + timedelta(seconds=20))
+    assert connector.cancelOrder(orderId) == True
+    assert connector._tradingClient.canceled == [orderId]
+
+
+def test_hedgedQueriesRecordTheOrderOnce():
+    orderId = str(uuid.UUID(int=1))
+    connector = makeAlpaca(retryPolicy=RetryPolicy(hedgeAfter=0.02))
+    store = connector.attachOrderStore(OrderStore(), maxStaleness=0, sync=False)
+    upserts = []
+    upsert = store.upsert
+    store.upsert = lambda orders: upserts.append(orders) or upsert(orders)
+
+    # The first request stalls, so it is hedged, and both requests complete
+    client = StandInTradingClient(makeAlpacaOrder(orderId))
+    getOrder = client.get_order_by_id
+    requests = []
+    def slowFirst(order_id):
+        requests.append(order_id)
+        if len(requests) == 1:
+            time.sleep(0.1)
+        return getOrder(order_id)
+    client.get_order_by_id = slowFirst
+    connector._tradingClient = client
+
+    assert connector.queryOrder(orderId).order_id == orderId
+    time.sleep(0.15)
+    assert (len(requests), len(upserts)) == (2, 1)
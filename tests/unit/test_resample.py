@@ -0,0 +1,92 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.resample import resampleColumns
+from hermesConnector.timeframe import TimeFrame
+from hermesConnector.hermes_enums import TimeframeUnit
+from hermesConnector.hermes_exceptions import UnsupportedParameterValue
+
+# Import libraries
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+from alpaca.data.models import BarSet
+
+from .conftest import makeAlpaca
+
+
+MINUTE = 60_000
+
+def makeColumns(openTime):
+    n = len(openTime)
+    price = np.arange(n, dtype=np.float64)
+    return {
+        "openTime": np.asarray(openTime, dtype=np.int64),
+        "open": price,
+        "high": price + 0.5,
+        "low": price - 0.5,
+        "close": price + 0.25,
+        "volume": np.ones(n)}
+
+
+def test_utcAlignment():
+    # 09:58 to 10:07 UTC on the first day of the epoch
+    start = (9 * 60 + 58) * MINUTE
+    columns = makeColumns(start + np.arange(10) * MINUTE)
+    result = resampleColumns(columns, TimeFrame(1, TimeframeUnit.MINUTE), TimeFrame(5, TimeframeUnit.MINUTE))
+
+    assert list(result["openTime"]) == [(9 * 60 + 55) * MINUTE, 600 * MINUTE, 605 * MINUTE]
+    assert list(result["open"]) == [0, 2, 7]
+    assert list(result["close"]) == [1.25, 6.25, 9.25]
+    assert list(result["high"]) == [1.5, 6.5, 9.5]
+    assert list(result["low"]) == [-0.5, 1.5, 6.5]
+    assert list(result["volume"]) == [2, 5, 3]
+    assert list(result["closeTime"] - result["openTime"]) == [(5 * MINUTE) - 1] * 3
+
+
+def test_sessionAlignment():
+    # Two sessions opening at 13:30 UTC, a day apart
+    dayMs = 1440 * MINUTE
+    sessionOpen = 810 * MINUTE
+    openTime = np.concatenate([sessionOpen + np.arange(90) * MINUTE, dayMs + sessionOpen + np.arange(90) * MINUTE])
+    result = resampleColumns(makeColumns(openTime), TimeFrame(1, TimeframeUnit.MINUTE), TimeFrame(1, TimeframeUnit.HOUR), alignment="session")
+
+    assert list(result["openTime"]) == [sessionOpen, sessionOpen + 60 * MINUTE, dayMs + sessionOpen, dayMs + sessionOpen + 60 * MINUTE]
+    assert list(result["volume"]) == [60, 30, 60, 30]
+
+
+def test_weeklyAlignment():
+    # Daily bars from Thursday 1970-01-01, weeks start on Monday 1970-01-05
+    dayMs = 1440 * MINUTE
+    result = resampleColumns(makeColumns(np.arange(10) * dayMs), TimeFrame(1, TimeframeUnit.DAY), TimeFrame(1, TimeframeUnit.WEEK))
+    assert list(result["openTime"]) == [-3 * dayMs, 4 * dayMs]
+    assert list(result["volume"]) == [4, 6]
+
+
+def test_incompatibleTimeFrames():
+    with pytest.raises(UnsupportedParameterValue):
+        resampleColumns(makeColumns([0]), TimeFrame(2, TimeframeUnit.MINUTE), TimeFrame(5, TimeframeUnit.MINUTE))
+
+
+def test_alpacaMultiReturnsTheLatestCandlesticks():
+    connector = makeAlpaca(limit=10)
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    requests = []
+
+    def requestBars(symbols, timeframe, start, end=None, limit=None):
+        # Minute bars from the start of the request up to now, in ascending order
+        requests.append((start, limit))
+        count = int((now - start).total_seconds() // 60)
+        return BarSet({"AAPL": [
+            {"t": (now - timedelta(minutes=i)).isoformat(), "o": 1.0, "h": 2.0, "l": 0.5, "c": 1.0, "v": 10.0, "n": 1, "vw": 1.0} for i in range(count, -1, -1)]})
+    connector._requestBars = requestBars
+
+    frames = connector.historicDataMulti([TimeFrame.parse("1m"), TimeFrame.parse("5m"), TimeFrame.parse("1h")])
+    start, limit = requests[0]
+    assert (limit, now - start < timedelta(days=10)) == (None, True)
+
+    nowMs = int(now.timestamp() * 1000)
+    for timeframe, frame in frames.items():
+        assert len(frame) == 10
+        assert frame["openTime"].iloc[-1] == nowMs - (nowMs % timeframe.durationMs)
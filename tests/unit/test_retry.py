@@ -0,0 +1,65 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.retry import RetryPolicy, isTransientError
+from hermesConnector.hermes_exceptions import TooManyRequests, InsufficientParameters
+
+# Import libraries
+import time
+import threading
+import pytest
+
+
+def test_retryTransient():
+    policy = RetryPolicy(maxAttempts=3, baseDelay=0.001)
+    calls = []
+
+    def flaky():
+        calls.append(None)
+        if len(calls) < 3:
+            raise TooManyRequests
+        return "ok"
+    
+    assert policy.execute(flaky) == "ok"
+    assert len(calls) == 3
+
+
+def test_noRetryOnPermanentError():
+    policy = RetryPolicy(maxAttempts=5, baseDelay=0.001)
+    calls = []
+
+    def broken():
+        calls.append(None)
+        raise InsufficientParameters
+    
+    with pytest.raises(InsufficientParameters):
+        policy.execute(broken)
+    assert len(calls) == 1
+    assert isTransientError(InsufficientParameters()) == False
+
+
+def test_backoffBounds():
+    policy = RetryPolicy(baseDelay=0.1, maxDelay=0.5)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoffDelay(attempt) <= min(0.5, 0.1 * (2 ** (attempt - 1)))
+
+
+def test_hedgedRequest():
+    policy = RetryPolicy(hedgeAfter=0.02)
+    lock = threading.Lock()
+    calls = []
+
+    # The first request stalls, the hedged duplicate returns straight away
+    def slowFirst():
+        with lock:
+            calls.append(None)
+            index = len(calls)
+        if index == 1:
+            time.sleep(0.5)
+            return "primary"
+        return "hedge"
+    
+    start = time.perf_counter()
+    assert policy.execute(slowFirst) == "hedge"
+    assert (time.perf_counter() - start) < 0.4
@@ -0,0 +1,105 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.scheduler import LiveDataScheduler
+from hermesConnector.models import ClockReturnModel
+
+# Import libraries
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+
+class FakeConnector:
+    def __init__(self, openFor, sessions=True):
+        self.closeAt = datetime.now(timezone.utc) + timedelta(seconds=openFor)
+        self.sessions = sessions
+        self.events = []
+        self._stopped = threading.Event()
+
+    def exchangeClock(self, forceRefresh=False):
+        now = datetime.now(timezone.utc)
+        return ClockReturnModel(
+            isOpen=now < self.closeAt,
+            nextOpen=now + timedelta(days=1),
+            nextClose=self.closeAt if now < self.closeAt else now + timedelta(days=1, hours=6),
+            currentTimestamp=now)
+
+    def hasTradingSessions(self):
+        return self.sessions
+
+    def backfillLiveData(self):
+        self.events.append("backfill")
+        return 0
+
+    def initiateLiveData(self):
+        self.events.append("connect")
+        self._stopped.clear()
+        self._stopped.wait()
+
+    def stop(self):
+        self.events.append("disconnect")
+        self._stopped.set()
+
+
+def test_disconnectsAfterClose():
+    connector = FakeConnector(openFor=0.2)
+    scheduler = LiveDataScheduler(connector, postClose=0.1).start()
+    time.sleep(0.1)
+    assert scheduler.isConnected
+    time.sleep(0.4)
+    assert scheduler.isConnected == False
+    assert connector.events == ["backfill", "connect", "disconnect"]
+    scheduler.stop()
+
+
+def test_continuousTradingStaysConnected():
+    connector = FakeConnector(openFor=0, sessions=False)
+    scheduler = LiveDataScheduler(connector, backfill=False).start()
+    time.sleep(0.1)
+    assert scheduler.isConnected
+    scheduler.stop()
+    assert connector.events == ["connect", "disconnect"]
+
+
+def test_survivesAFailedClockRequest():
+    connector = FakeConnector(openFor=60)
+    exchangeClock = connector.exchangeClock
+    failures = []
+
+    def failingOnce(forceRefresh=False):
+        if len(failures) == 0:
+            failures.append(True)
+            raise ConnectionError("Connection reset")
+        return exchangeClock(forceRefresh)
+    connector.exchangeClock = failingOnce
+
+    scheduler = LiveDataScheduler(connector, recheckInterval=0.05).start()
+    time.sleep(0.2)
+    assert failures == [True]
+    assert scheduler.isConnected
+    assert isinstance(scheduler.lastError, ConnectionError)
+    scheduler.stop()
+    assert connector.events == ["backfill", "connect", "disconnect"]
+
+
+def test_reconnectsLiveDataThatStopped():
+    connector = FakeConnector(openFor=0, sessions=False)
+    initiateLiveData = connector.initiateLiveData
+
+    def raisingOnce():
+        if len(connector.events) == 0:
+            connector.events.append("failed")
+            raise PermissionError("auth failed")
+        initiateLiveData()
+    connector.initiateLiveData = raisingOnce
+
+    errors = []
+    scheduler = LiveDataScheduler(connector, backfill=False, reconnectDelay=0.05, onError=errors.append).start()
+    time.sleep(0.3)
+    assert scheduler.isConnected
+    assert isinstance(scheduler.lastError, PermissionError)
+    assert errors == [scheduler.lastError]
+    scheduler.stop()
+    assert connector.events == ["failed", "connect", "disconnect"]
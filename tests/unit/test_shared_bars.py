@@ -0,0 +1,66 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.shared_bars import SharedBarRing
+from hermesConnector.models import LiveMarketData
+
+# Import libraries
+import os
+import subprocess
+import sys
+import pytest
+
+
+def makeBar(openTime, close):
+    return LiveMarketData(
+        openTime=openTime,
+        openPrice=1.0,
+        highPrice=max(1.0, close),
+        lowPrice=min(1.0, close),
+        closePrice=close,
+        closeTime=(openTime + 59_999),
+        volume=10.0)
+
+
+@pytest.fixture
+def ring():
+    publisher = SharedBarRing.create(name=f"hermes_test_{os.getpid()}", capacity=4)
+    yield publisher
+    publisher.close()
+    publisher.unlink()
+
+
+def test_publishAndRead(ring: SharedBarRing):
+    reader = SharedBarRing.attach(ring.name)
+    assert reader.latest() == None
+    version = reader.version
+
+    ring.publish(makeBar(0, 1.5))
+    assert reader.waitForUpdate(version, timeout=1) > version
+
+    # Same open time revises the bar instead of appending
+    ring.publish(makeBar(0, 2.0))
+    assert reader.count == 1
+    assert reader.latest().closePrice == 2.0 # type: ignore
+
+    # Overflow the ring, the oldest bars are dropped and the order is kept
+    for i in range(1, 6):
+        ring.publish(makeBar(i * 60_000, float(i)))
+    data = reader.read()
+    assert list(data["openTime"]) == [120_000, 180_000, 240_000, 300_000]
+    assert list(reader.read(2)["close"]) == [4.0, 5.0]
+    reader.close()
+
+
+def test_readerProcessLeavesTheBlock(ring: SharedBarRing):
+    ring.publish(makeBar(0, 1.5))
+    script = f"from hermesConnector.shared_bars import SharedBarRing; reader = SharedBarRing.attach({ring.name!r}); print(reader.latest().closePrice); reader.close()"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30)
+    assert result.stdout.strip() == "1.5"
+    assert "leaked shared_memory" not in result.stderr
+
+    # The block outlives the reader process
+    reader = SharedBarRing.attach(ring.name)
+    assert reader.latest().closePrice == 1.5 # type: ignore
+    reader.close()
@@ -0,0 +1,41 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.stream_manager import AlpacaStreamManager
+
+# Import libraries
+import asyncio
+from datetime import datetime, timezone
+from alpaca.data.live import StockDataStream
+from alpaca.data.models.bars import Bar
+
+
+RAW_BAR = {"t": datetime(2025, 1, 2, 15, 0, tzinfo=timezone.utc), "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 10, "n": 1, "vw": 1}
+
+
+def test_routesBarsPerSymbol():
+    stream = StockDataStream(api_key="key", secret_key="secret")
+    manager = AlpacaStreamManager(stream)
+    received = []
+
+    def plainHandler(bar):
+        received.append(("plain", bar.symbol))
+
+    async def coroutineHandler(bar):
+        received.append(("coroutine", bar.symbol))
+
+    manager.subscribe(["AAPL", "MSFT"], plainHandler)
+    manager.subscribe("MSFT", coroutineHandler)
+    assert sorted(stream._handlers["bars"]) == ["AAPL", "MSFT"]
+
+    for symbol in ["AAPL", "MSFT", "TSLA"]:
+        asyncio.run(manager._route(Bar(symbol, RAW_BAR)))
+    assert received == [("plain", "AAPL"), ("plain", "MSFT"), ("coroutine", "MSFT")]
+
+    # The symbol stays subscribed until its last handler is gone
+    manager.unsubscribe("MSFT", plainHandler)
+    assert sorted(stream._handlers["bars"]) == ["AAPL", "MSFT"]
+    manager.unsubscribe(["AAPL", "MSFT"])
+    assert manager.symbols == []
+    assert len(stream._handlers["bars"]) == 0
@@ -0,0 +1,51 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.tick_buffers import QuoteBuffer, TradeBuffer
+from hermesConnector.connector_binance import Binance
+
+# Import libraries
+import json
+
+
+def test_tradesAreDeliveredInFullBatches():
+    batches = []
+    buffer = TradeBuffer(handler=lambda batch: batches.append({k: v.copy() for k, v in batch.items()}), batchSize=4, maxDelay=None)
+    for i in range(10):
+        buffer.append(i * 1_000, 100.0 + i, 1.0)
+
+    assert [list(batch["time"]) for batch in batches] == [[0, 1_000, 2_000, 3_000], [4_000, 5_000, 6_000, 7_000]]
+    assert batches[1]["price"].dtype.name == "float64"
+    assert buffer.pending == 2
+
+    buffer.flush()
+    assert list(batches[-1]["price"]) == [108.0, 109.0]
+    assert (buffer.pending, buffer.ticks, buffer.batches) == (0, 10, 3)
+
+
+def test_batchesAreReusedAndBoundedByDelay():
+    views = []
+    buffer = QuoteBuffer(handler=views.append, batchSize=64, maxDelay=0.0)
+    buffer.append(1, 99.0, 2.0, 101.0, 3.0)
+    buffer.append(2, 99.5, 1.0, 100.5, 1.0)
+
+    # Every quote is delivered right away, through views of the same preallocated columns
+    assert len(views) == 2
+    assert views[0]["bidPrice"].base is views[1]["bidPrice"].base
+    assert list(views[1]["askPrice"]) == [100.5]
+
+
+def test_binanceTickStreamFillsBuffers():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"])
+    trades, quotes = [], []
+    binance._tradeBuffers = (TradeBuffer(handler=lambda batch: trades.append(batch["price"].copy()), batchSize=2, maxDelay=None),)
+    binance._quoteBuffers = (QuoteBuffer(handler=lambda batch: quotes.append(batch["askSize"].copy()), batchSize=1, maxDelay=None),)
+
+    for i in range(2):
+        binance.tickHandlerInternal(None, json.dumps({"e": "trade", "T": 1_700_000_000_000 + i, "p": f"{100 + i}.5", "q": "0.1"}))
+    binance.tickHandlerInternal(None, json.dumps({"u": 1, "s": "BTCUSDT", "b": "99", "B": "1", "a": "101", "A": "2.5"}))
+    binance.tickHandlerInternal(None, json.dumps({"result": None, "id": 1}))
+
+    assert [list(batch) for batch in trades] == [[100.5, 101.5]]
+    assert [list(batch) for batch in quotes] == [[2.5]]
@@ -0,0 +1,46 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.timeframe import TimeFrame
+from hermesConnector.connector_template import ConnectorOptions
+from hermesConnector.hermes_enums import TimeframeUnit
+from hermesConnector.hermes_exceptions import UnsupportedParameterValue
+
+# Import libraries
+import pickle
+import pytest
+
+
+def test_parseAndDurations():
+    tf = TimeFrame.parse("15m")
+    assert tf == TimeFrame(15, TimeframeUnit.MINUTE)
+    assert tf.durationMs == 900_000
+    assert tf.durationNs == 900_000_000_000
+    assert TimeFrame.parse("1 Week").durationMs == 604_800_000
+    assert str(TimeFrame.parse("4H")) == "4h"
+
+    for value in ["1M", "0h", "h", "1y"]:
+        with pytest.raises(UnsupportedParameterValue):
+            TimeFrame.parse(value)
+
+
+def test_valueSemantics():
+    tf = TimeFrame(1, TimeframeUnit.HOUR)
+    assert tf.closeTime(3_600_000) == 7_199_999
+    assert {tf: 1}[TimeFrame.parse("1h")] == 1
+    assert pickle.loads(pickle.dumps(tf)) == tf
+    with pytest.raises(AttributeError):
+        tf._durationMs = 0
+
+
+def test_connectorOptionsParsesInterval():
+    options = ConnectorOptions(
+        tradingPair="AAPL",
+        interval="1d",
+        limit=10,
+        mode="test",
+        columns=None,
+        dataHandler=None,
+        credentials=["", ""])
+    assert options.interval == TimeFrame(1, TimeframeUnit.DAY)
@@ -0,0 +1,103 @@
+# Hermes Test Scripts
+# By Anas Arkawi, 2025.
+
+# Import Hermes Library
+from hermesConnector.trading_constraints import ConstraintsCache, applyConstraints
+from hermesConnector.connector_binance import Binance
+from hermesConnector.models import TradingConstraintsModel
+from hermesConnector.hermes_enums import OrderSide, TimeInForce
+from hermesConnector.hermes_exceptions import OrderViolatesConstraints
+
+# Import libraries
+import pytest
+
+
+CRYPTO = TradingConstraintsModel(symbol="BTC/USD", tradable=True, fractionable=True, minQty=0.0001, qtyStep=0.0001, priceStep=0.5, minNotional=10.0)
+STOCK = TradingConstraintsModel(symbol="AAPL", tradable=True, fractionable=False, priceStep=0.01, subDollarPriceStep=0.0001, fractionalTimeInForce=[TimeInForce.DAY])
+
+
+def test_rejectAndRound():
+    # Valid orders pass unchanged, float representation errors included
+    assert applyConstraints(CRYPTO, "reject", OrderSide.BUY, TimeInForce.GTC, qty=0.0003, limitPrice=60_000.5) == (0.0003, None, 60_000.5)
+
+    with pytest.raises(OrderViolatesConstraints):
+        applyConstraints(CRYPTO, "reject", OrderSide.BUY, TimeInForce.GTC, qty=0.00015, limitPrice=60_000.0)
+    # Quantities are rounded down, buy prices down and sell prices up
+    assert applyConstraints(CRYPTO, "round", OrderSide.BUY, TimeInForce.GTC, qty=0.00039, limitPrice=60_000.3) == (0.0003, None, 60_000.0)
+    assert applyConstraints(CRYPTO, "round", OrderSide.SELL, TimeInForce.GTC, qty=0.00039, limitPrice=60_000.3) == (0.0003, None, 60_000.5)
+
+    # What rounding cannot fix is rejected in either mode
+    for mode in ["reject", "round"]:
+        with pytest.raises(OrderViolatesConstraints):
+            applyConstraints(CRYPTO, mode, OrderSide.BUY, TimeInForce.GTC, qty=0.00009) # type: ignore
+        with pytest.raises(OrderViolatesConstraints):
+            applyConstraints(CRYPTO, mode, OrderSide.BUY, TimeInForce.GTC, qty=0.0001, limitPrice=50_000.0) # type: ignore
+    assert applyConstraints(CRYPTO, "off", OrderSide.BUY, TimeInForce.GTC, qty=0.00009) == (0.00009, None, None)
+
+    with pytest.raises(OrderViolatesConstraints):
+        applyConstraints(CRYPTO.model_copy(update={"tradable": False}), "round", OrderSide.BUY, TimeInForce.GTC, qty=1.0)
+
+
+def test_stockRules():
+    assert applyConstraints(STOCK, "round", OrderSide.BUY, TimeInForce.GTC, qty=2.7, limitPrice=0.12345) == (2.0, None, 0.1234)
+    assert applyConstraints(STOCK, "round", OrderSide.BUY, TimeInForce.GTC, qty=1.0, limitPrice=101.257) == (1.0, None, 101.25)
+    with pytest.raises(OrderViolatesConstraints):
+        applyConstraints(STOCK, "reject", OrderSide.BUY, TimeInForce.GTC, qty=1.0, limitPrice=101.257)
+    with pytest.raises(OrderViolatesConstraints):
+        applyConstraints(STOCK, "round", OrderSide.BUY, TimeInForce.DAY, cost=100.0)
+
+    # Fractional orders only as day orders
+    fractionable = STOCK.model_copy(update={"fractionable": True})
+    assert applyConstraints(fractionable, "reject", OrderSide.BUY, TimeInForce.DAY, qty=0.5) == (0.5, None, None)
+    with pytest.raises(OrderViolatesConstraints):
+        applyConstraints(fractionable, "reject", OrderSide.BUY, TimeInForce.GTC, cost=100.0)
+
+
+def test_cacheExpiry():
+    loads = []
+    cache = ConstraintsCache(loader=lambda symbol: loads.append(symbol) or CRYPTO.model_copy(update={"symbol": symbol}), ttl=None)
+    cache.put(STOCK)
+    assert cache.get("AAPL") is STOCK
+    assert cache.get("ETH/USD").symbol == "ETH/USD"
+    cache.get("ETH/USD")
+    assert loads == ["ETH/USD"]
+    cache.invalidate("AAPL")
+    cache.get("AAPL")
+    assert loads == ["ETH/USD", "AAPL"]
+
+    expiring = ConstraintsCache(loader=lambda symbol: loads.append(symbol) or CRYPTO, ttl=0.0)
+    expiring.get("BTC/USD")
+    expiring.get("BTC/USD")
+    assert loads[-2:] == ["BTC/USD", "BTC/USD"]
+
+
+class FakeSpot:
+    def __init__(self):
+        self.orders = []
+
+    def exchange_info(self, symbol):
+        return {"symbols": [{
+            "symbol": symbol,
+            "status": "TRADING",
+            "isSpotTradingAllowed": True,
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
+                {"filterType": "LOT_SIZE", "minQty": "0.00001000", "maxQty": "9000.00000000", "stepSize": "0.00001000"},
+                {"filterType": "NOTIONAL", "minNotional": "5.00000000", "applyMinToMarket": True, "maxNotional": "9000000.00000000"},
+                {"filterType": "ICEBERG_PARTS", "limit": 10}]}]}
+
+    def new_order(self, **params):
+        self.orders.append(params)
+        return params
+
+
+def test_binanceFilters():
+    binance = Binance(mode="test", tradingPair="BTCUSDT", interval="1h", credentials=["key", "secret"], orderConstraints="round")
+    binance.clients["spot"] = FakeSpot()
+    constraints = binance.tradingConstraints()
+    assert (constraints.qtyStep, constraints.priceStep, constraints.minNotional) == (0.00001, 0.01, 5.0)
+
+    order = binance.buyLimit(0.123456789, 50_000.019)
+    assert (order["quantity"], order["price"]) == (0.12345, 50_000.01)
+    with pytest.raises(OrderViolatesConstraints):
+        binance.buyLimit(0.00001, 50_000.0)